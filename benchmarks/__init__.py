@@ -0,0 +1,10 @@
+# ─── Benchmark Package Initialisation ────────────────────────────────────────
+
+"""
+Performance benchmarks for MDR Letters Processing System
+
+This package generates synthetic Mishcon de Reya letters and times each
+stage of the processing workflow against them.
+"""
+
+__version__ = "1.0.0"
\ No newline at end of file
@@ -0,0 +1,89 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import random
+from datetime import date, timedelta
+from typing import List, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.config import POSTAL_CODES, RECIPIENT_ROUTING_RULES
+from mdr_letters.pdf_utils import load_fitz
+
+# ─── Synthetic Letter Content ────────────────────────────────────────────────
+
+LETTERHEAD_LINES = [
+    "Mishcon de Reya LLP",
+    "Africa House",
+    "70 Kingsway",
+    "London WC2B 6AH",
+    "DX 37954 Kingsway"
+]
+
+ADDRESS_LINES = {
+    "W6_0XE": ["Mr Kambiz Babaee", "Hammersmith", "London"],
+    "HA0_2NJ": ["Mr Bhupen Varsani", "Wembley", "Middlesex"],
+    "M20_6RE": ["Fortis Insolvency", "Didsbury", "Manchester"],
+    "EC4A_1NL": ["London Circuit Commercial Court", "Rolls Building", "Fetter Lane"],
+    "EC2V_7HN": ["Lloyds Banking Group", "Gresham Street", "London"]
+}
+
+BODY_PARAGRAPH = (
+    "We write further to our previous correspondence in relation to the above matter. "
+    "Our client reserves all of its rights in this regard and we look forward to hearing "
+    "from you within fourteen days of the date of this letter."
+)
+
+PAGE_COUNT_WEIGHTS = [(1, 50), (2, 25), (3, 10), (8, 10), (40, 5)]
+
+DATE_FORMATS = ["{day} {month} {year}", "{day:02d} {month} {year}"]
+
+# ─── Letter Specification ────────────────────────────────────────────────────
+
+def format_letter_date(letter_date: date, date_format: str) -> str:
+    return date_format.format(day=letter_date.day, month=letter_date.strftime("%B"), year=letter_date.year)
+
+def choose_page_count(random_source: random.Random) -> int:
+    page_counts, weights = zip(*PAGE_COUNT_WEIGHTS)
+    return random_source.choices(page_counts, weights=weights)[0]
+
+def build_letter_pages(random_source: random.Random) -> List[str]:
+    postal_keys = list(random_source.choice(RECIPIENT_ROUTING_RULES + [{"postal_codes": []}])["postal_codes"])
+    letter_date = date(2023, 1, 1) + timedelta(days=random_source.randrange(3 * 365))
+    date_format = random_source.choice(DATE_FORMATS)
+
+    first_page_lines = list(LETTERHEAD_LINES) + [""]
+    for postal_key in postal_keys:
+        first_page_lines.extend(ADDRESS_LINES[postal_key] + [POSTAL_CODES[postal_key], ""])
+    first_page_lines.extend([format_letter_date(letter_date, date_format), "", "Dear Sirs,", "", BODY_PARAGRAPH])
+
+    pages = ["\n".join(first_page_lines)]
+    for page_number in range(2, choose_page_count(random_source) + 1):
+        pages.append(f"Exhibit page {page_number}\n\n" + "\n".join([BODY_PARAGRAPH] * 6))
+    return pages
+
+# ─── Write Synthetic PDF Corpus ──────────────────────────────────────────────
+
+def write_letter_pdf(pdf_file_path: str, pages: List[str]) -> None:
+    fitz = load_fitz()
+    pdf_document = fitz.open()
+    for page_text in pages:
+        pdf_page = pdf_document.new_page()
+        pdf_page.insert_textbox(fitz.Rect(56, 56, 540, 800), page_text, fontsize=10)
+    pdf_document.set_metadata({"title": "Letter", "author": "Mishcon de Reya LLP", "producer": "Benchmark", "creator": "Benchmark"})
+    pdf_document.save(pdf_file_path)
+    pdf_document.close()
+
+def generate_corpus(input_directory: str, document_count: int, seed: int = 17) -> Tuple[List[str], int]:
+    random_source = random.Random(seed)
+    os.makedirs(input_directory, exist_ok=True)
+
+    pdf_file_paths = []
+    total_pages = 0
+    for letter_index in range(document_count):
+        pdf_file_path = os.path.join(input_directory, f"letter_{letter_index:05d}.pdf")
+        letter_pages = build_letter_pages(random_source)
+        write_letter_pdf(pdf_file_path, letter_pages)
+        pdf_file_paths.append(pdf_file_path)
+        total_pages += len(letter_pages)
+    return pdf_file_paths, total_pages
\ No newline at end of file
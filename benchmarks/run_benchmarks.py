@@ -0,0 +1,211 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters import __version__
+from mdr_letters.config import BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY
+from mdr_letters.directory_index import DirectoryIndex
+from mdr_letters.document_processor import DocumentProcessor
+from mdr_letters.extraction_cache import ExtractionCache
+from mdr_letters.fingerprint import FingerprintIndex, fingerprint_text
+from mdr_letters.search_index import SearchIndex
+from mdr_letters.pdf_utils import PDFUtils
+from benchmarks.corpus_generator import generate_corpus
+
+# ─── Benchmark Defaults ──────────────────────────────────────────────────────
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_MAX_REGRESSION = 1.25
+
+# ─── Stage Timing ────────────────────────────────────────────────────────────
+
+def time_stage(
+    stage_timings: Dict[str, Dict[str, float]],
+    stage_name: str,
+    document_count: int,
+    stage_function: Callable[[], Any]
+) -> Any:
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    stage_result = stage_function()
+    wall_seconds = time.perf_counter() - wall_start
+    cpu_seconds = time.process_time() - cpu_start
+
+    stage_timings[stage_name] = {
+        "wall_seconds": round(wall_seconds, 6),
+        "cpu_seconds": round(cpu_seconds, 6),
+        "per_document_ms": round(wall_seconds * 1000 / max(document_count, 1), 4)
+    }
+    logging.info("%-40s %10.3fs wall %10.3fs cpu", stage_name, wall_seconds, cpu_seconds)
+    return stage_result
+
+# ─── Single Corpus Size Run ──────────────────────────────────────────────────
+
+def run_benchmark(document_count: int, work_directory: str, seed: int) -> Dict[str, Any]:
+    stage_timings: Dict[str, Dict[str, float]] = {}
+    input_directory = os.path.join(work_directory, "input")
+    output_roots = {
+        BHUPEN_DIRECTORY: os.path.join(work_directory, "Bhupen Varsani"),
+        KAMBIZ_DIRECTORY: os.path.join(work_directory, "Kambiz Babaee")
+    }
+
+    pdf_file_paths, total_pages = time_stage(
+        stage_timings, "generate_corpus", document_count,
+        lambda: generate_corpus(input_directory, document_count, seed)
+    )
+
+    directory_index = DirectoryIndex(os.path.join(work_directory, "directory_index.sqlite3"))
+    extraction_cache = ExtractionCache(os.path.join(work_directory, "extraction_cache.sqlite3"))
+    search_index = SearchIndex(os.path.join(work_directory, "search_index.sqlite3"))
+    fingerprint_index = FingerprintIndex(os.path.join(work_directory, "fingerprint_index.sqlite3"))
+    document_processor = DocumentProcessor(
+        extraction_cache=extraction_cache,
+        directory_index=directory_index,
+        search_index=search_index,
+        fingerprint_index=fingerprint_index
+    )
+    uncached_pdf_utils = PDFUtils()
+
+    # ─── Ingestion Stages ────────────────────────────────────────────────────
+
+    document_texts = time_stage(
+        stage_timings, "load_pdf_text", document_count,
+        lambda: [uncached_pdf_utils.load_pdf_text(pdf_file_path) for pdf_file_path in pdf_file_paths]
+    )
+    analyses = time_stage(
+        stage_timings, "analyze_document", document_count,
+        lambda: [document_processor.recipient_detector.analyze_document(document_text) for document_text in document_texts]
+    )
+    time_stage(
+        stage_timings, "fingerprint_text", document_count,
+        lambda: [fingerprint_text(document_text) for document_text in document_texts]
+    )
+
+    def distribute_all() -> None:
+        for pdf_file_path, (recipient_name, destination_directories, formatted_date, year) in zip(pdf_file_paths, analyses):
+            document_processor.rename_and_distribute(
+                pdf_file_path, recipient_name, formatted_date, year,
+                [output_roots[destination_directory] for destination_directory in destination_directories]
+            )
+
+    time_stage(stage_timings, "rename_and_distribute", document_count, distribute_all)
+
+    # ─── Organisation Stages, Cold then Warm ─────────────────────────────────
+
+    for run_label in ("", "_warm"):
+        time_stage(
+            stage_timings, f"directory_index_refresh{run_label}", document_count,
+            lambda: [directory_index.refresh(output_root) for output_root in output_roots.values()]
+        )
+        time_stage(
+            stage_timings, f"process_directory_with_subfolders{run_label}", document_count,
+            lambda: [document_processor.file_manager.process_directory_with_subfolders(output_root) for output_root in output_roots.values()]
+        )
+        time_stage(
+            stage_timings, f"update_pdf_metadata{run_label}", document_count,
+            lambda: [document_processor.pdf_utils.update_pdf_metadata(output_root) for output_root in output_roots.values()]
+        )
+
+    directory_index.close()
+    extraction_cache.close()
+    search_index.close()
+    fingerprint_index.close()
+    return {"documents": document_count, "pages": total_pages, "stages": stage_timings}
+
+# ─── Baseline Comparison ─────────────────────────────────────────────────────
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    baseline_results = {result["documents"]: result["stages"] for result in baseline.get("results", [])}
+    regressions = []
+
+    for result in report["results"]:
+        baseline_stages = baseline_results.get(result["documents"], {})
+        for stage_name, stage_timing in result["stages"].items():
+            baseline_timing = baseline_stages.get(stage_name)
+            if not baseline_timing or baseline_timing["wall_seconds"] <= 0:
+                continue
+
+            ratio = stage_timing["wall_seconds"] / baseline_timing["wall_seconds"]
+            logging.info("%6d docs %-40s x%.2f vs baseline", result["documents"], stage_name, ratio)
+            if ratio > max_regression:
+                regressions.append(f"{stage_name} @ {result['documents']} docs: x{ratio:.2f}")
+
+    return regressions
+
+# ─── Command Line Arguments ──────────────────────────────────────────────────
+
+def parse_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="MDR Letters stage benchmarks")
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Corpus sizes to benchmark")
+    argument_parser.add_argument("--seed", type=int, default=17, help="Random seed for the synthetic corpus")
+    argument_parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    argument_parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    argument_parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Fail when a stage is slower than the baseline by more than this factor"
+    )
+    argument_parser.add_argument("--keep", action="store_true", help="Keep the generated work directories")
+    return argument_parser.parse_args()
+
+# ─── Script Entry Point ──────────────────────────────────────────────────────
+
+def main() -> int:
+    arguments = parse_arguments()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for package_logger in ("mdr_letters", "mdr_letters.document_processor"):
+        logging.getLogger(package_logger).setLevel(logging.WARNING)
+
+    report: Dict[str, Any] = {
+        "package_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "seed": arguments.seed,
+        "results": []
+    }
+
+    for document_count in arguments.sizes:
+        work_directory = tempfile.mkdtemp(prefix=f"mdr_bench_{document_count}_")
+        logging.info("Benchmarking %d documents in %s", document_count, work_directory)
+        try:
+            report["results"].append(run_benchmark(document_count, work_directory, arguments.seed))
+        finally:
+            if not arguments.keep:
+                shutil.rmtree(work_directory, ignore_errors=True)
+
+    report_json = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(report_json)
+    else:
+        print(report_json)
+
+    if arguments.baseline:
+        with open(arguments.baseline, 'r', encoding='utf-8') as baseline_file:
+            regressions = compare_with_baseline(report, json.load(baseline_file), arguments.max_regression)
+        for regression in regressions:
+            logging.error("Regression: %s", regression)
+        if regressions:
+            return 1
+
+    return 0
+
+# ─── Execute Script ──────────────────────────────────────────────────────────
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,147 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters import __version__
+
+# ─── Startup Scenarios & Budgets ─────────────────────────────────────────────
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP_SCENARIOS = {
+    "import_package": ["-c", "import mdr_letters"],
+    "import_config": ["-c", "import mdr_letters.config"],
+    "import_document_processor": ["-c", "import mdr_letters.document_processor"],
+    "cli_help": [os.path.join(PROJECT_ROOT, "mdr_letters_main.py"), "--help"]
+}
+
+STARTUP_BUDGETS_MS = {
+    "import_package": 250.0,
+    "import_config": 250.0,
+    "import_document_processor": 250.0,
+    "cli_help": 300.0
+}
+
+DEFERRED_MODULES = {
+    "import_package": ["fitz", "pymupdf", "watchdog"],
+    "import_config": ["fitz", "pymupdf", "watchdog"],
+    "import_document_processor": ["fitz", "pymupdf", "watchdog"]
+}
+
+DEFAULT_REPEATS = 7
+
+# ─── Time a Fresh Interpreter ────────────────────────────────────────────────
+
+def time_interpreter(interpreter_arguments: List[str]) -> float:
+    wall_start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *interpreter_arguments], cwd=PROJECT_ROOT, check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return (time.perf_counter() - wall_start) * 1000
+
+def median_startup_ms(interpreter_arguments: List[str], repeats: int) -> float:
+    return statistics.median(time_interpreter(interpreter_arguments) for _ in range(repeats))
+
+def loaded_deferred_modules(scenario_name: str) -> List[str]:
+    deferred_modules = DEFERRED_MODULES.get(scenario_name)
+    if not deferred_modules:
+        return []
+
+    import_statement = STARTUP_SCENARIOS[scenario_name][1]
+    check_code = f"{import_statement}; import sys, json; print(json.dumps([m for m in {deferred_modules!r} if m in sys.modules]))"
+    completed_check = subprocess.run(
+        [sys.executable, "-c", check_code], cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+    )
+    return json.loads(completed_check.stdout)
+
+# ─── Run All Scenarios ───────────────────────────────────────────────────────
+
+def run_startup_benchmark(repeats: int, budget_scale: float) -> Dict[str, Any]:
+    interpreter_ms = median_startup_ms(["-c", "pass"], repeats)
+    logging.info("%-30s %8.1f ms", "bare_interpreter", interpreter_ms)
+
+    scenario_results: Dict[str, Dict[str, Any]] = {}
+    for scenario_name, interpreter_arguments in STARTUP_SCENARIOS.items():
+        total_ms = median_startup_ms(interpreter_arguments, repeats)
+        overhead_ms = max(total_ms - interpreter_ms, 0.0)
+        budget_ms = STARTUP_BUDGETS_MS[scenario_name] * budget_scale
+
+        scenario_results[scenario_name] = {
+            "total_ms": round(total_ms, 2),
+            "overhead_ms": round(overhead_ms, 2),
+            "budget_ms": round(budget_ms, 2),
+            "loaded_deferred_modules": loaded_deferred_modules(scenario_name)
+        }
+        logging.info("%-30s %8.1f ms (+%.1f ms, budget %.0f ms)", scenario_name, total_ms, overhead_ms, budget_ms)
+
+    return {"bare_interpreter_ms": round(interpreter_ms, 2), "scenarios": scenario_results}
+
+def find_budget_violations(startup_results: Dict[str, Any]) -> List[str]:
+    violations = []
+    for scenario_name, scenario_result in startup_results["scenarios"].items():
+        if scenario_result["overhead_ms"] > scenario_result["budget_ms"]:
+            violations.append(
+                f"{scenario_name}: {scenario_result['overhead_ms']:.1f} ms over a {scenario_result['budget_ms']:.0f} ms budget"
+            )
+        for module_name in scenario_result["loaded_deferred_modules"]:
+            violations.append(f"{scenario_name}: imports {module_name} eagerly")
+    return violations
+
+# ─── Command Line Arguments ──────────────────────────────────────────────────
+
+def parse_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="MDR Letters cold-start benchmark")
+    argument_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Fresh interpreters per scenario")
+    argument_parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    argument_parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every startup budget by this factor (for slower machines)"
+    )
+    return argument_parser.parse_args()
+
+# ─── Script Entry Point ──────────────────────────────────────────────────────
+
+def main() -> int:
+    arguments = parse_arguments()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    report: Dict[str, Any] = {
+        "package_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "repeats": arguments.repeats,
+        **run_startup_benchmark(arguments.repeats, arguments.budget_scale)
+    }
+
+    report_json = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(report_json)
+    else:
+        print(report_json)
+
+    violations = find_budget_violations(report)
+    for violation in violations:
+        logging.error("Startup budget exceeded - %s", violation)
+    return 1 if violations else 0
+
+# ─── Execute Script ──────────────────────────────────────────────────────────
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
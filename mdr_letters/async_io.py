@@ -0,0 +1,49 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import asyncio
+import logging
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import FILE_IO_CONCURRENCY
+
+# ─── Bounded Concurrent Filesystem Operations ────────────────────────────────
+
+class AsyncFileOperations:
+
+    # ─── Initialize Async File Operations ────────────────────────────────────
+
+    def __init__(self, max_concurrency: int = FILE_IO_CONCURRENCY):
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency = max(1, max_concurrency)
+
+    # ─── Coroutine Layer ─────────────────────────────────────────────────────
+
+    async def run_bounded(self, semaphore: asyncio.Semaphore, function: Callable[..., Any], *arguments: Any) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(function, *arguments)
+
+    async def gather_bounded(self, calls: Sequence[Tuple[Callable[..., Any], Tuple[Any, ...]]]) -> List[Any]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(
+            *(self.run_bounded(semaphore, function, *arguments) for function, arguments in calls),
+            return_exceptions=True
+        )
+
+    # ─── Blocking Entry Points ───────────────────────────────────────────────
+
+    def run_all(self, calls: Sequence[Tuple[Callable[..., Any], Tuple[Any, ...]]]) -> List[Any]:
+        if len(calls) <= 1 or self.max_concurrency == 1:
+            results: List[Any] = []
+            for function, arguments in calls:
+                try:
+                    results.append(function(*arguments))
+                except Exception as call_error:
+                    results.append(call_error)
+            return results
+
+        return asyncio.run(self.gather_bounded(calls))
+
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        return self.run_all([(function, (item,)) for item in items])
\ No newline at end of file
@@ -0,0 +1,264 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import json
+import queue
+import shutil
+import hashlib
+import logging
+import zipfile
+import threading
+from typing import Dict, Iterator, List, Set, Tuple, Union
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import (
+    BACKFILL_QUEUE_SIZE,
+    BACKFILL_BATCH_SIZE,
+    BACKFILL_STAGING_DIRECTORY,
+    BACKFILL_CHECKPOINT_DIRECTORY
+)
+from .document_processor import DocumentProcessor
+
+# ─── Append-Only Backfill Checkpoint ─────────────────────────────────────────
+
+class BackfillCheckpoint:
+
+    def __init__(self, source_path: str, checkpoint_directory: str = str(BACKFILL_CHECKPOINT_DIRECTORY)):
+        self.logger = logging.getLogger(__name__)
+        source_key = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:16]
+        self.checkpoint_path = os.path.join(checkpoint_directory, f"{source_key}.checkpoint")
+        os.makedirs(checkpoint_directory, exist_ok=True)
+
+    def load(self) -> Tuple[Dict[str, str], Set[str]]:
+        entry_statuses: Dict[str, str] = {}
+        affected_folders: Set[str] = set()
+        if not os.path.exists(self.checkpoint_path):
+            return entry_statuses, affected_folders
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    batch_record = json.loads(line)
+                except ValueError:
+                    self.logger.warning("Ignoring incomplete checkpoint line in %s", self.checkpoint_path)
+                    continue
+                entry_statuses.update(batch_record["entries"])
+                affected_folders.update(batch_record["folders"])
+        return entry_statuses, affected_folders
+
+    def record_batch(self, entry_statuses: Dict[str, str], affected_folders: List[str]) -> None:
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as checkpoint_file:
+            checkpoint_file.write(json.dumps({"entries": entry_statuses, "folders": affected_folders}, ensure_ascii=False) + "\n")
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+    def remove(self) -> None:
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+# ─── Streaming Backfill Runner ───────────────────────────────────────────────
+
+class BackfillRunner:
+
+    # ─── Initialize Backfill Runner ──────────────────────────────────────────
+
+    def __init__(
+        self,
+        document_processor: DocumentProcessor,
+        staging_directory: str = str(BACKFILL_STAGING_DIRECTORY),
+        checkpoint_directory: str = str(BACKFILL_CHECKPOINT_DIRECTORY),
+        queue_size: int = BACKFILL_QUEUE_SIZE,
+        batch_size: int = BACKFILL_BATCH_SIZE
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.document_processor = document_processor
+        self.staging_directory = staging_directory
+        self.checkpoint_directory = checkpoint_directory
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+
+    # ─── Source Entries from a Directory Tree or Zip Archive ─────────────────
+
+    def iter_staged_entries(self, source_path: str, completed_entries: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        staged_index = 0
+
+        if os.path.isfile(source_path) and zipfile.is_zipfile(source_path):
+            with zipfile.ZipFile(source_path) as source_archive:
+                for archive_member in source_archive.infolist():
+                    if archive_member.is_dir() or not archive_member.filename.lower().endswith(".pdf"):
+                        continue
+                    if archive_member.filename in completed_entries:
+                        continue
+
+                    staged_index += 1
+                    staged_path = self.staged_path_for(staged_index, archive_member.filename)
+                    with source_archive.open(archive_member) as member_file, open(staged_path, 'wb') as staged_file:
+                        shutil.copyfileobj(member_file, staged_file)
+                    yield archive_member.filename, staged_path
+            return
+
+        for directory_path, directory_names, filenames in os.walk(source_path):
+            directory_names.sort()
+            for filename in sorted(filenames):
+                if not filename.lower().endswith(".pdf"):
+                    continue
+                source_file_path = os.path.join(directory_path, filename)
+                entry_key = os.path.relpath(source_file_path, source_path).replace(os.sep, "/")
+                if entry_key in completed_entries:
+                    continue
+
+                staged_index += 1
+                staged_path = self.staged_path_for(staged_index, filename)
+                shutil.copyfile(source_file_path, staged_path)
+                yield entry_key, staged_path
+
+    def staged_path_for(self, staged_index: int, entry_name: str) -> str:
+        return os.path.join(self.staging_directory, f"{staged_index:06d} {os.path.basename(entry_name)}")
+
+    def reset_staging_directory(self) -> None:
+        shutil.rmtree(self.staging_directory, ignore_errors=True)
+        os.makedirs(self.staging_directory, exist_ok=True)
+
+    # ─── Bounded Staging Queue ───────────────────────────────────────────────
+
+    def stage_entries(
+        self,
+        source_path: str,
+        completed_entries: Dict[str, str],
+        staged_queue: queue.Queue,
+        stop_event: threading.Event
+    ) -> None:
+
+        try:
+            for staged_entry in self.iter_staged_entries(source_path, completed_entries):
+                if not self.put_until_stopped(staged_queue, staged_entry, stop_event):
+                    return
+        except Exception as staging_error:
+            self.put_until_stopped(staged_queue, staging_error, stop_event)
+            return
+        self.put_until_stopped(staged_queue, None, stop_event)
+
+    def put_until_stopped(
+        self,
+        staged_queue: queue.Queue,
+        staged_item: Union[Tuple[str, str], Exception, None],
+        stop_event: threading.Event
+    ) -> bool:
+
+        while not stop_event.is_set():
+            try:
+                staged_queue.put(staged_item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def iter_batches(self, staged_queue: queue.Queue) -> Iterator[List[Tuple[str, str]]]:
+        staged_batch: List[Tuple[str, str]] = []
+        while True:
+            staged_item = staged_queue.get()
+            if isinstance(staged_item, Exception):
+                raise staged_item
+            if staged_item is None:
+                break
+
+            staged_batch.append(staged_item)
+            if len(staged_batch) >= self.batch_size:
+                yield staged_batch
+                staged_batch = []
+
+        if staged_batch:
+            yield staged_batch
+
+    # ─── File One Batch & Checkpoint It ──────────────────────────────────────
+
+    def file_batch(
+        self,
+        staged_batch: List[Tuple[str, str]],
+        checkpoint: BackfillCheckpoint,
+        affected_folders: Set[str],
+        outcome_counts: Dict[str, int]
+    ) -> None:
+
+        summary = self.document_processor.process_input_pdfs([staged_path for _, staged_path in staged_batch])
+        filed_paths = set(summary.processed)
+        duplicate_paths = {staged_path for staged_path, _ in summary.duplicates}
+
+        entry_statuses: Dict[str, str] = {}
+        for entry_key, staged_path in staged_batch:
+            if staged_path in filed_paths:
+                entry_statuses[entry_key] = "filed"
+            elif staged_path in duplicate_paths:
+                entry_statuses[entry_key] = "duplicate"
+            else:
+                entry_statuses[entry_key] = "failed"
+                self.logger.error("Backfill entry could not be filed: %s", entry_key)
+            outcome_counts[entry_statuses[entry_key]] += 1
+
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+
+        batch_folders = sorted({os.path.dirname(distributed_path) for distributed_path in summary.distributed_paths})
+        affected_folders.update(batch_folders)
+        checkpoint.record_batch(entry_statuses, batch_folders)
+        self.logger.info(
+            "Backfill progress - Filed: %d, Duplicates: %d, Failed: %d",
+            outcome_counts["filed"], outcome_counts["duplicate"], outcome_counts["failed"]
+        )
+
+    # ─── Run Backfill ────────────────────────────────────────────────────────
+
+    def run(self, source_path: str) -> Dict[str, int]:
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Backfill source not found: {source_path}")
+
+        self.document_processor.recover_interrupted_renames()
+        checkpoint = BackfillCheckpoint(source_path, self.checkpoint_directory)
+        entry_statuses, affected_folders = checkpoint.load()
+        completed_entries = {
+            entry_key: entry_status for entry_key, entry_status in entry_statuses.items()
+            if entry_status in ("filed", "duplicate")
+        }
+        if entry_statuses:
+            self.logger.info(
+                "Resuming backfill of %s after %d completed entries, retrying %d failed",
+                source_path, len(completed_entries), len(entry_statuses) - len(completed_entries)
+            )
+
+        outcome_counts = {"filed": 0, "duplicate": 0, "failed": 0}
+        self.reset_staging_directory()
+        staged_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop_event = threading.Event()
+        staging_thread = threading.Thread(
+            target=self.stage_entries, args=(source_path, completed_entries, staged_queue, stop_event), daemon=True
+        )
+
+        # ─── Stream Entries Through Analysis & Distribution ──────────────────
+
+        staging_thread.start()
+        try:
+            with self.document_processor.metrics.stage("backfill"):
+                for staged_batch in self.iter_batches(staged_queue):
+                    self.file_batch(staged_batch, checkpoint, affected_folders, outcome_counts)
+        finally:
+            stop_event.set()
+            staging_thread.join()
+            shutil.rmtree(self.staging_directory, ignore_errors=True)
+
+        # ─── Single Deferred Sequencing & Metadata Pass ──────────────────────
+
+        with self.document_processor.metrics.stage("backfill_organisation"):
+            self.document_processor.organize_folders(sorted(folder for folder in affected_folders if os.path.isdir(folder)))
+        if outcome_counts["failed"]:
+            self.logger.warning("Backfill checkpoint kept so failed entries are retried on the next run: %s", source_path)
+        else:
+            checkpoint.remove()
+
+        self.document_processor.metrics.add_counts(outcome_counts, prefix="backfill_")
+        self.logger.info(
+            "Backfill complete for %s - Filed: %d, Duplicates: %d, Failed: %d, Folders organised: %d",
+            source_path, outcome_counts["filed"], outcome_counts["duplicate"], outcome_counts["failed"], len(affected_folders)
+        )
+        self.document_processor.write_run_report()
+        return outcome_counts
\ No newline at end of file
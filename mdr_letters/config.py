@@ -12,7 +12,16 @@ OUTPUT_DIRECTORIES = [BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY]
 
 # ─── Regular Expression Patterns ─────────────────────────────────────────────
 
-DATE_PATTERN = re.compile(r'\b(\d{1,2} [A-Za-z]+ \d{4})\b')
+DATE_PATTERN = re.compile(r'\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})\b', re.IGNORECASE)
+
+# ─── Date Parsing Configuration ──────────────────────────────────────────────
+
+MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+MONTH_NAME_VARIANTS = {"sept": 9}
+DATE_PARSE_CACHE_SIZE = 65536
 
 # ─── PDF Metadata Configuration ──────────────────────────────────────────────
 
@@ -29,6 +38,76 @@ METADATA_UPDATES = {
 
 SUPPORTED_FILE_EXTENSIONS = ['.pdf', '.docx', '.xlsx', '.gdoc']
 TEMP_FILE_PREFIX = "temp_"
+PARTIAL_FILE_SUFFIX = ".partial"
+DISTRIBUTION_BUFFER_LIMIT = 64 * 1024 * 1024
+FILE_IO_CONCURRENCY = 8
+
+# ─── File Lock Detection ─────────────────────────────────────────────────────
+
+LOCK_CACHE_TTL_SECONDS = 120.0
+OFFICE_OWNER_FILE_PREFIX = "~$"
+OFFICE_FILE_EXTENSIONS = ['.docx', '.xlsx']
+UNPROBED_FILE_EXTENSIONS = ['.gdoc']
+
+# ─── Parallel Ingestion Configuration ────────────────────────────────────────
+
+INGESTION_WORKERS = 1
+
+# ─── Local Data Storage ──────────────────────────────────────────────────────
+
+DATA_DIRECTORY = Path(__file__).resolve().parent.parent / "data"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# ─── Extraction Cache Configuration ──────────────────────────────────────────
+
+EXTRACTION_CACHE_ENABLED = True
+EXTRACTION_CACHE_PATH = DATA_DIRECTORY / "extraction_cache.sqlite3"
+EXTRACTION_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# ─── Folder Sequencing Configuration ─────────────────────────────────────────
+
+INCREMENTAL_SEQUENCING = True
+RENAME_JOURNAL_DIRECTORY = DATA_DIRECTORY / "rename_journals"
+
+# ─── Directory Index Configuration ───────────────────────────────────────────
+
+DIRECTORY_INDEX_PATH = DATA_DIRECTORY / "directory_index.sqlite3"
+
+# ─── Full-Text Search Configuration ──────────────────────────────────────────
+
+SEARCH_INDEX_ENABLED = False
+SEARCH_INDEX_PATH = DATA_DIRECTORY / "search_index.sqlite3"
+SEARCH_RESULT_LIMIT = 50
+
+# ─── Duplicate Letter Detection Configuration ────────────────────────────────
+
+FINGERPRINT_INDEX_ENABLED = False
+FINGERPRINT_INDEX_PATH = DATA_DIRECTORY / "fingerprint_index.sqlite3"
+FINGERPRINT_SHINGLE_WORDS = 5
+FINGERPRINT_SKETCH_SIZE = 128
+NEAR_DUPLICATE_THRESHOLD = 0.9
+DUPLICATE_POLICIES = ("skip", "replace", "keep")
+EXACT_DUPLICATE_POLICY = "skip"
+NEAR_DUPLICATE_POLICY = "skip"
+
+# ─── Run Metrics Configuration ───────────────────────────────────────────────
+
+LOGS_DIRECTORY = Path(__file__).resolve().parent.parent / "logs"
+METRICS_PREFIX = "mdr_letters"
+METRICS_PROMETHEUS_TEXTFILE = None
+
+# ─── Watch Mode Configuration ────────────────────────────────────────────────
+
+WATCH_POLL_INTERVAL_SECONDS = 2.0
+WATCH_STABLE_SECONDS = 3.0
+WATCH_DEBOUNCE_SECONDS = 5.0
+
+# ─── Backfill Configuration ──────────────────────────────────────────────────
+
+BACKFILL_QUEUE_SIZE = 64
+BACKFILL_BATCH_SIZE = 32
+BACKFILL_STAGING_DIRECTORY = DATA_DIRECTORY / "backfill_staging"
+BACKFILL_CHECKPOINT_DIRECTORY = DATA_DIRECTORY / "backfill_checkpoints"
 
 # ─── Postal Code Mapping ─────────────────────────────────────────────────────
 
@@ -40,6 +119,22 @@ POSTAL_CODES = {
     "EC2V_7HN": "EC2V 7HN"
 }
 
+# ─── Recipient Routing Rules ─────────────────────────────────────────────────
+
+RECIPIENT_ROUTING_RULES = [
+    {"postal_codes": ["W6_0XE", "HA0_2NJ", "M20_6RE"], "recipient": "All Defendants", "destinations": [BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY]},
+    {"postal_codes": ["W6_0XE", "HA0_2NJ"], "recipient": "Kambiz Babaee & Bhupen Varsani", "destinations": [BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY]},
+    {"postal_codes": ["W6_0XE"], "recipient": "Kambiz Babaee", "destinations": [KAMBIZ_DIRECTORY]},
+    {"postal_codes": ["HA0_2NJ"], "recipient": "Bhupen Varsani", "destinations": [BHUPEN_DIRECTORY]},
+    {"postal_codes": ["M20_6RE"], "recipient": "Fortis Insolvency", "destinations": [KAMBIZ_DIRECTORY]},
+    {"postal_codes": ["EC4A_1NL"], "recipient": "London Circuit Commercial Court", "destinations": [KAMBIZ_DIRECTORY]},
+    {"postal_codes": ["EC2V_7HN"], "recipient": "Lloyds Banking Group", "destinations": [KAMBIZ_DIRECTORY]}
+]
+
+DEFAULT_RECIPIENT_RULE = {"postal_codes": [], "recipient": "Kambiz Babaee", "destinations": [KAMBIZ_DIRECTORY]}
+
+ADDRESSEE_PAGES = 2
+
 # ─── Application Logging Configuration ───────────────────────────────────────
 
 LOG_FORMAT = '%(asctime)s:%(msecs)03d | %(levelname)s: %(message)s'
@@ -0,0 +1,70 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import DATE_PATTERN, MONTH_NAMES, MONTH_NAME_VARIANTS, DATE_PARSE_CACHE_SIZE
+
+# ─── Month Name Lookup ───────────────────────────────────────────────────────
+
+MONTH_NUMBERS: Dict[str, int] = {}
+for month_number, month_name in enumerate(MONTH_NAMES, start=1):
+    MONTH_NUMBERS[month_name.lower()] = month_number
+    MONTH_NUMBERS[month_name[:3].lower()] = month_number
+MONTH_NUMBERS.update(MONTH_NAME_VARIANTS)
+
+# ─── Parse Date Fields ───────────────────────────────────────────────────────
+
+def build_date(day_text: str, month_text: str, year_text: str) -> Optional[date]:
+    month_number = MONTH_NUMBERS.get(month_text.lower())
+    if month_number is None:
+        return None
+    try:
+        return date(int(year_text), month_number, int(day_text))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def parse_date_string(date_string: str) -> Optional[date]:
+    date_match = DATE_PATTERN.fullmatch(date_string.strip())
+    return build_date(*date_match.groups()) if date_match else None
+
+def format_date(parsed_date: date) -> str:
+    return f"{parsed_date.day:02d} {MONTH_NAMES[parsed_date.month - 1]} {parsed_date.year}"
+
+# ─── Dates in Document Text ──────────────────────────────────────────────────
+
+def find_text_date(document_text: str) -> Optional[date]:
+    for date_match in DATE_PATTERN.finditer(document_text):
+        parsed_date = build_date(*date_match.groups())
+        if parsed_date is not None:
+            return parsed_date
+    return None
+
+# ─── Bracketed Dates in Filenames ────────────────────────────────────────────
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def parse_filename_date(filename: str) -> Optional[date]:
+    opening_bracket = filename.find('[')
+    closing_bracket = filename.find(']', opening_bracket + 1)
+    if opening_bracket == -1 or closing_bracket == -1:
+        return None
+    return parse_date_string(filename[opening_bracket + 1:closing_bracket])
+
+def parse_filename_date_ordinal(filename: str) -> Optional[int]:
+    parsed_date = parse_filename_date(filename)
+    return parsed_date.toordinal() if parsed_date is not None else None
+
+# ─── Sequencing Sort Keys ────────────────────────────────────────────────────
+
+def sequence_order(cleaned_filenames: Dict[str, str]) -> List[Tuple[str, str]]:
+    sort_keys = []
+    for filename, cleaned_filename in cleaned_filenames.items():
+        date_ordinal = parse_filename_date_ordinal(cleaned_filename)
+        if date_ordinal is not None:
+            sort_keys.append((date_ordinal, cleaned_filename, filename))
+    sort_keys.sort()
+    return [(filename, cleaned_filename) for _, cleaned_filename, filename in sort_keys]
\ No newline at end of file
@@ -0,0 +1,246 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import re
+import sqlite3
+import logging
+from typing import List, Optional, Set
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import DIRECTORY_INDEX_PATH
+from .date_engine import parse_filename_date_ordinal
+
+# ─── Filename Field Parsing ──────────────────────────────────────────────────
+
+LEADING_SEQUENCE_PATTERN = re.compile(r'^(\d{2})\s+')
+
+def parse_filename_sequence(filename: str) -> Optional[int]:
+    sequence_match = LEADING_SEQUENCE_PATTERN.match(filename)
+    return int(sequence_match.group(1)) if sequence_match else None
+
+# ─── Persistent Output Directory Index ───────────────────────────────────────
+
+class DirectoryIndex:
+
+    # ─── Initialize Directory Index ──────────────────────────────────────────
+
+    def __init__(self, index_path: str = str(DIRECTORY_INDEX_PATH)):
+        self.logger = logging.getLogger(__name__)
+        self.index_path = index_path
+
+        os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(index_path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS folders ("
+                "path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER, sequenced_mtime_ns INTEGER)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, folder TEXT, filename TEXT, date_ordinal INTEGER, sequence INTEGER, "
+                "size INTEGER, mtime_ns INTEGER, metadata_clean INTEGER DEFAULT 0, clean_content_hash TEXT, text_hash TEXT)"
+            )
+            indexed_columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(files)")}
+            if "text_hash" not in indexed_columns:
+                self.connection.execute("ALTER TABLE files ADD COLUMN text_hash TEXT")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS files_by_folder ON files (folder)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS files_by_text_hash ON files (text_hash)")
+
+    # ─── Incremental Refresh via Folder Mtimes ───────────────────────────────
+
+    def refresh(self, root_directory: str, full_rescan: bool = False) -> int:
+        folders_to_visit = [(root_directory, None)]
+        visited_folders = set()
+        rescanned_folders = 0
+
+        while folders_to_visit:
+            folder_path, parent_path = folders_to_visit.pop()
+            try:
+                folder_mtime = os.stat(folder_path).st_mtime_ns
+            except OSError:
+                continue
+            visited_folders.add(folder_path)
+
+            indexed_folder = self.connection.execute(
+                "SELECT mtime_ns FROM folders WHERE path = ?", (folder_path,)
+            ).fetchone()
+
+            if not full_rescan and indexed_folder and indexed_folder["mtime_ns"] == folder_mtime:
+                folders_to_visit.extend(
+                    (row["path"], folder_path)
+                    for row in self.connection.execute("SELECT path FROM folders WHERE parent = ?", (folder_path,))
+                )
+                continue
+
+            subfolder_paths = self.rescan_folder(folder_path, parent_path, folder_mtime)
+            folders_to_visit.extend((subfolder_path, folder_path) for subfolder_path in subfolder_paths)
+            rescanned_folders += 1
+
+        self.forget_missing_folders(root_directory, visited_folders)
+        self.logger.info("Directory index refreshed for %s: %d folder(s) rescanned", root_directory, rescanned_folders)
+        return rescanned_folders
+
+    def rescan_folder(self, folder_path: str, parent_path: Optional[str], folder_mtime: int) -> List[str]:
+        subfolder_paths = []
+        indexed_files = {
+            row["filename"]: row for row in
+            self.connection.execute("SELECT filename, size, mtime_ns FROM files WHERE folder = ?", (folder_path,))
+        }
+        seen_filenames = set()
+
+        with self.connection, os.scandir(folder_path) as folder_entries:
+            for folder_entry in folder_entries:
+                if folder_entry.is_dir():
+                    subfolder_paths.append(folder_entry.path)
+                    continue
+
+                entry_stat = folder_entry.stat()
+                seen_filenames.add(folder_entry.name)
+                indexed_file = indexed_files.get(folder_entry.name)
+                if indexed_file and indexed_file["size"] == entry_stat.st_size and indexed_file["mtime_ns"] == entry_stat.st_mtime_ns:
+                    continue
+                self.upsert_file(folder_entry.path, entry_stat.st_size, entry_stat.st_mtime_ns)
+
+            for filename in set(indexed_files) - seen_filenames:
+                self.connection.execute("DELETE FROM files WHERE path = ?", (os.path.join(folder_path, filename),))
+
+            self.connection.execute(
+                "INSERT INTO folders (path, parent, mtime_ns) VALUES (?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET parent = COALESCE(excluded.parent, parent), mtime_ns = excluded.mtime_ns",
+                (folder_path, parent_path, folder_mtime)
+            )
+
+        return subfolder_paths
+
+    def forget_missing_folders(self, root_directory: str, visited_folders: set) -> None:
+        indexed_folders = [row["path"] for row in self.connection.execute("SELECT path FROM folders")]
+        missing_folders = [
+            (folder_path,) for folder_path in indexed_folders
+            if folder_path not in visited_folders and self.is_within(folder_path, root_directory)
+        ]
+        with self.connection:
+            self.connection.executemany("DELETE FROM files WHERE folder = ?", missing_folders)
+            self.connection.executemany("DELETE FROM folders WHERE path = ?", missing_folders)
+
+    def is_within(self, path: str, root_directory: str) -> bool:
+        return path == root_directory or path.startswith(os.path.join(root_directory, ""))
+
+    # ─── Record Individual File Changes ──────────────────────────────────────
+
+    def upsert_file(self, file_path: str, size: int, mtime_ns: int) -> None:
+        folder_path, filename = os.path.split(file_path)
+        self.connection.execute(
+            "INSERT INTO files (path, folder, filename, date_ordinal, sequence, size, mtime_ns, metadata_clean) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, 0) "
+            "ON CONFLICT(path) DO UPDATE SET date_ordinal = excluded.date_ordinal, sequence = excluded.sequence, "
+            "size = excluded.size, mtime_ns = excluded.mtime_ns, metadata_clean = 0",
+            (
+                file_path, folder_path, filename, parse_filename_date_ordinal(filename),
+                parse_filename_sequence(filename), size, mtime_ns
+            )
+        )
+
+    def record_file(self, file_path: str) -> None:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            self.forget_file(file_path)
+            return
+        with self.connection:
+            self.upsert_file(file_path, file_stat.st_size, file_stat.st_mtime_ns)
+
+    def record_rename(self, old_file_path: str, new_file_path: str) -> None:
+        folder_path, filename = os.path.split(new_file_path)
+        with self.connection:
+            self.connection.execute("DELETE FROM files WHERE path = ?", (new_file_path,))
+            self.connection.execute(
+                "UPDATE files SET path = ?, folder = ?, filename = ?, date_ordinal = ?, sequence = ? WHERE path = ?",
+                (
+                    new_file_path, folder_path, filename, parse_filename_date_ordinal(filename),
+                    parse_filename_sequence(filename), old_file_path
+                )
+            )
+
+    def is_file_unchanged(self, indexed_file: sqlite3.Row) -> bool:
+        try:
+            file_stat = os.stat(indexed_file["path"])
+        except OSError:
+            return False
+        return indexed_file["size"] == file_stat.st_size and indexed_file["mtime_ns"] == file_stat.st_mtime_ns
+
+    def forget_file(self, file_path: str) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM files WHERE path = ?", (file_path,))
+
+    # ─── Index Queries ───────────────────────────────────────────────────────
+
+    def files_under(self, root_directory: str) -> List[sqlite3.Row]:
+        return [
+            row for row in self.connection.execute("SELECT * FROM files ORDER BY folder, filename")
+            if self.is_within(row["folder"], root_directory)
+        ]
+
+    def folders_with_files(self, root_directory: str) -> List[str]:
+        return [
+            row["folder"] for row in self.connection.execute("SELECT DISTINCT folder FROM files ORDER BY folder")
+            if self.is_within(row["folder"], root_directory)
+        ]
+
+    def filenames_in(self, folder_path: str) -> List[str]:
+        return [
+            row["filename"] for row in
+            self.connection.execute("SELECT filename FROM files WHERE folder = ? ORDER BY filename", (folder_path,))
+        ]
+
+    # ─── Folder Sequencing State ─────────────────────────────────────────────
+
+    def is_folder_sequenced(self, folder_path: str) -> bool:
+        indexed_folder = self.connection.execute(
+            "SELECT mtime_ns, sequenced_mtime_ns FROM folders WHERE path = ?", (folder_path,)
+        ).fetchone()
+        return bool(indexed_folder) and indexed_folder["sequenced_mtime_ns"] == indexed_folder["mtime_ns"]
+
+    def mark_folder_sequenced(self, folder_path: str) -> None:
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+        with self.connection:
+            self.connection.execute(
+                "UPDATE folders SET mtime_ns = ?, sequenced_mtime_ns = ? WHERE path = ?",
+                (folder_mtime, folder_mtime, folder_path)
+            )
+
+    def clear_folder_sequenced(self, folder_path: str) -> None:
+        with self.connection:
+            self.connection.execute("UPDATE folders SET sequenced_mtime_ns = NULL WHERE path = ?", (folder_path,))
+
+    # ─── Metadata Clean Flag ─────────────────────────────────────────────────
+
+    def set_metadata_clean(self, file_path: str, content_hash: Optional[str] = None) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE files SET metadata_clean = 1, clean_content_hash = ? WHERE path = ?", (content_hash, file_path)
+            )
+
+    # ─── Letter Text Fingerprint Links ───────────────────────────────────────
+
+    def set_text_hash(self, file_path: str, text_hash: str) -> None:
+        with self.connection:
+            self.connection.execute("UPDATE files SET text_hash = ? WHERE path = ?", (text_hash, file_path))
+
+    def paths_with_text_hash(self, text_hash: str) -> List[str]:
+        return [
+            row["path"] for row in
+            self.connection.execute("SELECT path FROM files WHERE text_hash = ? ORDER BY path", (text_hash,))
+        ]
+
+    def filed_text_hashes(self) -> Set[str]:
+        return {
+            row["text_hash"] for row in
+            self.connection.execute("SELECT DISTINCT text_hash FROM files WHERE text_hash IS NOT NULL")
+        }
+
+    # ─── Close Index ─────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        self.connection.close()
\ No newline at end of file
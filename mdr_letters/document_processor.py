@@ -2,28 +2,168 @@
 
 import os
 import sys
-import shutil
 import logging
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
 
 # ─── Local Application Imports ──────────────────────────────────────────────
 
-from .config import INPUT_DIRECTORY, OUTPUT_DIRECTORIES
+from .config import (
+    INPUT_DIRECTORY,
+    OUTPUT_DIRECTORIES,
+    INGESTION_WORKERS,
+    EXTRACTION_CACHE_ENABLED,
+    INCREMENTAL_SEQUENCING,
+    METRICS_PROMETHEUS_TEXTFILE,
+    SEARCH_INDEX_ENABLED,
+    FINGERPRINT_INDEX_ENABLED,
+    DUPLICATE_POLICIES,
+    EXACT_DUPLICATE_POLICY,
+    NEAR_DUPLICATE_POLICY
+)
+from .metrics import RunMetrics
+from .async_io import AsyncFileOperations
+from .lock_checker import LockChecker
+from .extraction_cache import ExtractionCache, compute_content_hash
+from .directory_index import DirectoryIndex
+from .date_engine import parse_filename_date_ordinal
+from .search_index import SearchIndex, parse_filename_recipient
+from .fingerprint import FingerprintIndex, LetterFingerprint, DuplicateMatch, fingerprint_text
+from .letter import Letter, destination_ids_for
 from .pdf_utils import PDFUtils
 from .recipient_detector import RecipientDetector
 from .file_manager import FileManager
 
+# ─── Ingestion Worker ────────────────────────────────────────────────────────
+
+def analyze_input_pdf(
+    pdf_file_path: str,
+    read_full_text: bool = False,
+    fingerprint_letter: bool = False
+) -> Tuple[Letter, str, bool, Optional[LetterFingerprint]]:
+
+
+    page_texts = PDFUtils().iter_pdf_pages(pdf_file_path)
+    try:
+        recipient_id, date_ordinal, document_text, pages_read = RecipientDetector().analyze_pages(page_texts)
+        if read_full_text:
+            remaining_pages = list(page_texts)
+            document_text += "".join(remaining_pages)
+            pages_read += len(remaining_pages)
+    finally:
+        page_texts.close()
+
+    if not document_text:
+        raise ValueError("No text could be extracted")
+    letter = Letter(
+        pdf_file_path, os.path.getsize(pdf_file_path), None,
+        date_ordinal, recipient_id, destination_ids_for(recipient_id), pages_read
+    )
+    letter_fingerprint = fingerprint_text(document_text) if read_full_text and fingerprint_letter else None
+    return letter, document_text, read_full_text, letter_fingerprint
+
+# ─── Ingestion Run Summary ───────────────────────────────────────────────────
+
+class IngestionSummary:
+
+    def __init__(self):
+        self.processed: List[str] = []
+        self.distributed_paths: List[str] = []
+        self.failures: List[Tuple[str, str]] = []
+        self.duplicates: List[Tuple[str, str]] = []
+        self.replaced: List[Tuple[str, str]] = []
+        self.kept_duplicates: List[Tuple[str, str]] = []
+        self.pages_read = 0
+        self.cache_hits = 0
+
+    def record_success(self, pdf_file_path: str, distributed_paths: List[str]) -> None:
+        self.processed.append(pdf_file_path)
+        self.distributed_paths.extend(distributed_paths)
+
+    def record_failure(self, pdf_file_path: str, reason: str) -> None:
+        self.failures.append((pdf_file_path, reason))
+
+    def record_duplicate(self, pdf_file_path: str, existing_path: str) -> None:
+        self.duplicates.append((pdf_file_path, existing_path))
+
+    def record_replacement(self, pdf_file_path: str, replaced_path: str) -> None:
+        self.replaced.append((pdf_file_path, replaced_path))
+
+    def record_kept_duplicate(self, pdf_file_path: str, existing_path: str) -> None:
+        self.kept_duplicates.append((pdf_file_path, existing_path))
+
+    def log(self, logger: logging.Logger) -> None:
+        logger.info(
+            "Ingestion complete - Processed: %d, Failed: %d, Duplicates: %d, Replaced: %d, Pages read: %d, Cache hits: %d",
+            len(self.processed), len(self.failures), len(self.duplicates), len(self.replaced),
+            self.pages_read, self.cache_hits
+        )
+        for pdf_file_path, existing_path in self.duplicates:
+            logger.warning("Duplicate download left in input directory: %s (duplicate of %s)", pdf_file_path, existing_path)
+        for pdf_file_path, replaced_path in self.replaced:
+            logger.warning("Filed letter replaced by re-sent version: %s (replaced %s)", pdf_file_path, replaced_path)
+        for pdf_file_path, existing_path in self.kept_duplicates:
+            logger.warning("Re-sent letter filed alongside earlier version: %s (duplicate of %s)", pdf_file_path, existing_path)
+        for pdf_file_path, reason in self.failures:
+            logger.error("Ingestion failed for %s: %s", pdf_file_path, reason)
+
 # ─── Main Document Processing Engine ─────────────────────────────────────────
 
 class DocumentProcessor:
 
     # ─── Initialize Document Processor ────────────────────────────────────────
 
-    def __init__(self):
+    def __init__(
+        self,
+        ingestion_workers: int = INGESTION_WORKERS,
+        incremental_sequencing: bool = INCREMENTAL_SEQUENCING,
+        extraction_cache: Optional[ExtractionCache] = None,
+        directory_index: Optional[DirectoryIndex] = None,
+        search_index: Optional[SearchIndex] = None,
+        fingerprint_index: Optional[FingerprintIndex] = None,
+        exact_duplicate_policy: str = EXACT_DUPLICATE_POLICY,
+        near_duplicate_policy: str = NEAR_DUPLICATE_POLICY,
+        metrics: Optional[RunMetrics] = None,
+        prometheus_textfile: Optional[str] = METRICS_PROMETHEUS_TEXTFILE,
+        rollback_interrupted_renames: bool = False
+    ):
         self.logger = logging.getLogger(__name__)
-        self.pdf_utils = PDFUtils()
+        for duplicate_policy in (exact_duplicate_policy, near_duplicate_policy):
+            if duplicate_policy not in DUPLICATE_POLICIES:
+                raise ValueError(f"Unknown duplicate policy: {duplicate_policy}")
+        self.ingestion_workers = ingestion_workers
+        self.exact_duplicate_policy = exact_duplicate_policy
+        self.near_duplicate_policy = near_duplicate_policy
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.prometheus_textfile = prometheus_textfile
+        self.rollback_interrupted_renames = rollback_interrupted_renames
+        self.async_io = AsyncFileOperations()
+        self.lock_checker = LockChecker(self.async_io, self.metrics)
+        if extraction_cache is None and EXTRACTION_CACHE_ENABLED:
+            extraction_cache = ExtractionCache()
+        self.extraction_cache = extraction_cache
+        self.directory_index = directory_index if directory_index is not None else DirectoryIndex()
+        if search_index is None and SEARCH_INDEX_ENABLED:
+            search_index = SearchIndex()
+        self.search_index = search_index
+        if fingerprint_index is None and FINGERPRINT_INDEX_ENABLED:
+            fingerprint_index = FingerprintIndex()
+        self.fingerprint_index = fingerprint_index
+        self.pdf_utils = PDFUtils(
+            extraction_cache=self.extraction_cache,
+            directory_index=self.directory_index,
+            metrics=self.metrics,
+            lock_checker=self.lock_checker
+        )
         self.recipient_detector = RecipientDetector()
-        self.file_manager = FileManager()
+        self.file_manager = FileManager(
+            incremental=incremental_sequencing,
+            directory_index=self.directory_index,
+            metrics=self.metrics,
+            async_io=self.async_io,
+            lock_checker=self.lock_checker,
+            search_index=self.search_index
+        )
 
     # ─── Rename & Distribute PDF ─────────────────────────────────────────────
 
@@ -33,71 +173,519 @@ class DocumentProcessor:
         recipient_name: str,
         formatted_date: str,
         year: str,
-        destination_directories: List[str]
-    ) -> None:
+        destination_directories: List[str],
+        letter_fingerprint: Optional[LetterFingerprint] = None
+    ) -> List[str]:
         
+        new_filename = self.build_target_filename(original_pdf_path, recipient_name, formatted_date)
+        target_file_paths = []
+        for destination_root_directory in destination_directories:
+            target_file_path = os.path.join(destination_root_directory, year, new_filename)
+            target_file_paths.append(self.file_manager.ensure_unique_filename(target_file_path))
+        return self.distribute_to_targets(original_pdf_path, target_file_paths, letter_fingerprint)
+
+    def distribute_letter(
+        self,
+        letter: Letter,
+        letter_fingerprint: Optional[LetterFingerprint] = None
+    ) -> List[str]:
+
+        return self.rename_and_distribute(
+            letter.path, letter.recipient_name, letter.formatted_date, letter.year,
+            letter.destination_directories, letter_fingerprint
+        )
+
+    def build_target_filename(self, original_pdf_path: str, recipient_name: str, formatted_date: str) -> str:
         _, file_extension = os.path.splitext(original_pdf_path)
-        new_filename = f"Mishcon de Reya — Letter to {recipient_name} [{formatted_date}]{file_extension}"
-        source_file_path = None
+        return f"Mishcon de Reya — Letter to {recipient_name} [{formatted_date}]{file_extension}"
+
+    def distribute_to_targets(
+        self,
+        original_pdf_path: str,
+        target_file_paths: List[str],
+        letter_fingerprint: Optional[LetterFingerprint] = None
+    ) -> List[str]:
+
+        target_folders = [os.path.dirname(target_file_path) for target_file_path in target_file_paths]
+        folder_outcomes = self.async_io.map(self.ensure_folder_exists, target_folders)
+        for target_folder, folder_outcome in zip(target_folders, folder_outcomes):
+            if isinstance(folder_outcome, Exception):
+                self.logger.error("Failed to distribute PDF to %s", target_folder, exc_info=folder_outcome)
+                return []
+
+        search_document = self.read_search_document(original_pdf_path)
+        if letter_fingerprint is None:
+            letter_fingerprint = self.read_fingerprint(original_pdf_path)
+        try:
+            distributed_paths = self.file_manager.distribute_file(original_pdf_path, target_file_paths)
+        except Exception:
+            self.logger.error("Failed to distribute PDF: %s", original_pdf_path, exc_info=True)
+            return []
 
-        for directory_index, destination_root_directory in enumerate(destination_directories):
-            target_year_folder = os.path.join(destination_root_directory, year)
-            os.makedirs(target_year_folder, exist_ok=True)
-            target_file_path = os.path.join(target_year_folder, new_filename)
+        for distributed_path in distributed_paths:
+            self.directory_index.record_file(distributed_path)
+        if search_document is not None and distributed_paths:
+            self.search_index.record_letters(distributed_paths, *search_document)
+            self.metrics.increment("letters_indexed", len(distributed_paths))
+        if letter_fingerprint is not None and distributed_paths:
+            self.record_fingerprint(letter_fingerprint, distributed_paths)
+        return distributed_paths
 
+    # ─── Full-Text Search Indexing ───────────────────────────────────────────
+
+    def read_search_document(
+        self,
+        pdf_file_path: str,
+        document_text: Optional[str] = None
+    ) -> Optional[Tuple[str, Optional[str]]]:
+
+        if self.search_index is None:
+            return None
+        try:
+            if self.extraction_cache is not None:
+                content_hash = self.extraction_cache.content_hash_for(pdf_file_path)
+            else:
+                content_hash = compute_content_hash(pdf_file_path)
+        except OSError:
+            self.logger.error("Failed to hash PDF for search index: %s", pdf_file_path, exc_info=True)
+            return None
+
+        if self.search_index.has_document(content_hash):
+            return content_hash, None
+        if document_text is None:
+            document_text = self.pdf_utils.load_pdf_text(pdf_file_path)
+        return content_hash, document_text
+
+    def index_filed_letters(self) -> int:
+        if self.search_index is None and self.fingerprint_index is None:
+            self.logger.warning("Search and fingerprint indexes are disabled")
+            return 0
+
+        self.refresh_directory_index()
+        searched_paths = self.search_index.indexed_paths() if self.search_index is not None else set()
+        filed_paths = set()
+        newly_indexed = 0
+        with self.metrics.stage("letter_indexing"):
+            for output_directory in OUTPUT_DIRECTORIES:
+                for indexed_file in self.directory_index.files_under(output_directory):
+                    if not indexed_file["filename"].lower().endswith(".pdf"):
+                        continue
+                    filed_path = indexed_file["path"]
+                    filed_paths.add(filed_path)
+
+                    indexed = False
+                    document_text = None
+                    if self.search_index is not None and filed_path not in searched_paths:
+                        search_document = self.read_search_document(filed_path)
+                        if search_document is not None:
+                            self.search_index.record_letters([filed_path], *search_document)
+                            document_text = search_document[1]
+                            indexed = True
+                    if self.fingerprint_index is not None and indexed_file["text_hash"] is None:
+                        letter_fingerprint = self.read_fingerprint(filed_path, document_text)
+                        if letter_fingerprint is not None:
+                            self.record_fingerprint(letter_fingerprint, [filed_path])
+                            indexed = True
+                    if indexed:
+                        newly_indexed += 1
+
+            if self.search_index is not None:
+                for missing_path in searched_paths - filed_paths:
+                    self.search_index.forget_letter(missing_path)
+                self.metrics.increment("search_documents_pruned", self.search_index.prune_documents())
+            if self.fingerprint_index is not None:
+                self.metrics.increment(
+                    "fingerprints_pruned", self.fingerprint_index.prune(self.directory_index.filed_text_hashes())
+                )
+
+            self.metrics.increment("letters_indexed", newly_indexed)
+        self.logger.info("Search and fingerprint indexes updated with %d filed letter(s)", newly_indexed)
+        return newly_indexed
+
+    # ─── Near-Duplicate Letter Detection ─────────────────────────────────────
+
+    def fingerprint_partition(self, file_path: str) -> Tuple[str, str]:
+        year_folder, filename = os.path.split(file_path)
+        return parse_filename_recipient(filename) or "", os.path.basename(year_folder)
+
+    def read_fingerprint(self, pdf_file_path: str, document_text: Optional[str] = None) -> Optional[LetterFingerprint]:
+        if self.fingerprint_index is None:
+            return None
+        if document_text is None:
+            document_text = self.pdf_utils.load_pdf_text(pdf_file_path)
+        return fingerprint_text(document_text)
+
+    def record_fingerprint(self, letter_fingerprint: LetterFingerprint, distributed_paths: List[str]) -> None:
+        self.fingerprint_index.add(
+            letter_fingerprint, *self.fingerprint_partition(distributed_paths[0]),
+            parse_filename_date_ordinal(os.path.basename(distributed_paths[0]))
+        )
+        for distributed_path in distributed_paths:
+            self.directory_index.set_text_hash(distributed_path, letter_fingerprint.text_hash)
+
+    def find_filed_duplicate(self, letter: Letter, letter_fingerprint: Optional[LetterFingerprint]) -> Optional[DuplicateMatch]:
+        if self.fingerprint_index is None or letter_fingerprint is None:
+            return None
+
+        while True:
+            duplicate_match = self.fingerprint_index.find_duplicate(
+                letter_fingerprint, letter.recipient_name, letter.year, letter.date_ordinal
+            )
+            if duplicate_match is None:
+                return None
+
+            duplicate_match.paths = [
+                filed_path for filed_path in self.directory_index.paths_with_text_hash(duplicate_match.text_hash)
+                if os.path.exists(filed_path)
+            ]
+            if duplicate_match.paths:
+                self.metrics.increment("exact_duplicates" if duplicate_match.exact else "near_duplicates")
+                return duplicate_match
+
+            self.logger.debug("Dropping fingerprint of a letter no longer filed: %s", duplicate_match.text_hash)
+            self.fingerprint_index.forget(letter.recipient_name, letter.year, duplicate_match.text_hash)
+
+    def duplicate_policy_for(self, duplicate_match: Optional[DuplicateMatch]) -> Optional[str]:
+        if duplicate_match is None:
+            return None
+        return self.exact_duplicate_policy if duplicate_match.exact else self.near_duplicate_policy
+
+    def replace_filed_letter(self, duplicate_match: DuplicateMatch) -> None:
+        for filed_path in duplicate_match.paths:
             try:
-                if directory_index == 0:
-                    shutil.move(original_pdf_path, target_file_path)
-                    source_file_path = target_file_path
-                    self.logger.info("Moved PDF to: %s", target_file_path)
+                os.remove(filed_path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self.logger.error("Failed to remove replaced letter: %s", filed_path, exc_info=True)
+                continue
 
-                else:
-                    shutil.copy2(source_file_path, target_file_path)
-                    self.logger.info("Copied PDF to: %s", target_file_path)
+            self.directory_index.forget_file(filed_path)
+            if self.search_index is not None:
+                self.search_index.forget_letter(filed_path)
+            self.metrics.increment("letters_replaced")
 
-            except Exception:
-                self.logger.error("Failed to distribute PDF to %s", destination_root_directory, exc_info=True)
+        if not self.directory_index.paths_with_text_hash(duplicate_match.text_hash):
+            self.fingerprint_index.forget(*self.fingerprint_partition(duplicate_match.paths[0]), duplicate_match.text_hash)
+
+    def ensure_folder_exists(self, folder_path: str) -> None:
+        os.makedirs(folder_path, exist_ok=True)
 
     # ─── Process Input PDFs ──────────────────────────────────────────────────
 
-    def process_input_pdfs(self) -> None:
-        for filename in os.listdir(INPUT_DIRECTORY):
+    def list_input_pdfs(self) -> List[str]:
+        return [
+            os.path.join(INPUT_DIRECTORY, filename)
+            for filename in sorted(os.listdir(INPUT_DIRECTORY))
+            if filename.lower().endswith(".pdf")
+        ]
+
+    def find_filed_copy(self, distributed_paths: List[str], folder_listings: Dict[str, Set[str]]) -> Optional[str]:
+        for distributed_path in distributed_paths:
+            year_folder, filename = os.path.split(distributed_path)
+            if year_folder not in folder_listings:
+                folder_listings[year_folder] = (
+                    {self.file_manager.remove_leading_sequence(name) for name in os.listdir(year_folder)}
+                    if os.path.isdir(year_folder) else set()
+                )
+            if self.file_manager.remove_leading_sequence(filename) in folder_listings[year_folder]:
+                return distributed_path
+        return None
+
+    def screen_with_cache(
+        self,
+        pdf_file_paths: List[str],
+        content_hashes: Dict[str, str],
+        summary: IngestionSummary
+    ) -> Tuple[List[str], Dict[str, Letter]]:
+
+        pdf_files_to_analyze: List[str] = []
+        cached_letters: Dict[str, Letter] = {}
+        first_path_by_hash: Dict[str, str] = {}
+        folder_listings: Dict[str, Set[str]] = {}
 
-            if not filename.lower().endswith(".pdf"):
+        for pdf_file_path in pdf_file_paths:
+            try:
+                content_hash = self.extraction_cache.content_hash_for(pdf_file_path)
+            except OSError as hash_error:
+                summary.record_failure(pdf_file_path, str(hash_error))
                 continue
-            
-            pdf_file_path = os.path.join(INPUT_DIRECTORY, filename)
-            self.logger.info("Processing input PDF: %s", pdf_file_path)
 
-            document_text = self.pdf_utils.load_pdf_text(pdf_file_path)
-            if not document_text:
+            if content_hash in first_path_by_hash:
+                summary.record_duplicate(pdf_file_path, first_path_by_hash[content_hash])
                 continue
+            first_path_by_hash[content_hash] = pdf_file_path
+
+            filed_copy = self.find_filed_copy(self.extraction_cache.distributed_paths_for(content_hash), folder_listings)
+            if filed_copy:
+                summary.record_duplicate(pdf_file_path, filed_copy)
+                continue
+
+            content_hashes[pdf_file_path] = content_hash
+            cached_analysis = self.extraction_cache.lookup_analysis(content_hash)
+            if cached_analysis is not None:
+                recipient_id, destination_ids, date_ordinal, pages_read = cached_analysis
+                cached_letters[pdf_file_path] = Letter(
+                    pdf_file_path, os.path.getsize(pdf_file_path), content_hash,
+                    date_ordinal, recipient_id, destination_ids, pages_read
+                )
+                summary.cache_hits += 1
+            else:
+                pdf_files_to_analyze.append(pdf_file_path)
+
+        return pdf_files_to_analyze, cached_letters
+
+    def keep_analyzed_letter(
+        self,
+        letters: Dict[str, Letter],
+        letter: Letter,
+        document_text: str,
+        text_complete: bool,
+        letter_fingerprint: Optional[LetterFingerprint],
+        content_hashes: Dict[str, str],
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]]
+    ) -> None:
+
+        letter.content_hash = content_hashes.get(letter.path)
+        if self.extraction_cache is not None and letter.content_hash is not None:
+            self.extraction_cache.store_analysis(
+                letter.content_hash, letter.analysis_fields(), document_text, letter.pages_read, text_complete
+            )
+        if text_complete:
+            search_document = self.read_search_document(letter.path, document_text)
+            if search_document is not None and search_document[1] is not None:
+                self.search_index.record_letters([], *search_document)
+            letter_fingerprints[letter.path] = letter_fingerprint
+        letters[letter.path] = letter
+
+    def take_fingerprint(
+        self,
+        pdf_file_path: str,
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]]
+    ) -> Optional[LetterFingerprint]:
+
+        if pdf_file_path in letter_fingerprints:
+            return letter_fingerprints.pop(pdf_file_path)
+        return self.read_fingerprint(pdf_file_path)
+
+    def reads_full_text(self) -> bool:
+        return self.search_index is not None or self.fingerprint_index is not None
+
+    def analyze_sequentially(
+        self,
+        pdf_file_paths: List[str],
+        content_hashes: Dict[str, str],
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]],
+        summary: IngestionSummary
+    ) -> Dict[str, Letter]:
+
+        letters: Dict[str, Letter] = {}
+        for pdf_file_path in pdf_file_paths:
+            self.logger.debug("Processing input PDF: %s", pdf_file_path)
+            try:
+                letter, document_text, text_complete, letter_fingerprint = analyze_input_pdf(
+                    pdf_file_path, self.reads_full_text(), self.fingerprint_index is not None
+                )
+            except Exception as analysis_error:
+                summary.record_failure(pdf_file_path, str(analysis_error))
+                continue
+            self.keep_analyzed_letter(
+                letters, letter, document_text, text_complete, letter_fingerprint, content_hashes, letter_fingerprints
+            )
+        return letters
+
+    def analyze_in_process_pool(
+        self,
+        pdf_file_paths: List[str],
+        content_hashes: Dict[str, str],
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]],
+        summary: IngestionSummary
+    ) -> Dict[str, Letter]:
+
+        letters: Dict[str, Letter] = {}
+        self.logger.info("Analysing %d input PDFs with %d workers", len(pdf_file_paths), self.ingestion_workers)
+
+        with ProcessPoolExecutor(max_workers=self.ingestion_workers) as executor:
+            pending_analyses = {
+                executor.submit(
+                    analyze_input_pdf, pdf_file_path, self.reads_full_text(), self.fingerprint_index is not None
+                ): pdf_file_path
+                for pdf_file_path in pdf_file_paths
+            }
+            for completed_analysis in as_completed(pending_analyses):
+                pdf_file_path = pending_analyses[completed_analysis]
+                try:
+                    letter, document_text, text_complete, letter_fingerprint = completed_analysis.result()
+                except Exception as analysis_error:
+                    summary.record_failure(pdf_file_path, str(analysis_error) or type(analysis_error).__name__)
+                    continue
+                self.keep_analyzed_letter(
+                    letters, letter, document_text, text_complete, letter_fingerprint, content_hashes, letter_fingerprints
+                )
+        return letters
+
+    def analyze_input_batch(
+        self,
+        pdf_file_paths: List[str],
+        content_hashes: Dict[str, str],
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]],
+        summary: IngestionSummary
+    ) -> Tuple[Dict[str, Letter], Set[str]]:
+
+        letters: Dict[str, Letter] = {}
+        with self.metrics.stage("screening"):
+            if self.extraction_cache is not None:
+                pdf_files_to_analyze, letters = self.screen_with_cache(pdf_file_paths, content_hashes, summary)
+            else:
+                pdf_files_to_analyze = pdf_file_paths
+
+        with self.metrics.stage("analysis"):
+            if self.ingestion_workers > 1 and len(pdf_files_to_analyze) > 1:
+                fresh_letters = self.analyze_in_process_pool(pdf_files_to_analyze, content_hashes, letter_fingerprints, summary)
+            else:
+                fresh_letters = self.analyze_sequentially(pdf_files_to_analyze, content_hashes, letter_fingerprints, summary)
+            letters.update(fresh_letters)
+
+        return letters, set(fresh_letters)
+
+    def process_input_pdfs(self, pdf_file_paths: Optional[List[str]] = None) -> IngestionSummary:
+        summary = IngestionSummary()
+        if pdf_file_paths is None:
+            pdf_file_paths = self.list_input_pdfs()
+        content_hashes: Dict[str, str] = {}
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]] = {}
+        letters, freshly_analyzed = self.analyze_input_batch(pdf_file_paths, content_hashes, letter_fingerprints, summary)
+
+        # ─── Distribute in Input Order ───────────────────────────────────────
+
+        with self.metrics.stage("distribution"):
+            for pdf_file_path in pdf_file_paths:
+                letter = letters.pop(pdf_file_path, None)
+                if letter is None:
+                    continue
+
+                if pdf_file_path in freshly_analyzed:
+                    summary.pages_read += letter.pages_read
+                    self.logger.debug("Analysed %s from %d page(s)", pdf_file_path, letter.pages_read)
+
+                letter_fingerprint = self.take_fingerprint(pdf_file_path, letter_fingerprints)
+                duplicate_match = self.find_filed_duplicate(letter, letter_fingerprint)
+                duplicate_policy = self.duplicate_policy_for(duplicate_match)
+                if duplicate_policy == "skip":
+                    summary.record_duplicate(pdf_file_path, duplicate_match.paths[0])
+                    continue
+                distributed_paths = self.distribute_letter(letter, letter_fingerprint)
+
+                if len(distributed_paths) == len(letter.destination_ids):
+                    summary.record_success(pdf_file_path, distributed_paths)
+                    if self.extraction_cache is not None:
+                        self.extraction_cache.record_distribution(letter.content_hash, distributed_paths)
+                    if duplicate_policy == "replace":
+                        self.replace_filed_letter(duplicate_match)
+                        summary.record_replacement(pdf_file_path, duplicate_match.paths[0])
+                    elif duplicate_policy == "keep":
+                        summary.record_kept_duplicate(pdf_file_path, duplicate_match.paths[0])
+                else:
+                    summary.record_failure(
+                        pdf_file_path,
+                        f"Distributed to {len(distributed_paths)} of {len(letter.destination_ids)} destinations"
+                    )
+
+            if self.extraction_cache is not None:
+                self.extraction_cache.evict()
 
-            recipient_name, destination_directories, formatted_date, year = self.recipient_detector.analyze_document(document_text)
-            self.rename_and_distribute(pdf_file_path, recipient_name, formatted_date, year, destination_directories)
+        self.record_ingestion_metrics(len(pdf_file_paths), summary)
+        summary.log(self.logger)
+        return summary
+
+    def record_ingestion_metrics(self, input_count: int, summary: IngestionSummary) -> None:
+        self.metrics.increment("input_files", input_count)
+        self.metrics.increment("files_processed", len(summary.processed))
+        self.metrics.increment("files_failed", len(summary.failures))
+        self.metrics.increment("duplicates", len(summary.duplicates))
+        self.metrics.increment("duplicates_replaced", len(summary.replaced))
+        self.metrics.increment("duplicates_kept", len(summary.kept_duplicates))
+        self.metrics.increment("pages_read", summary.pages_read)
+        self.metrics.increment("cache_hits", summary.cache_hits)
 
     # ─── Process Existing File Organization ───────────────────────────────────
 
+    def refresh_directory_index(self) -> None:
+        with self.metrics.stage("index_refresh"):
+            for output_directory in OUTPUT_DIRECTORIES:
+                self.metrics.increment("folders_rescanned", self.directory_index.refresh(output_directory))
+
     def process_existing_files(self) -> bool:
+        self.refresh_directory_index()
+
         for output_directory in OUTPUT_DIRECTORIES:
-            if (self.file_manager.validate_dates_in_filenames(output_directory) and 
-                self.file_manager.ensure_all_files_closed(output_directory)):
-                self.file_manager.process_directory_with_subfolders(output_directory)
+            with self.metrics.stage("validation"):
+                directory_is_valid = (self.file_manager.validate_dates_in_filenames(output_directory) and
+                                      self.file_manager.ensure_all_files_closed(output_directory))
+            if directory_is_valid:
+                with self.metrics.stage("sequencing"):
+                    self.file_manager.process_directory_with_subfolders(output_directory)
             else:
                 self.logger.error("Validation failed for directory: %s", output_directory)
                 return False
         return True
 
+    # ─── Organise Only the Affected Year Folders ─────────────────────────────
+
+    def organize_folders(self, folder_paths: List[str]) -> None:
+        folder_filenames: Dict[str, List[str]] = {}
+        for folder_path in sorted(set(folder_paths)):
+            self.directory_index.refresh(folder_path)
+            if not (self.file_manager.validate_dates_in_filenames(folder_path) and
+                    self.file_manager.ensure_all_files_closed(folder_path)):
+                self.logger.error("Validation failed for folder: %s", folder_path)
+                continue
+            folder_filenames[folder_path] = self.directory_index.filenames_in(folder_path)
+
+        for folder_path, completed in self.file_manager.sequence_folders(folder_filenames).items():
+            if completed:
+                self.directory_index.mark_folder_sequenced(folder_path)
+            self.pdf_utils.update_pdf_metadata(folder_path)
+
     # ─── Update PDF Metadata for All Files ───────────────────────────────────
 
-    def update_all_pdf_metadata(self) -> None:
-        for output_directory in OUTPUT_DIRECTORIES:
-            self.pdf_utils.update_pdf_metadata(output_directory)
+    def update_all_pdf_metadata(self) -> Dict[str, int]:
+        metadata_totals: Dict[str, int] = {}
+        with self.metrics.stage("metadata"):
+            for output_directory in OUTPUT_DIRECTORIES:
+                for outcome, count in self.pdf_utils.update_pdf_metadata(output_directory).items():
+                    metadata_totals[outcome] = metadata_totals.get(outcome, 0) + count
+
+        self.logger.info(
+            "Metadata update complete - Skipped: %d, Already clean: %d, Rewritten: %d",
+            metadata_totals.get("skipped", 0), metadata_totals.get("clean", 0), metadata_totals.get("rewritten", 0)
+        )
+        return metadata_totals
+
+    # ─── Write Run Report ────────────────────────────────────────────────────
+
+    def write_run_report(self) -> None:
+        self.metrics.log_summary()
+        self.metrics.write_json_report()
+        if self.prometheus_textfile:
+            self.metrics.write_prometheus_textfile(self.prometheus_textfile)
+
+    # ─── Recover Interrupted Sequencing ──────────────────────────────────────
+
+    def recover_interrupted_renames(self) -> None:
+        recovered_folders = self.file_manager.recover_interrupted_renames(roll_back=self.rollback_interrupted_renames)
+        if recovered_folders:
+            self.metrics.increment("folders_recovered", len(recovered_folders))
+            self.logger.warning(
+                "%s interrupted sequencing in %d folder(s)",
+                "Rolled back" if self.rollback_interrupted_renames else "Completed", len(recovered_folders)
+            )
 
     # ─── Execute Complete Processing Workflow ────────────────────────────────
 
     def execute_workflow(self) -> None:
         self.logger.info("Starting PDF processing workflow")
+        self.recover_interrupted_renames()
 
         # ─── Process Input PDFs ───────────────────────────────────────────────
 
@@ -107,10 +695,12 @@ class DocumentProcessor:
 
         if not self.process_existing_files():
             self.logger.error("Existing file processing failed")
+            self.write_run_report()
             sys.exit(1)
 
         # ─── Update PDF Metadata ──────────────────────────────────────────────
 
         self.update_all_pdf_metadata()
+        self.write_run_report()
         
         self.logger.info("PDF processing workflow completed successfully")
\ No newline at end of file
@@ -0,0 +1,206 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+from typing import Any, List, Optional, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import (
+    EXTRACTION_CACHE_PATH,
+    EXTRACTION_CACHE_MAX_BYTES,
+    HASH_CHUNK_SIZE,
+    OUTPUT_DIRECTORIES,
+    DATE_PATTERN,
+    POSTAL_CODES,
+    RECIPIENT_ROUTING_RULES,
+    DEFAULT_RECIPIENT_RULE
+)
+
+# ─── Content Hashing ─────────────────────────────────────────────────────────
+
+def compute_content_hash(file_path: str) -> str:
+    content_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file_handle:
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b''):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+def compute_rules_signature() -> str:
+    routing_configuration = json.dumps(
+        [DATE_PATTERN.pattern, POSTAL_CODES, RECIPIENT_ROUTING_RULES, DEFAULT_RECIPIENT_RULE, OUTPUT_DIRECTORIES],
+        sort_keys=True
+    )
+    return hashlib.sha256(routing_configuration.encode()).hexdigest()
+
+# ─── Persistent PDF Extraction Cache ─────────────────────────────────────────
+
+class ExtractionCache:
+
+    # ─── Initialize Extraction Cache ─────────────────────────────────────────
+
+    def __init__(self, cache_path: str = str(EXTRACTION_CACHE_PATH), max_bytes: int = EXTRACTION_CACHE_MAX_BYTES):
+        self.logger = logging.getLogger(__name__)
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.rules_signature = compute_rules_signature()
+
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(cache_path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, content_hash TEXT)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                "content_hash TEXT PRIMARY KEY, document_text TEXT, text_complete INTEGER, "
+                "pages_read INTEGER, analysis TEXT, rules_signature TEXT, distributed_paths TEXT, "
+                "entry_bytes INTEGER, last_used REAL)"
+            )
+
+    # ─── Resolve Content Hash with Size & Mtime Pre-Check ────────────────────
+
+    def content_hash_for(self, file_path: str) -> str:
+        file_stat = os.stat(file_path)
+        cached_row = self.connection.execute(
+            "SELECT size, mtime_ns, content_hash FROM files WHERE path = ?", (file_path,)
+        ).fetchone()
+
+        if cached_row and cached_row[0] == file_stat.st_size and cached_row[1] == file_stat.st_mtime_ns:
+            return cached_row[2]
+
+        content_hash = compute_content_hash(file_path)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (file_path, file_stat.st_size, file_stat.st_mtime_ns, content_hash)
+            )
+        return content_hash
+
+    # ─── Cache Lookups ───────────────────────────────────────────────────────
+
+    def lookup_analysis(self, content_hash: str) -> Optional[Tuple[int, Tuple[int, ...], Optional[int], int]]:
+        cached_row = self.connection.execute(
+            "SELECT analysis, pages_read FROM extractions "
+            "WHERE content_hash = ? AND analysis IS NOT NULL AND rules_signature = ?",
+            (content_hash, self.rules_signature)
+        ).fetchone()
+        if cached_row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.touch(content_hash)
+        recipient_id, destination_ids, date_ordinal = json.loads(cached_row[0])
+        return recipient_id, tuple(destination_ids), date_ordinal, cached_row[1]
+
+    def lookup_text(self, content_hash: str) -> Optional[str]:
+        cached_row = self.connection.execute(
+            "SELECT document_text FROM extractions WHERE content_hash = ? AND text_complete = 1", (content_hash,)
+        ).fetchone()
+        if cached_row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.touch(content_hash)
+        return cached_row[0]
+
+    def touch(self, content_hash: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE extractions SET last_used = ? WHERE content_hash = ?", (time.time(), content_hash)
+            )
+
+    # ─── Cache Writes ────────────────────────────────────────────────────────
+
+    def store_analysis(
+        self,
+        content_hash: str,
+        analysis_fields: List[Any],
+        document_text: str,
+        pages_read: int,
+        text_complete: bool = False
+    ) -> None:
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO extractions (content_hash, document_text, text_complete, pages_read, analysis, "
+                "rules_signature, entry_bytes, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(content_hash) DO UPDATE SET analysis = excluded.analysis, "
+                "rules_signature = excluded.rules_signature, last_used = excluded.last_used, "
+                "document_text = CASE WHEN text_complete = 1 THEN document_text ELSE excluded.document_text END, "
+                "text_complete = MAX(text_complete, excluded.text_complete), "
+                "pages_read = CASE WHEN text_complete = 1 THEN pages_read ELSE excluded.pages_read END, "
+                "entry_bytes = CASE WHEN text_complete = 1 THEN entry_bytes ELSE excluded.entry_bytes END",
+                (
+                    content_hash, document_text, int(text_complete), pages_read, json.dumps(analysis_fields),
+                    self.rules_signature, len(document_text.encode()), time.time()
+                )
+            )
+
+    def store_text(self, content_hash: str, document_text: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO extractions (content_hash, document_text, text_complete, entry_bytes, last_used) "
+                "VALUES (?, ?, 1, ?, ?) "
+                "ON CONFLICT(content_hash) DO UPDATE SET document_text = excluded.document_text, "
+                "text_complete = 1, entry_bytes = excluded.entry_bytes, last_used = excluded.last_used",
+                (content_hash, document_text, len(document_text.encode()), time.time())
+            )
+
+    # ─── Distribution History for Duplicate Detection ────────────────────────
+
+    def record_distribution(self, content_hash: str, distributed_paths: List[str]) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE extractions SET distributed_paths = ? WHERE content_hash = ?",
+                (json.dumps(distributed_paths), content_hash)
+            )
+
+    def distributed_paths_for(self, content_hash: str) -> List[str]:
+        cached_row = self.connection.execute(
+            "SELECT distributed_paths FROM extractions WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        if cached_row is None or cached_row[0] is None:
+            return []
+        return json.loads(cached_row[0])
+
+    # ─── LRU Eviction ────────────────────────────────────────────────────────
+
+    def evict(self) -> int:
+        total_bytes = self.connection.execute(
+            "SELECT COALESCE(SUM(entry_bytes), 0) FROM extractions"
+        ).fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return 0
+
+        evicted_hashes = []
+        for content_hash, entry_bytes in self.connection.execute(
+            "SELECT content_hash, entry_bytes FROM extractions ORDER BY last_used ASC"
+        ).fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            evicted_hashes.append((content_hash,))
+            total_bytes -= entry_bytes or 0
+
+        with self.connection:
+            self.connection.executemany("DELETE FROM extractions WHERE content_hash = ?", evicted_hashes)
+            self.connection.execute(
+                "DELETE FROM files WHERE content_hash NOT IN (SELECT content_hash FROM extractions)"
+            )
+
+        self.logger.info("Evicted %d extraction cache entries", len(evicted_hashes))
+        return len(evicted_hashes)
+
+    # ─── Close Cache ─────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        self.connection.close()
\ No newline at end of file
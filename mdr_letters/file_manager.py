@@ -2,13 +2,30 @@
 
 import os
 import re
+import mmap
+import shutil
+import hashlib
 import logging
-from datetime import datetime
-from typing import List, Tuple, Optional
+from datetime import date
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Union
 
 # ─── Local Application Imports ──────────────────────────────────────────────
 
-from .config import SUPPORTED_FILE_EXTENSIONS, TEMP_FILE_PREFIX
+from .config import (
+    SUPPORTED_FILE_EXTENSIONS,
+    TEMP_FILE_PREFIX,
+    PARTIAL_FILE_SUFFIX,
+    DISTRIBUTION_BUFFER_LIMIT,
+    INCREMENTAL_SEQUENCING
+)
+from .date_engine import parse_filename_date, sequence_order
+from .async_io import AsyncFileOperations
+from .lock_checker import LockChecker
+from .rename_journal import RenameJournal
+from .directory_index import DirectoryIndex
+from .search_index import SearchIndex
+from .extraction_cache import compute_content_hash
+from .metrics import RunMetrics
 
 # ─── File Management and Organization Utilities ─────────────────────────────
 
@@ -16,17 +33,41 @@ class FileManager:
 
     # ─── Initialize File Manager ──────────────────────────────────────────────
 
-    def __init__(self):
+    def __init__(
+        self,
+        incremental: bool = INCREMENTAL_SEQUENCING,
+        directory_index: Optional[DirectoryIndex] = None,
+        metrics: Optional[RunMetrics] = None,
+        async_io: Optional[AsyncFileOperations] = None,
+        lock_checker: Optional[LockChecker] = None,
+        rename_journal: Optional[RenameJournal] = None,
+        search_index: Optional[SearchIndex] = None
+    ):
         self.logger = logging.getLogger(__name__)
+        self.incremental = incremental
+        self.directory_index = directory_index
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.async_io = async_io if async_io is not None else AsyncFileOperations()
+        self.lock_checker = lock_checker if lock_checker is not None else LockChecker(self.async_io, self.metrics)
+        self.rename_journal = rename_journal if rename_journal is not None else RenameJournal()
+        self.search_index = search_index
+
+    # ─── Walk Files via Index or Filesystem ──────────────────────────────────
+
+    def iter_files(self, root_directory: str) -> Iterator[Tuple[str, str]]:
+        if self.directory_index is not None:
+            for indexed_file in self.directory_index.files_under(root_directory):
+                yield indexed_file["folder"], indexed_file["filename"]
+            return
+
+        for directory_path, _, filenames in os.walk(root_directory):
+            for filename in filenames:
+                yield directory_path, filename
 
     # ─── Extract Date from Filename ───────────────────────────────────────────
 
-    def extract_date_from_filename(self, filename: str) -> Optional[datetime]:
-        try:
-            date_string = filename[filename.find('[') + 1: filename.find(']')]
-            return datetime.strptime(date_string, '%d %B %Y')
-        except (ValueError, IndexError):
-            return None
+    def extract_date_from_filename(self, filename: str) -> Optional[date]:
+        return parse_filename_date(filename)
 
     # ─── Clean Filename Suffixes ─────────────────────────────────────────────
 
@@ -38,114 +79,336 @@ class FileManager:
 
     # ─── File Lock & Availability Checks ─────────────────────────────────────
 
-    def is_file_locked(self, file_path: str) -> bool:
-        try:
-            with open(file_path, 'r+'):
-                return False
-        except IOError:
-            return True
-
     def ensure_all_files_closed(self, directory: str) -> bool:
-        for directory_path, _, filenames in os.walk(directory):
-            for filename in filenames:
-                if filename.lower().endswith(tuple(SUPPORTED_FILE_EXTENSIONS)):
-                    full_file_path = os.path.join(directory_path, filename)
-                    if self.is_file_locked(full_file_path):
-                        self.logger.error("Locked file detected: %s", full_file_path)
-                        return False
-        return True
+        locked_file_paths = self.lock_checker.check_files([
+            os.path.join(directory_path, filename)
+            for directory_path, filename in self.iter_files(directory)
+            if filename.lower().endswith(tuple(SUPPORTED_FILE_EXTENSIONS))
+        ])
+        for locked_file_path in locked_file_paths:
+            self.logger.error("Locked file detected: %s", locked_file_path)
+        return not locked_file_paths
 
-    # ─── Temporary File Cleanup ───────────────────────────────────────────────
+    # ─── Temporary File Recovery ─────────────────────────────────────────────
+
+    def clean_temp_files(self, directory: str) -> Dict[str, str]:
+        restored_filenames: Dict[str, str] = {}
 
-    def clean_temp_files(self, directory: str) -> None:
         for filename in os.listdir(directory):
             if filename.startswith(TEMP_FILE_PREFIX):
                 temp_file_path = os.path.join(directory, filename)
+                restored_file_path = self.ensure_unique_filename(os.path.join(directory, filename[len(TEMP_FILE_PREFIX):]))
                 try:
-                    os.remove(temp_file_path)
-                    self.logger.info("Removed temp file: %s", temp_file_path)
+                    os.rename(temp_file_path, restored_file_path)
+                    self.logger.warning("Restored temp file: %s -> %s", temp_file_path, restored_file_path)
                 except Exception:
-                    self.logger.error("Failed to remove temp file: %s", temp_file_path, exc_info=True)
+                    self.logger.error("Failed to restore temp file: %s", temp_file_path, exc_info=True)
+                    continue
+
+                restored_filenames[filename] = os.path.basename(restored_file_path)
+                if self.directory_index is not None:
+                    self.directory_index.record_rename(temp_file_path, restored_file_path)
+                if self.search_index is not None:
+                    self.search_index.record_rename(temp_file_path, restored_file_path)
+
+        return restored_filenames
+
+    # ─── Interrupted Sequencing Recovery ─────────────────────────────────────
+
+    def recover_interrupted_renames(self, roll_back: bool = False) -> List[str]:
+        recovered_folders = self.rename_journal.recover_all(roll_back=roll_back)
+        if self.directory_index is not None:
+            for recovered_folder in recovered_folders:
+                self.directory_index.refresh(recovered_folder)
+                self.directory_index.clear_folder_sequenced(recovered_folder)
+        if self.search_index is not None:
+            for recovered_folder in recovered_folders:
+                self.search_index.relink_folder(recovered_folder, os.listdir(recovered_folder))
+        return recovered_folders
 
     # ─── Unique Filename Generation ───────────────────────────────────────────
 
-    def ensure_unique_filename(self, file_path: str) -> str:
+    def ensure_unique_filename(self, file_path: str, reserved_paths: Optional[Set[str]] = None) -> str:
         base_name, file_extension = os.path.splitext(file_path)
         counter = 1
         new_file_path = file_path
-        while os.path.exists(new_file_path):
+        while os.path.exists(new_file_path) or (reserved_paths is not None and new_file_path in reserved_paths):
             new_file_path = f"{base_name} ({counter}){file_extension}"
             counter += 1
         return new_file_path
 
-    # ─── Temporary Rename & Number Removal ────────────────────────────────────
+    # ─── Copy-Once Fan-Out Distribution ──────────────────────────────────────
 
-    def temp_rename_for_ordering(self, directory: str) -> None:
-        for filename in os.listdir(directory):
-            if filename.lower().endswith(".pdf") and not filename.startswith(TEMP_FILE_PREFIX):
-                original_file_path = os.path.join(directory, filename)
-
-                if self.is_file_locked(original_file_path):
-                    self.logger.error("File locked during temp rename: %s", original_file_path)
-                    continue
+    def write_verified_copy(
+        self,
+        source_buffer: Union[bytes, mmap.mmap],
+        source_hash: str,
+        source_file_path: str,
+        target_file_path: str
+    ) -> None:
 
-                cleaned_filename = self.remove_leading_sequence(self.remove_google_suffix(filename))
-                temp_file_path = os.path.join(directory, f"{TEMP_FILE_PREFIX}{cleaned_filename}")
-                unique_temp_path = self.ensure_unique_filename(temp_file_path)
-
-                try:
-                    os.rename(original_file_path, unique_temp_path)
-                    self.logger.info("Temp renamed: %s -> %s", original_file_path, unique_temp_path)
-                except Exception:
-                    self.logger.error("Failed temp rename: %s", original_file_path, exc_info=True)
-
-    # ─── Sequential Rename Based on Date ──────────────────────────────────────
-
-    def rename_in_sequence(self, directory: str) -> None:
-        filename_date_pairs: List[Tuple[str, datetime]] = []
-
-        for filename in os.listdir(directory):
-            if filename.startswith(TEMP_FILE_PREFIX):
-                date_object = self.extract_date_from_filename(filename)
-                if date_object:
-                    filename_date_pairs.append((filename, date_object))
-
-        filename_date_pairs.sort(key=lambda x: (x[1], x[0][5:]))
+        partial_file_path = target_file_path + PARTIAL_FILE_SUFFIX
+        try:
+            with open(partial_file_path, 'wb') as partial_file:
+                partial_file.write(source_buffer)
+                partial_file.flush()
+                os.fsync(partial_file.fileno())
+            shutil.copystat(source_file_path, partial_file_path)
+
+            if compute_content_hash(partial_file_path) != source_hash:
+                raise IOError(f"Hash mismatch after copy to {target_file_path}")
+            os.replace(partial_file_path, target_file_path)
+
+        except Exception:
+            if os.path.exists(partial_file_path):
+                os.remove(partial_file_path)
+            raise
+
+    def distribute_file(self, source_file_path: str, target_file_paths: List[str]) -> List[str]:
+        with open(source_file_path, 'rb') as source_file:
+            source_size = os.fstat(source_file.fileno()).st_size
+            if source_size <= DISTRIBUTION_BUFFER_LIMIT:
+                source_buffer = source_file.read()
+            else:
+                source_buffer = mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ)
 
-        for index, (temp_filename, _) in enumerate(filename_date_pairs, start=1):
-            cleaned_name = temp_filename[5:]
-            new_filename = f"{index:02d} {cleaned_name}"
-            old_file_path = os.path.join(directory, temp_filename)
-            new_file_path = os.path.join(directory, new_filename)
+        try:
+            source_hash = hashlib.sha256(source_buffer).hexdigest()
+            copy_outcomes = self.async_io.run_all([
+                (self.write_verified_copy, (source_buffer, source_hash, source_file_path, target_file_path))
+                for target_file_path in target_file_paths
+            ])
+
+            written_paths = []
+            for target_file_path, copy_outcome in zip(target_file_paths, copy_outcomes):
+                if isinstance(copy_outcome, Exception):
+                    self.logger.error("Failed to distribute file to %s", target_file_path, exc_info=copy_outcome)
+                    continue
+                written_paths.append(target_file_path)
+                self.logger.debug("Distributed file to: %s", target_file_path)
+
+        finally:
+            if isinstance(source_buffer, mmap.mmap):
+                source_buffer.close()
+
+        # ─── All-or-Nothing Completion ───────────────────────────────────────
+
+        if len(written_paths) != len(target_file_paths):
+            for written_path in written_paths:
+                os.remove(written_path)
+            self.logger.error("Distribution rolled back, source kept: %s", source_file_path)
+            return []
+
+        os.remove(source_file_path)
+        self.metrics.increment("files_distributed")
+        self.metrics.increment("bytes_distributed", source_size)
+        self.metrics.increment("copies", len(written_paths))
+        self.metrics.increment("bytes_copied", source_size * len(written_paths))
+        return written_paths
+
+    # ─── Compute Target Sequence In Memory ───────────────────────────────────
+
+    def compute_sequence_plan(self, directory: str, filenames: List[str]) -> Dict[str, str]:
+        cleaned_filenames = {
+            filename: self.remove_leading_sequence(self.remove_google_suffix(filename))
+            for filename in filenames
+            if filename.lower().endswith(".pdf") and not filename.startswith(TEMP_FILE_PREFIX)
+        }
+
+        rename_plan: Dict[str, str] = {}
+        for index, (filename, cleaned_filename) in enumerate(sequence_order(cleaned_filenames), start=1):
+            target_filename = f"{index:02d} {cleaned_filename}"
+            if target_filename != filename:
+                rename_plan[filename] = target_filename
+        return rename_plan
+
+    # ─── Execute Minimal Rename Plan ─────────────────────────────────────────
+
+    def has_unplanned_target(self, directory: str, rename_plan: Dict[str, str], existing_filenames: List[str]) -> bool:
+        for target_filename in rename_plan.values():
+            if target_filename in existing_filenames and target_filename not in rename_plan:
+                self.logger.error("Sequence target already taken by an unplanned file: %s in %s", target_filename, directory)
+                return True
+        return False
+
+    def order_rename_steps(self, directory: str, rename_plan: Dict[str, str]) -> List[Tuple[str, str]]:
+        pending_renames = dict(rename_plan)
+        rename_steps: List[Tuple[str, str]] = []
+
+        while pending_renames:
+            ready_renames = [
+                (filename, target_filename) for filename, target_filename in pending_renames.items()
+                if target_filename not in pending_renames
+            ]
+
+            # ─── Break Rename Cycles via a Temporary Name ────────────────────
+
+            if not ready_renames:
+                filename, target_filename = next(iter(pending_renames.items()))
+                temp_filename = os.path.basename(self.ensure_unique_filename(
+                    os.path.join(directory, f"{TEMP_FILE_PREFIX}{filename}"),
+                    {os.path.join(directory, planned_filename) for planned_filename in pending_renames}
+                ))
+                ready_renames = [(filename, temp_filename)]
+                pending_renames[temp_filename] = target_filename
+
+            for filename, target_filename in ready_renames:
+                rename_steps.append((filename, target_filename))
+                del pending_renames[filename]
+
+        return rename_steps
+
+    # ─── Apply Renames Under the Write-Ahead Journal ─────────────────────────
+
+    def apply_rename_plan(self, directory: str, rename_plan: Dict[str, str]) -> Tuple[bool, List[Tuple[str, str]]]:
+        rename_steps = self.order_rename_steps(directory, rename_plan)
+        completed_renames: List[Tuple[str, str]] = []
+        self.rename_journal.begin(directory, rename_steps)
+
+        for step_index, (filename, target_filename) in enumerate(rename_steps):
+            old_file_path = os.path.join(directory, filename)
+            new_file_path = os.path.join(directory, target_filename)
             try:
                 os.rename(old_file_path, new_file_path)
-                self.logger.info("Renamed for sequence: %s -> %s", old_file_path, new_file_path)
+                self.logger.debug("Renamed for sequence: %s -> %s", old_file_path, new_file_path)
             except Exception:
                 self.logger.error("Sequence rename failed: %s", old_file_path, exc_info=True)
+                self.rename_journal.finish(directory, completed=False)
+                if self.rename_journal.recover(self.rename_journal.journal_path(directory), roll_back=True):
+                    return False, []
+                return False, completed_renames
+
+            self.rename_journal.mark_done(directory, step_index)
+            completed_renames.append((old_file_path, new_file_path))
+
+        self.rename_journal.finish(directory)
+        return True, completed_renames
+
+    def record_renames(self, completed_renames: List[Tuple[str, str]]) -> None:
+        self.metrics.increment("renames", len(completed_renames))
+        if self.directory_index is not None:
+            for old_file_path, new_file_path in completed_renames:
+                self.directory_index.record_rename(old_file_path, new_file_path)
+        if self.search_index is not None:
+            for old_file_path, new_file_path in completed_renames:
+                self.search_index.record_rename(old_file_path, new_file_path)
+        for old_file_path, new_file_path in completed_renames:
+            self.lock_checker.record_moved(old_file_path, new_file_path)
+
+    def execute_rename_plan(self, directory: str, rename_plan: Dict[str, str], existing_filenames: List[str]) -> bool:
+        if self.has_unplanned_target(directory, rename_plan, existing_filenames):
+            return False
+
+        locked_file_paths = self.lock_checker.check_files([os.path.join(directory, filename) for filename in rename_plan])
+        for locked_file_path in locked_file_paths:
+            self.logger.error("File locked during sequencing, folder skipped: %s", locked_file_path)
+        if locked_file_paths:
+            return False
+
+        completed, completed_renames = self.apply_rename_plan(directory, rename_plan)
+        self.record_renames(completed_renames)
+        return completed
 
     # ─── Process Single Folder ───────────────────────────────────────────────
 
     def process_folder(self, directory: str) -> None:
-        self.clean_temp_files(directory)
-        self.temp_rename_for_ordering(directory)
-        self.rename_in_sequence(directory)
-        self.logger.info("Folder processed: %s", directory)
+        if self.process_folder_incremental(directory, os.listdir(directory)):
+            self.logger.info("Folder processed: %s", directory)
+
+    def prepare_sequence_plan(self, directory: str, filenames: List[str]) -> Tuple[Dict[str, str], List[str]]:
+        if any(filename.startswith(TEMP_FILE_PREFIX) for filename in filenames):
+            restored_filenames = self.clean_temp_files(directory)
+            filenames = [
+                restored_filenames.get(filename, filename) for filename in filenames
+                if not filename.startswith(TEMP_FILE_PREFIX) or filename in restored_filenames
+            ]
+
+        return self.compute_sequence_plan(directory, filenames), filenames
+
+    def process_folder_incremental(self, directory: str, filenames: List[str]) -> bool:
+        return self.sequence_folders({directory: filenames})[directory]
+
+    # ─── Sequence Independent Folders Concurrently ───────────────────────────
+
+    def sequence_folders(self, folder_filenames: Dict[str, List[str]]) -> Dict[str, bool]:
+        folder_results: Dict[str, bool] = {}
+        folder_plans: Dict[str, Dict[str, str]] = {}
+
+        for directory, filenames in folder_filenames.items():
+            if self.rename_journal.has_pending(directory):
+                self.logger.error("Unrecovered rename journal for folder, skipped: %s", directory)
+                folder_results[directory] = False
+                continue
+
+            rename_plan, filenames = self.prepare_sequence_plan(directory, filenames)
+            if not rename_plan:
+                self.logger.debug("Folder already in sequence: %s", directory)
+                folder_results[directory] = True
+            elif self.has_unplanned_target(directory, rename_plan, filenames):
+                folder_results[directory] = False
+            else:
+                folder_plans[directory] = rename_plan
+
+        # ─── Probe Locks Across All Planned Folders at Once ──────────────────
+
+        for locked_file_path in self.lock_checker.check_files([
+            os.path.join(directory, filename) for directory, rename_plan in folder_plans.items() for filename in rename_plan
+        ]):
+            self.logger.error("File locked during sequencing, folder skipped: %s", locked_file_path)
+            folder_results[os.path.dirname(locked_file_path)] = False
+            folder_plans.pop(os.path.dirname(locked_file_path), None)
+
+        # ─── Rename Folders in Parallel, Each in Dependency Order ────────────
+
+        planned_folders = list(folder_plans.items())
+        rename_outcomes = self.async_io.run_all([(self.apply_rename_plan, planned_folder) for planned_folder in planned_folders])
+
+        for (directory, rename_plan), rename_outcome in zip(planned_folders, rename_outcomes):
+            if isinstance(rename_outcome, Exception):
+                self.logger.error("Sequencing failed for folder: %s", directory, exc_info=rename_outcome)
+                folder_results[directory] = False
+                continue
+
+            completed, completed_renames = rename_outcome
+            self.record_renames(completed_renames)
+            self.metrics.increment("folders_resequenced")
+            self.logger.info("Folder resequenced with %d rename(s): %s", len(rename_plan), directory)
+            folder_results[directory] = completed
+
+        return folder_results
 
     # ─── Recursive Directory Processing ──────────────────────────────────────
 
     def process_directory_with_subfolders(self, root_directory: str) -> None:
-        for directory_path, _, filenames in os.walk(root_directory):
-            if filenames:
-                self.process_folder(directory_path)
+        if not self.incremental or self.directory_index is None:
+            self.sequence_folders({
+                directory_path: filenames for directory_path, _, filenames in os.walk(root_directory) if filenames
+            })
+            if self.directory_index is not None:
+                self.directory_index.refresh(root_directory, full_rescan=True)
+            return
+
+        folder_filenames: Dict[str, List[str]] = {}
+        for directory_path in self.directory_index.folders_with_files(root_directory):
+            if self.directory_index.is_folder_sequenced(directory_path):
+                self.logger.debug("Folder unchanged since last run, skipped: %s", directory_path)
+                self.metrics.increment("folders_skipped")
+                continue
+            folder_filenames[directory_path] = self.directory_index.filenames_in(directory_path)
+
+        for directory_path, completed in self.sequence_folders(folder_filenames).items():
+            if completed:
+                self.directory_index.mark_folder_sequenced(directory_path)
+            else:
+                self.directory_index.clear_folder_sequenced(directory_path)
 
     # ─── Validate Filename Dates ──────────────────────────────────────────────
 
     def validate_dates_in_filenames(self, root_directory: str) -> bool:
         is_valid = True
-        for directory_path, _, filenames in os.walk(root_directory):
-            for filename in filenames:
-                if filename.lower().endswith(".pdf") and not filename.startswith(TEMP_FILE_PREFIX):
-                    if self.extract_date_from_filename(filename) is None:
-                        self.logger.error("Missing date in filename: %s in %s", filename, directory_path)
-                        is_valid = False
+        for directory_path, filename in self.iter_files(root_directory):
+            if filename.lower().endswith(".pdf") and not filename.startswith(TEMP_FILE_PREFIX):
+                if self.extract_date_from_filename(filename) is None:
+                    self.logger.error("Missing date in filename: %s in %s", filename, directory_path)
+                    is_valid = False
         return is_valid
\ No newline at end of file
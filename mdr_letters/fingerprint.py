@@ -0,0 +1,216 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import re
+import heapq
+import sqlite3
+import hashlib
+import logging
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import (
+    FINGERPRINT_INDEX_PATH,
+    FINGERPRINT_SHINGLE_WORDS,
+    FINGERPRINT_SKETCH_SIZE,
+    NEAR_DUPLICATE_THRESHOLD
+)
+
+# ─── Shingled Bottom-k MinHash Sketch ────────────────────────────────────────
+
+WORD_PATTERN = re.compile(r'\w+')
+
+class LetterFingerprint:
+
+    __slots__ = ("text_hash", "sketch")
+
+    def __init__(self, text_hash: str, sketch: array):
+        self.text_hash = text_hash
+        self.sketch = sketch
+
+def hash_shingle(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+def fingerprint_text(
+    document_text: str,
+    shingle_words: int = FINGERPRINT_SHINGLE_WORDS,
+    sketch_size: int = FINGERPRINT_SKETCH_SIZE
+) -> Optional[LetterFingerprint]:
+
+    words = WORD_PATTERN.findall(document_text.lower())
+    if len(words) < shingle_words:
+        return None
+    text_hash = hashlib.sha256(" ".join(words).encode("utf-8")).hexdigest()
+    shingle_hashes = {
+        hash_shingle(" ".join(words[index:index + shingle_words]))
+        for index in range(len(words) - shingle_words + 1)
+    }
+    return LetterFingerprint(text_hash, array("Q", sorted(heapq.nsmallest(sketch_size, shingle_hashes))))
+
+def estimate_similarity(first_sketch: Sequence[int], second_sketch: Sequence[int], sketch_size: int) -> float:
+    shared_hashes = set(first_sketch).intersection(second_sketch)
+    union_sketch = heapq.nsmallest(sketch_size, set(first_sketch).union(second_sketch))
+    if not union_sketch:
+        return 0.0
+    return sum(1 for shingle_hash in union_sketch if shingle_hash in shared_hashes) / len(union_sketch)
+
+# ─── Duplicate Match ─────────────────────────────────────────────────────────
+
+class DuplicateMatch:
+
+    __slots__ = ("text_hash", "similarity", "exact", "paths")
+
+    def __init__(self, text_hash: str, similarity: float, exact: bool):
+        self.text_hash = text_hash
+        self.similarity = similarity
+        self.exact = exact
+        self.paths: List[str] = []
+
+# ─── In-Memory Recipient/Year Partition ──────────────────────────────────────
+
+class FingerprintPartition:
+
+    def __init__(self):
+        self.sketches: Dict[str, array] = {}
+        self.dates: Dict[str, Optional[int]] = {}
+        self.postings: Dict[int, List[str]] = {}
+
+    def add(self, letter_fingerprint: LetterFingerprint, date_ordinal: Optional[int]) -> None:
+        self.sketches[letter_fingerprint.text_hash] = letter_fingerprint.sketch
+        self.dates[letter_fingerprint.text_hash] = date_ordinal
+        for shingle_hash in letter_fingerprint.sketch:
+            self.postings.setdefault(shingle_hash, []).append(letter_fingerprint.text_hash)
+
+# ─── Persistent Fingerprint Index ────────────────────────────────────────────
+
+class FingerprintIndex:
+
+    # ─── Initialize Fingerprint Index ────────────────────────────────────────
+
+    def __init__(
+        self,
+        index_path: str = str(FINGERPRINT_INDEX_PATH),
+        near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        sketch_size: int = FINGERPRINT_SKETCH_SIZE
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.index_path = index_path
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.sketch_size = sketch_size
+        self.partitions: Dict[Tuple[str, str], FingerprintPartition] = {}
+
+        os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(index_path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                "recipient TEXT, year TEXT, text_hash TEXT, sketch BLOB, date_ordinal INTEGER, "
+                "PRIMARY KEY (recipient, year, text_hash))"
+            )
+            indexed_columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(fingerprints)")}
+            if "date_ordinal" not in indexed_columns:
+                self.connection.execute("ALTER TABLE fingerprints ADD COLUMN date_ordinal INTEGER")
+
+    # ─── Load Partitions on First Use ────────────────────────────────────────
+
+    def partition_for(self, recipient: str, year: str) -> FingerprintPartition:
+        partition = self.partitions.get((recipient, year))
+        if partition is not None:
+            return partition
+
+        partition = FingerprintPartition()
+        for stored_fingerprint in self.connection.execute(
+            "SELECT text_hash, sketch, date_ordinal FROM fingerprints WHERE recipient = ? AND year = ?", (recipient, year)
+        ):
+            stored_sketch = array("Q")
+            stored_sketch.frombytes(stored_fingerprint["sketch"])
+            partition.add(
+                LetterFingerprint(stored_fingerprint["text_hash"], stored_sketch), stored_fingerprint["date_ordinal"]
+            )
+        self.partitions[(recipient, year)] = partition
+        return partition
+
+    # ─── Exact & Near-Duplicate Lookup ───────────────────────────────────────
+
+    def find_duplicate(
+        self,
+        letter_fingerprint: LetterFingerprint,
+        recipient: str,
+        year: str,
+        date_ordinal: Optional[int]
+    ) -> Optional[DuplicateMatch]:
+        return self.find_in_partition(letter_fingerprint, self.partition_for(recipient, year), date_ordinal)
+
+    def find_in_partition(
+        self,
+        letter_fingerprint: LetterFingerprint,
+        partition: FingerprintPartition,
+        date_ordinal: Optional[int]
+    ) -> Optional[DuplicateMatch]:
+
+        if letter_fingerprint.text_hash in partition.sketches and partition.dates[letter_fingerprint.text_hash] == date_ordinal:
+            return DuplicateMatch(letter_fingerprint.text_hash, 1.0, True)
+
+        shared_counts = Counter(
+            text_hash
+            for shingle_hash in letter_fingerprint.sketch
+            for text_hash in partition.postings.get(shingle_hash, ())
+        )
+        best_match: Optional[Tuple[float, str]] = None
+        for text_hash, shared_count in shared_counts.most_common():
+            if shared_count < self.near_duplicate_threshold * len(letter_fingerprint.sketch):
+                break
+            if partition.dates[text_hash] != date_ordinal:
+                continue
+            candidate_sketch = partition.sketches[text_hash]
+            if shared_count < self.near_duplicate_threshold * len(candidate_sketch):
+                continue
+            similarity = estimate_similarity(letter_fingerprint.sketch, candidate_sketch, self.sketch_size)
+            if similarity >= self.near_duplicate_threshold and (best_match is None or similarity > best_match[0]):
+                best_match = (similarity, text_hash)
+
+        if best_match is None:
+            return None
+        return DuplicateMatch(best_match[1], best_match[0], False)
+
+    # ─── Record & Forget Fingerprints ────────────────────────────────────────
+
+    def add(self, letter_fingerprint: LetterFingerprint, recipient: str, year: str, date_ordinal: Optional[int]) -> None:
+        partition = self.partition_for(recipient, year)
+        if letter_fingerprint.text_hash in partition.sketches:
+            return
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO fingerprints (recipient, year, text_hash, sketch, date_ordinal) VALUES (?, ?, ?, ?, ?)",
+                (recipient, year, letter_fingerprint.text_hash, letter_fingerprint.sketch.tobytes(), date_ordinal)
+            )
+        partition.add(letter_fingerprint, date_ordinal)
+
+    def forget(self, recipient: str, year: str, text_hash: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM fingerprints WHERE recipient = ? AND year = ? AND text_hash = ?", (recipient, year, text_hash)
+            )
+        self.partitions.pop((recipient, year), None)
+
+    def prune(self, filed_text_hashes: Set[str]) -> int:
+        orphaned_fingerprints = [
+            (row["recipient"], row["year"], row["text_hash"])
+            for row in self.connection.execute("SELECT recipient, year, text_hash FROM fingerprints")
+            if row["text_hash"] not in filed_text_hashes
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM fingerprints WHERE recipient = ? AND year = ? AND text_hash = ?", orphaned_fingerprints
+            )
+        self.partitions.clear()
+        return len(orphaned_fingerprints)
+
+    # ─── Close Index ─────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        self.connection.close()
\ No newline at end of file
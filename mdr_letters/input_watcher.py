@@ -0,0 +1,203 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import time
+import queue
+import logging
+from typing import Dict, List, Optional, Tuple
+
+# ─── Optional Third-Party Libraries ──────────────────────────────────────────
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import (
+    INPUT_DIRECTORY,
+    WATCH_POLL_INTERVAL_SECONDS,
+    WATCH_STABLE_SECONDS,
+    WATCH_DEBOUNCE_SECONDS
+)
+from .document_processor import DocumentProcessor
+
+# ─── Native Filesystem Event Handler ─────────────────────────────────────────
+
+class InputEventHandler(FileSystemEventHandler):
+
+    def __init__(self, event_queue: queue.Queue):
+        super().__init__()
+        self.event_queue = event_queue
+
+    def on_created(self, event) -> None:
+        if not event.is_directory:
+            self.event_queue.put(event.src_path)
+
+    def on_modified(self, event) -> None:
+        if not event.is_directory:
+            self.event_queue.put(event.src_path)
+
+    def on_moved(self, event) -> None:
+        if not event.is_directory:
+            self.event_queue.put(event.dest_path)
+
+# ─── Input Directory Watcher ─────────────────────────────────────────────────
+
+class InputWatcher:
+
+    # ─── Initialize Input Watcher ────────────────────────────────────────────
+
+    def __init__(
+        self,
+        document_processor: DocumentProcessor,
+        input_directory: str = INPUT_DIRECTORY,
+        poll_interval: float = WATCH_POLL_INTERVAL_SECONDS,
+        stable_seconds: float = WATCH_STABLE_SECONDS,
+        debounce_seconds: float = WATCH_DEBOUNCE_SECONDS
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.document_processor = document_processor
+        self.input_directory = input_directory
+        self.poll_interval = poll_interval
+        self.stable_seconds = stable_seconds
+        self.debounce_seconds = debounce_seconds
+
+        self.event_queue: queue.Queue = queue.Queue()
+        self.candidate_files: Dict[str, Tuple[int, int, float]] = {}
+        self.handled_files: Dict[str, Tuple[int, int]] = {}
+        self.last_activity_time = 0.0
+        self.observer = None
+
+    # ─── Start Native Observer or Fall Back to Polling ───────────────────────
+
+    def start_observer(self) -> bool:
+        if Observer is None:
+            self.logger.info("watchdog not installed, polling %s every %.1fs", self.input_directory, self.poll_interval)
+            return False
+
+        try:
+            self.observer = Observer()
+            self.observer.schedule(InputEventHandler(self.event_queue), self.input_directory, recursive=False)
+            self.observer.start()
+        except Exception:
+            self.logger.warning("Native file watching unavailable, falling back to polling", exc_info=True)
+            self.observer = None
+            return False
+
+        self.logger.info("Watching %s for new PDFs", self.input_directory)
+        return True
+
+    def stop_observer(self) -> None:
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    # ─── Discover Candidate PDFs ─────────────────────────────────────────────
+
+    def scan_input_directory(self) -> None:
+        try:
+            with os.scandir(self.input_directory) as input_entries:
+                for input_entry in input_entries:
+                    if input_entry.is_file():
+                        self.event_queue.put(input_entry.path)
+        except OSError:
+            self.logger.error("Failed to scan input directory: %s", self.input_directory, exc_info=True)
+
+    def drain_events(self, now: float) -> None:
+        while True:
+            try:
+                file_path = self.event_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if not file_path.lower().endswith(".pdf") or file_path in self.candidate_files:
+                continue
+            self.candidate_files[file_path] = (-1, -1, now)
+
+    # ─── Wait for Completed Downloads ────────────────────────────────────────
+
+    def collect_ready_files(self, now: float) -> List[str]:
+        ready_files = []
+
+        for file_path, (last_size, last_mtime, stable_since) in list(self.candidate_files.items()):
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                del self.candidate_files[file_path]
+                continue
+
+            file_signature = (file_stat.st_size, file_stat.st_mtime_ns)
+            if self.handled_files.get(file_path) == file_signature:
+                del self.candidate_files[file_path]
+                continue
+
+            if file_signature != (last_size, last_mtime):
+                self.candidate_files[file_path] = (file_stat.st_size, file_stat.st_mtime_ns, now)
+                self.last_activity_time = now
+                continue
+
+            if now - stable_since >= self.stable_seconds and file_stat.st_size > 0:
+                if self.document_processor.lock_checker.is_locked(file_path, refresh=True):
+                    continue
+                ready_files.append(file_path)
+
+        return ready_files
+
+    # ─── Process a Debounced Batch ───────────────────────────────────────────
+
+    def process_ready_files(self, ready_files: List[str]) -> None:
+        present_files = []
+        for file_path in ready_files:
+            del self.candidate_files[file_path]
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                self.logger.warning("PDF disappeared before processing: %s", file_path)
+                continue
+            self.handled_files[file_path] = (file_stat.st_size, file_stat.st_mtime_ns)
+            present_files.append(file_path)
+
+        if not present_files:
+            return
+        self.logger.info("Processing %d new PDF(s) from watch mode", len(present_files))
+        summary = self.document_processor.process_input_pdfs(sorted(present_files))
+
+        for file_path in summary.processed:
+            self.handled_files.pop(file_path, None)
+
+        affected_folders = [os.path.dirname(distributed_path) for distributed_path in summary.distributed_paths]
+        self.document_processor.organize_folders(affected_folders)
+
+    # ─── Run Watch Loop ──────────────────────────────────────────────────────
+
+    def run(self, max_iterations: Optional[int] = None) -> None:
+        self.document_processor.recover_interrupted_renames()
+        using_observer = self.start_observer()
+        self.scan_input_directory()
+        iteration = 0
+
+        try:
+            while max_iterations is None or iteration < max_iterations:
+                iteration += 1
+                now = time.monotonic()
+
+                if not using_observer and iteration > 1:
+                    self.scan_input_directory()
+                self.drain_events(now)
+
+                ready_files = self.collect_ready_files(now)
+                if ready_files and now - self.last_activity_time >= self.debounce_seconds:
+                    self.process_ready_files(ready_files)
+
+                time.sleep(self.poll_interval)
+
+        except KeyboardInterrupt:
+            self.logger.info("Watch mode stopped")
+
+        finally:
+            self.stop_observer()
\ No newline at end of file
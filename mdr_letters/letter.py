@@ -0,0 +1,66 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import OUTPUT_DIRECTORIES, RECIPIENT_ROUTING_RULES, DEFAULT_RECIPIENT_RULE
+from .date_engine import format_date
+
+# ─── Recipient & Destination Ids ─────────────────────────────────────────────
+
+DEFAULT_RECIPIENT_ID = len(RECIPIENT_ROUTING_RULES)
+
+def routing_rule_for(recipient_id: int) -> Dict[str, Any]:
+    return DEFAULT_RECIPIENT_RULE if recipient_id == DEFAULT_RECIPIENT_ID else RECIPIENT_ROUTING_RULES[recipient_id]
+
+def destination_ids_for(recipient_id: int) -> Tuple[int, ...]:
+    return tuple(OUTPUT_DIRECTORIES.index(destination) for destination in routing_rule_for(recipient_id)["destinations"])
+
+# ─── Compact Letter Record ───────────────────────────────────────────────────
+
+class Letter:
+
+    __slots__ = ("path", "size", "content_hash", "date_ordinal", "recipient_id", "destination_ids", "pages_read")
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        content_hash: Optional[str],
+        date_ordinal: Optional[int],
+        recipient_id: int,
+        destination_ids: Tuple[int, ...],
+        pages_read: int = 0
+    ):
+        self.path = path
+        self.size = size
+        self.content_hash = content_hash
+        self.date_ordinal = date_ordinal
+        self.recipient_id = recipient_id
+        self.destination_ids = destination_ids
+        self.pages_read = pages_read
+
+    # ─── Resolve Ids Back to Names ───────────────────────────────────────────
+
+    @property
+    def recipient_name(self) -> str:
+        return routing_rule_for(self.recipient_id)["recipient"]
+
+    @property
+    def destination_directories(self) -> List[str]:
+        return [OUTPUT_DIRECTORIES[destination_id] for destination_id in self.destination_ids]
+
+    @property
+    def formatted_date(self) -> str:
+        return format_date(date.fromordinal(self.date_ordinal)) if self.date_ordinal is not None else "Unknown Date"
+
+    @property
+    def year(self) -> str:
+        return str(date.fromordinal(self.date_ordinal).year) if self.date_ordinal is not None else "Unknown"
+
+    # ─── Cached Analysis Fields ──────────────────────────────────────────────
+
+    def analysis_fields(self) -> List[Any]:
+        return [self.recipient_id, list(self.destination_ids), self.date_ordinal]
\ No newline at end of file
@@ -0,0 +1,104 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import (
+    LOCK_CACHE_TTL_SECONDS,
+    OFFICE_OWNER_FILE_PREFIX,
+    OFFICE_FILE_EXTENSIONS,
+    UNPROBED_FILE_EXTENSIONS
+)
+from .async_io import AsyncFileOperations
+from .metrics import RunMetrics
+
+# ─── Batched File Lock Detection ─────────────────────────────────────────────
+
+class LockChecker:
+
+    # ─── Initialize Lock Checker ─────────────────────────────────────────────
+
+    def __init__(
+        self,
+        async_io: Optional[AsyncFileOperations] = None,
+        metrics: Optional[RunMetrics] = None,
+        ttl_seconds: float = LOCK_CACHE_TTL_SECONDS
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.async_io = async_io if async_io is not None else AsyncFileOperations()
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.ttl_seconds = ttl_seconds
+        self.lock_states: Dict[str, Tuple[bool, float]] = {}
+
+    # ─── Cheap Lock Signals ──────────────────────────────────────────────────
+
+    def owner_file_paths(self, file_path: str) -> List[str]:
+        directory, filename = os.path.split(file_path)
+        return [
+            os.path.join(directory, OFFICE_OWNER_FILE_PREFIX + filename),
+            os.path.join(directory, OFFICE_OWNER_FILE_PREFIX + filename[2:])
+        ]
+
+    def cheap_lock_state(self, file_path: str) -> Optional[bool]:
+        filename = os.path.basename(file_path)
+        file_extension = os.path.splitext(filename)[1].lower()
+
+        if filename.startswith(OFFICE_OWNER_FILE_PREFIX) or file_extension in UNPROBED_FILE_EXTENSIONS:
+            return False
+        if file_extension in OFFICE_FILE_EXTENSIONS and any(
+            os.path.exists(owner_file_path) for owner_file_path in self.owner_file_paths(file_path)
+        ):
+            self.metrics.increment("lock_owner_files")
+            return True
+        return None
+
+    # ─── Read-Write Open Probe ───────────────────────────────────────────────
+
+    def probe(self, file_path: str) -> bool:
+        try:
+            with open(file_path, 'r+'):
+                return False
+        except IOError:
+            return True
+
+    # ─── Check a Batch of Files ──────────────────────────────────────────────
+
+    def check_files(self, file_paths: List[str], refresh: bool = False) -> List[str]:
+        now = time.monotonic()
+        files_to_probe = []
+
+        for file_path in file_paths:
+            cached_state = self.lock_states.get(file_path)
+            if not refresh and cached_state is not None and now - cached_state[1] < self.ttl_seconds:
+                self.metrics.increment("lock_cache_hits")
+                continue
+
+            cheap_state = self.cheap_lock_state(file_path)
+            if cheap_state is not None:
+                self.lock_states[file_path] = (cheap_state, now)
+            else:
+                files_to_probe.append(file_path)
+
+        if files_to_probe:
+            self.metrics.increment("lock_probes", len(files_to_probe))
+            for file_path, probe_outcome in zip(files_to_probe, self.async_io.map(self.probe, files_to_probe)):
+                self.lock_states[file_path] = (probe_outcome is not False, now)
+
+        return [file_path for file_path in file_paths if self.lock_states[file_path][0]]
+
+    def is_locked(self, file_path: str, refresh: bool = False) -> bool:
+        return bool(self.check_files([file_path], refresh=refresh))
+
+    # ─── Keep Cached States in Step with Our Own Changes ─────────────────────
+
+    def record_moved(self, old_file_path: str, new_file_path: str) -> None:
+        cached_state = self.lock_states.pop(old_file_path, None)
+        if cached_state is not None:
+            self.lock_states[new_file_path] = cached_state
+
+    def forget(self, file_path: str) -> None:
+        self.lock_states.pop(file_path, None)
\ No newline at end of file
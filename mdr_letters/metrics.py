@@ -0,0 +1,149 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import json
+import time
+import cProfile
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import LOGS_DIRECTORY, METRICS_PREFIX
+
+# ─── Run Metrics Collection ──────────────────────────────────────────────────
+
+class RunMetrics:
+
+    # ─── Initialize Run Metrics ──────────────────────────────────────────────
+
+    def __init__(self, profiled_stages: Optional[Iterable[str]] = None, report_directory: str = str(LOGS_DIRECTORY)):
+        self.logger = logging.getLogger(__name__)
+        self.report_directory = report_directory
+        self.profiled_stages = set(profiled_stages or ())
+        self.started_at = datetime.now()
+        self.run_label = self.started_at.strftime("%Y%m%d_%H%M%S")
+
+        self.stage_timings: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.profile_paths: Dict[str, str] = {}
+        self.active_profiler: Optional[cProfile.Profile] = None
+
+    # ─── Counters ────────────────────────────────────────────────────────────
+
+    def increment(self, counter_name: str, amount: int = 1) -> None:
+        self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
+
+    def add_counts(self, counts: Dict[str, int], prefix: str = "") -> None:
+        for counter_name, amount in counts.items():
+            self.increment(f"{prefix}{counter_name}", amount)
+
+    # ─── Stage Timing with Optional Profiling ────────────────────────────────
+
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        profiler = None
+        if self.active_profiler is None and (stage_name in self.profiled_stages or "all" in self.profiled_stages):
+            profiler = cProfile.Profile()
+            self.active_profiler = profiler
+            profiler.enable()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.process_time() - cpu_start
+
+            if profiler is not None:
+                profiler.disable()
+                self.active_profiler = None
+                self.save_profile(stage_name, profiler)
+
+            stage_timing = self.stage_timings.setdefault(stage_name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "calls": 0})
+            stage_timing["wall_seconds"] += wall_seconds
+            stage_timing["cpu_seconds"] += cpu_seconds
+            stage_timing["calls"] += 1
+
+    def save_profile(self, stage_name: str, profiler: cProfile.Profile) -> None:
+        profile_path = os.path.join(self.report_directory, f"profile_{stage_name}_{self.run_label}.prof")
+        try:
+            os.makedirs(self.report_directory, exist_ok=True)
+            profiler.dump_stats(profile_path)
+            self.profile_paths[stage_name] = profile_path
+            self.logger.info("Profile for stage '%s' written to %s", stage_name, profile_path)
+        except OSError:
+            self.logger.error("Failed to write profile for stage: %s", stage_name, exc_info=True)
+
+    # ─── Build Run Report ────────────────────────────────────────────────────
+
+    def build_report(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "stages": {
+                stage_name: {
+                    "wall_seconds": round(stage_timing["wall_seconds"], 6),
+                    "cpu_seconds": round(stage_timing["cpu_seconds"], 6),
+                    "calls": stage_timing["calls"]
+                }
+                for stage_name, stage_timing in self.stage_timings.items()
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "profiles": self.profile_paths
+        }
+
+    def log_summary(self) -> None:
+        for stage_name, stage_timing in self.stage_timings.items():
+            self.logger.info(
+                "Stage %s - Wall: %.3fs, CPU: %.3fs", stage_name, stage_timing["wall_seconds"], stage_timing["cpu_seconds"]
+            )
+        self.logger.info(
+            "Run counters - %s", ", ".join(f"{name}: {value}" for name, value in sorted(self.counters.items()))
+        )
+
+    # ─── Write JSON & Prometheus Reports ─────────────────────────────────────
+
+    def write_json_report(self) -> Optional[str]:
+        report_path = os.path.join(self.report_directory, f"run_report_{self.run_label}.json")
+        try:
+            os.makedirs(self.report_directory, exist_ok=True)
+            with open(report_path, 'w', encoding='utf-8') as report_file:
+                json.dump(self.build_report(), report_file, indent=2)
+        except OSError:
+            self.logger.error("Failed to write run report: %s", report_path, exc_info=True)
+            return None
+
+        self.logger.info("Run report written to %s", report_path)
+        return report_path
+
+    def write_prometheus_textfile(self, textfile_path: str) -> None:
+        metric_lines = [
+            f"# TYPE {METRICS_PREFIX}_stage_wall_seconds gauge",
+            f"# TYPE {METRICS_PREFIX}_stage_cpu_seconds gauge"
+        ]
+        for stage_name, stage_timing in self.stage_timings.items():
+            metric_lines.append(f'{METRICS_PREFIX}_stage_wall_seconds{{stage="{stage_name}"}} {stage_timing["wall_seconds"]:.6f}')
+            metric_lines.append(f'{METRICS_PREFIX}_stage_cpu_seconds{{stage="{stage_name}"}} {stage_timing["cpu_seconds"]:.6f}')
+
+        for counter_name, value in sorted(self.counters.items()):
+            metric_lines.append(f"# TYPE {METRICS_PREFIX}_{counter_name} gauge")
+            metric_lines.append(f"{METRICS_PREFIX}_{counter_name} {value}")
+
+        metric_lines.append(f"# TYPE {METRICS_PREFIX}_last_run_timestamp_seconds gauge")
+        metric_lines.append(f"{METRICS_PREFIX}_last_run_timestamp_seconds {time.time():.0f}")
+
+        temp_textfile_path = textfile_path + ".temp"
+        try:
+            os.makedirs(os.path.dirname(textfile_path) or ".", exist_ok=True)
+            with open(temp_textfile_path, 'w', encoding='utf-8') as textfile:
+                textfile.write("\n".join(metric_lines) + "\n")
+            os.replace(temp_textfile_path, textfile_path)
+        except OSError:
+            self.logger.error("Failed to write Prometheus textfile: %s", textfile_path, exc_info=True)
+            return
+
+        self.logger.info("Prometheus metrics written to %s", textfile_path)
\ No newline at end of file
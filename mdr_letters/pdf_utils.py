@@ -1,16 +1,24 @@
 # ─── Python Standard Library ────────────────────────────────────────────────
 
 import os
+import hashlib
 import logging
-from typing import Optional
-
-# ─── Third-Party Libraries ──────────────────────────────────────────────────
-
-import fitz
+from types import ModuleType
+from typing import Dict, Iterator, Optional, Tuple
 
 # ─── Local Application Imports ──────────────────────────────────────────────
 
 from .config import METADATA_UPDATES, TEMP_FILE_PREFIX
+from .extraction_cache import ExtractionCache, compute_content_hash
+from .directory_index import DirectoryIndex
+from .metrics import RunMetrics
+from .lock_checker import LockChecker
+
+# ─── Third-Party Libraries (Imported on First Use) ──────────────────────────
+
+def load_fitz() -> ModuleType:
+    import fitz
+    return fitz
 
 # ─── PDF Processing and Metadata Management ─────────────────────────────────
 
@@ -18,26 +26,41 @@ class PDFUtils:
 
     # ─── Initialize PDF Utilities ─────────────────────────────────────────────
 
-    def __init__(self):
+    def __init__(
+        self,
+        extraction_cache: Optional[ExtractionCache] = None,
+        directory_index: Optional[DirectoryIndex] = None,
+        metrics: Optional[RunMetrics] = None,
+        lock_checker: Optional[LockChecker] = None
+    ):
         self.logger = logging.getLogger(__name__)
-
-    # ─── File Lock Check ──────────────────────────────────────────────────────
-
-    def is_file_locked(self, file_path: str) -> bool:
-        try:
-            with open(file_path, 'r+'):
-                return False
-        except IOError:
-            return True
+        self.extraction_cache = extraction_cache
+        self.directory_index = directory_index
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.lock_checker = lock_checker if lock_checker is not None else LockChecker(metrics=self.metrics)
 
     # ─── Load PDF Text Content ────────────────────────────────────────────────
 
+    def iter_pdf_pages(self, pdf_file_path: str) -> Iterator[str]:
+        with load_fitz().open(pdf_file_path) as pdf_document:
+            for page in pdf_document:
+                yield page.get_text()
+
     def load_pdf_text(self, pdf_file_path: str) -> str:
         try:
-            pdf_document = fitz.open(pdf_file_path)
-            extracted_text = "".join(page.get_text() for page in pdf_document)
-            pdf_document.close()
-            self.logger.info("Extracted text from PDF: %s", pdf_file_path)
+            content_hash = None
+            if self.extraction_cache is not None:
+                content_hash = self.extraction_cache.content_hash_for(pdf_file_path)
+                cached_text = self.extraction_cache.lookup_text(content_hash)
+                if cached_text is not None:
+                    self.logger.debug("Loaded cached text for PDF: %s", pdf_file_path)
+                    return cached_text
+
+            extracted_text = "".join(self.iter_pdf_pages(pdf_file_path))
+            if content_hash is not None:
+                self.extraction_cache.store_text(content_hash, extracted_text)
+
+            self.logger.debug("Extracted text from PDF: %s", pdf_file_path)
             return extracted_text
         
         except Exception:
@@ -46,29 +69,106 @@ class PDFUtils:
 
     # ─── Update PDF Metadata ──────────────────────────────────────────────────
 
-    def update_pdf_metadata(self, root_directory: str) -> None:
+    def iter_pdf_files(self, root_directory: str) -> Iterator[Tuple[str, bool, Optional[str]]]:
+        if self.directory_index is not None:
+            for indexed_file in self.directory_index.files_under(root_directory):
+                if indexed_file["filename"].lower().endswith(".pdf"):
+                    indexed_as_clean = bool(indexed_file["metadata_clean"]) and self.directory_index.is_file_unchanged(indexed_file)
+                    yield indexed_file["path"], indexed_as_clean, indexed_file["clean_content_hash"]
+            return
+
         for directory_path, _, filenames in os.walk(root_directory):
             for filename in filenames:
                 if filename.lower().endswith(".pdf"):
-                    pdf_file_path = os.path.join(directory_path, filename)
-
-                    if self.is_file_locked(pdf_file_path):
-                        self.logger.warning("Skipping locked PDF for metadata: %s", pdf_file_path)
-                        continue
-
-                    try:
-                        pdf_document = fitz.open(pdf_file_path)
-                        metadata = pdf_document.metadata
-                        metadata.update(METADATA_UPDATES)
-                        pdf_document.set_metadata(metadata)
-                        temp_file_path = pdf_file_path + ".temp"
-                        pdf_document.save(temp_file_path, garbage=4, deflate=True)
-                        pdf_document.close()
-                        os.replace(temp_file_path, pdf_file_path)
-                        self.logger.info("Metadata updated: %s", pdf_file_path)
-
-                    except Exception:
-                        self.logger.error("Metadata update failed: %s", pdf_file_path, exc_info=True)
+                    yield os.path.join(directory_path, filename), False, None
+
+    def is_metadata_clean(self, metadata: Dict[str, Optional[str]]) -> bool:
+        return all((metadata.get(key) or "") == value for key, value in METADATA_UPDATES.items())
+
+    def mark_metadata_clean(self, pdf_file_path: str, content_hash: Optional[str]) -> None:
+        if self.directory_index is not None:
+            self.directory_index.set_metadata_clean(pdf_file_path, content_hash)
+
+    def needs_metadata_update(self, pdf_file_path: str) -> bool:
+        try:
+            with load_fitz().open(pdf_file_path) as pdf_document:
+                return not self.is_metadata_clean(pdf_document.metadata)
+        except Exception:
+            self.logger.warning("Could not read metadata, assuming update needed: %s", pdf_file_path, exc_info=True)
+            return True
+
+    def update_file_metadata(self, pdf_file_path: str, indexed_as_clean: bool = False, clean_content_hash: Optional[str] = None) -> str:
+
+        # ─── Skip Files Unchanged Since Last Clean ───────────────────────────
+
+        if indexed_as_clean:
+            return "skipped"
+
+        content_hash = None
+        if self.directory_index is not None:
+            try:
+                content_hash = compute_content_hash(pdf_file_path)
+            except OSError:
+                self.logger.error("Metadata update failed: %s", pdf_file_path, exc_info=True)
+                return "failed"
+
+            if content_hash == clean_content_hash:
+                self.directory_index.record_file(pdf_file_path)
+                self.mark_metadata_clean(pdf_file_path, content_hash)
+                return "skipped"
+
+        if self.lock_checker.is_locked(pdf_file_path):
+            self.logger.warning("Skipping locked PDF for metadata: %s", pdf_file_path)
+            return "locked"
+
+        # ─── Check Metadata & Rewrite Only When Needed ───────────────────────
+
+        try:
+            pdf_document = load_fitz().open(pdf_file_path)
+            metadata = pdf_document.metadata
+
+            if self.is_metadata_clean(metadata):
+                pdf_document.close()
+                self.mark_metadata_clean(pdf_file_path, content_hash)
+                return "clean"
+
+            metadata.update(METADATA_UPDATES)
+            pdf_document.set_metadata(metadata)
+            cleaned_pdf_bytes = pdf_document.tobytes(garbage=4, deflate=True)
+            pdf_document.close()
+
+            temp_file_path = pdf_file_path + ".temp"
+            with open(temp_file_path, 'wb') as temp_file:
+                temp_file.write(cleaned_pdf_bytes)
+            os.replace(temp_file_path, pdf_file_path)
+            self.metrics.increment("metadata_bytes_written", len(cleaned_pdf_bytes))
+            self.logger.debug("Metadata updated: %s", pdf_file_path)
+
+            if self.directory_index is not None:
+                self.directory_index.record_file(pdf_file_path)
+            self.mark_metadata_clean(pdf_file_path, hashlib.sha256(cleaned_pdf_bytes).hexdigest())
+            return "rewritten"
+
+        except Exception:
+            self.logger.error("Metadata update failed: %s", pdf_file_path, exc_info=True)
+            return "failed"
+
+    def update_pdf_metadata(self, root_directory: str) -> Dict[str, int]:
+        metadata_counts = {"skipped": 0, "clean": 0, "rewritten": 0, "locked": 0, "failed": 0}
+
+        pdf_files = list(self.iter_pdf_files(root_directory))
+        self.lock_checker.check_files([pdf_file_path for pdf_file_path, indexed_as_clean, _ in pdf_files if not indexed_as_clean])
+
+        for pdf_file_path, indexed_as_clean, clean_content_hash in pdf_files:
+            metadata_counts[self.update_file_metadata(pdf_file_path, indexed_as_clean, clean_content_hash)] += 1
+
+        self.metrics.add_counts(metadata_counts, prefix="metadata_")
+        self.logger.info(
+            "Metadata pass for %s - Skipped: %d, Already clean: %d, Rewritten: %d, Locked: %d, Failed: %d",
+            root_directory, metadata_counts["skipped"], metadata_counts["clean"],
+            metadata_counts["rewritten"], metadata_counts["locked"], metadata_counts["failed"]
+        )
+        return metadata_counts
 
     # ─── Extract PDF Information for Processing ───────────────────────────────
 
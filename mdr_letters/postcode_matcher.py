@@ -0,0 +1,41 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import re
+from typing import Dict, List, Set, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import POSTAL_CODES
+
+# ─── Single-Pass Postcode Matcher ────────────────────────────────────────────
+
+class PostcodeMatcher:
+
+    # ─── Compile Combined Pattern from Config ────────────────────────────────
+
+    def __init__(self, postal_codes: Dict[str, str] = POSTAL_CODES):
+        self.postal_keys_by_group: Dict[str, str] = {}
+        alternatives = []
+
+        for group_index, (postal_key, postal_code) in enumerate(postal_codes.items()):
+            group_name = f"postcode_{group_index}"
+            self.postal_keys_by_group[group_name] = postal_key
+            characters = [re.escape(character) for character in postal_code if not character.isspace()]
+            whitespace_tolerant_code = r'\s*'.join(characters)
+            alternatives.append(f"(?P<{group_name}>{whitespace_tolerant_code})")
+
+        self.pattern = re.compile(
+            r'(?<![A-Za-z0-9])(?:' + '|'.join(alternatives) + r')(?![A-Za-z0-9])',
+            re.IGNORECASE
+        )
+
+    # ─── Find Postcodes with Positions ───────────────────────────────────────
+
+    def find_matches(self, document_text: str) -> List[Tuple[str, int, int]]:
+        return [
+            (self.postal_keys_by_group[match.lastgroup], match.start(), match.end())
+            for match in self.pattern.finditer(document_text)
+        ]
+
+    def find_postal_codes(self, document_text: str) -> Set[str]:
+        return {postal_key for postal_key, _, _ in self.find_matches(document_text)}
\ No newline at end of file
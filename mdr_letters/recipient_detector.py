@@ -2,17 +2,18 @@
 
 import re
 import logging
-from datetime import datetime
-from typing import Tuple, List
+from typing import Iterable, Optional, Set, Tuple, List
 
 # ─── Local Application Imports ──────────────────────────────────────────────
 
 from .config import (
-    KAMBIZ_DIRECTORY,
-    BHUPEN_DIRECTORY,
+    ADDRESSEE_PAGES,
     DATE_PATTERN,
-    POSTAL_CODES
+    RECIPIENT_ROUTING_RULES
 )
+from .date_engine import find_text_date, format_date
+from .letter import DEFAULT_RECIPIENT_ID, routing_rule_for
+from .postcode_matcher import PostcodeMatcher
 
 # ─── Recipient Detection and Date Extraction ────────────────────────────────
 
@@ -22,64 +23,84 @@ class RecipientDetector:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.postcode_matcher = PostcodeMatcher()
 
     # ─── Determine Recipients & Destinations ─────────────────────────────────
 
     def determine_recipients_and_destinations(self, document_text: str) -> Tuple[str, List[str]]:
+        routing_rule = routing_rule_for(self.determine_recipient_id(document_text))
+        return routing_rule["recipient"], list(routing_rule["destinations"])
 
-        # ─── Check for Multiple Postal Code Combinations ─────────────────────
+    def determine_recipient_id(self, document_text: str) -> int:
+        return self.match_routing_rule(self.find_postal_codes(document_text))
 
-        contains_w6_0xe = POSTAL_CODES["W6_0XE"] in document_text
-        contains_ha0_2nj = POSTAL_CODES["HA0_2NJ"] in document_text
-        contains_m20_6re = POSTAL_CODES["M20_6RE"] in document_text
-        contains_ec4a_1nl = POSTAL_CODES["EC4A_1NL"] in document_text
-        contains_ec2v_7hn = POSTAL_CODES["EC2V_7HN"] in document_text
+    def match_routing_rule(self, postal_codes_found: Set[str]) -> int:
 
-        # ─── Evaluate Postal Code Combinations ───────────────────────────────
+        # ─── Evaluate Routing Rules in Priority Order ────────────────────────
+
+        for recipient_id, routing_rule in enumerate(RECIPIENT_ROUTING_RULES):
+            if postal_codes_found.issuperset(routing_rule["postal_codes"]):
+                return recipient_id
 
-        if contains_w6_0xe and contains_ha0_2nj and contains_m20_6re:
-            return 'All Defendants', [BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY]
-        
-        if contains_w6_0xe and contains_ha0_2nj:
-            return 'Kambiz Babaee & Bhupen Varsani', [BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY]
-        
-        if contains_w6_0xe:
-            return 'Kambiz Babaee', [KAMBIZ_DIRECTORY]
-        
-        if contains_ha0_2nj:
-            return 'Bhupen Varsani', [BHUPEN_DIRECTORY]
-        
-        if contains_m20_6re:
-            return 'Fortis Insolvency', [KAMBIZ_DIRECTORY]
-        
-        if contains_ec4a_1nl:
-            return 'London Circuit Commercial Court', [KAMBIZ_DIRECTORY]
-        
-        if contains_ec2v_7hn:
-            return 'Lloyds Banking Group', [KAMBIZ_DIRECTORY]
-        
         # ─── Default Case ─────────────────────────────────────────────────────
 
-        return 'Kambiz Babaee', [KAMBIZ_DIRECTORY]
+        return DEFAULT_RECIPIENT_ID
+
+    def can_match_higher_rule(self, postal_codes_found: Set[str], recipient_id: int) -> bool:
+        return any(
+            postal_codes_found.issubset(routing_rule["postal_codes"])
+            for routing_rule in RECIPIENT_ROUTING_RULES[:recipient_id]
+        )
 
     # ─── Extract & Format Date from Text ─────────────────────────────────────
 
     def extract_and_format_date(self, document_text: str) -> Tuple[str, str]:
+        parsed_date = find_text_date(document_text)
+        if parsed_date is not None:
+            return format_date(parsed_date), str(parsed_date.year)
+
         date_match = DATE_PATTERN.search(document_text)
         if date_match:
-            try:
-                parsed_date = datetime.strptime(date_match.group(1), "%d %B %Y")
-                return parsed_date.strftime('%d %B %Y'), parsed_date.strftime('%Y')
-            except ValueError:
-                self.logger.warning("Invalid date format in text: %s", date_match.group(1))
+            self.logger.warning("Invalid date format in text: %s", date_match.group(0))
         return "Unknown Date", "Unknown"
 
+    # ─── Find Postal Codes in Text ───────────────────────────────────────────
+
+    def find_postal_codes(self, document_text: str) -> Set[str]:
+        return self.postcode_matcher.find_postal_codes(document_text)
+
     # ─── Analyze Document Content ─────────────────────────────────────────────
 
     def analyze_document(self, document_text: str) -> Tuple[str, List[str], str, str]:
         recipient_name, destination_directories = self.determine_recipients_and_destinations(document_text)
         formatted_date, year = self.extract_and_format_date(document_text)
         
-        self.logger.info("Document analysis complete - Recipient: %s, Date: %s", recipient_name, formatted_date)
+        self.logger.debug("Document analysis complete - Recipient: %s, Date: %s", recipient_name, formatted_date)
         
-        return recipient_name, destination_directories, formatted_date, year
\ No newline at end of file
+        return recipient_name, destination_directories, formatted_date, year
+
+    # ─── Analyze Document Page by Page ───────────────────────────────────────
+
+    def analyze_pages(self, page_texts: Iterable[str]) -> Tuple[int, Optional[int], str, int]:
+        read_pages: List[str] = []
+        postal_codes_found: Set[str] = set()
+        date_found = False
+
+        for page_text in page_texts:
+            read_pages.append(page_text)
+            postal_codes_found |= self.find_postal_codes(page_text)
+            date_found = date_found or find_text_date(page_text) is not None
+
+            recipient_id = self.match_routing_rule(postal_codes_found)
+            if date_found and recipient_id != DEFAULT_RECIPIENT_ID and (
+                len(read_pages) >= ADDRESSEE_PAGES or not self.can_match_higher_rule(postal_codes_found, recipient_id)
+            ):
+                break
+
+        document_text = "".join(read_pages)
+        parsed_date = find_text_date(document_text)
+        recipient_id = self.determine_recipient_id(document_text)
+
+        self.logger.debug("Page analysis complete - Recipient id: %d, Date: %s", recipient_id, parsed_date)
+
+        return recipient_id, parsed_date.toordinal() if parsed_date is not None else None, document_text, len(read_pages)
\ No newline at end of file
@@ -0,0 +1,139 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import json
+import hashlib
+import logging
+from typing import IO, Dict, List, Optional, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import RENAME_JOURNAL_DIRECTORY
+
+# ─── Write-Ahead Rename Journal ──────────────────────────────────────────────
+
+class RenameJournal:
+
+    # ─── Initialize Rename Journal ───────────────────────────────────────────
+
+    def __init__(self, journal_directory: str = str(RENAME_JOURNAL_DIRECTORY)):
+        self.logger = logging.getLogger(__name__)
+        self.journal_directory = journal_directory
+        self.open_journals: Dict[str, IO[str]] = {}
+        os.makedirs(journal_directory, exist_ok=True)
+
+    def journal_path(self, directory: str) -> str:
+        folder_key = hashlib.sha1(directory.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.journal_directory, f"{folder_key}.journal")
+
+    def has_pending(self, directory: str) -> bool:
+        return os.path.exists(self.journal_path(directory))
+
+    # ─── Record Planned & Completed Renames ──────────────────────────────────
+
+    def begin(self, directory: str, rename_steps: List[Tuple[str, str]]) -> None:
+        journal_path = self.journal_path(directory)
+        temp_journal_path = journal_path + ".temp"
+        with open(temp_journal_path, 'w', encoding='utf-8') as journal_file:
+            journal_file.write(json.dumps({"folder": directory, "renames": rename_steps}, ensure_ascii=False) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temp_journal_path, journal_path)
+        self.open_journals[directory] = open(journal_path, 'a', encoding='utf-8')
+
+    def mark_done(self, directory: str, step_index: int) -> None:
+        journal_file = self.open_journals[directory]
+        journal_file.write(f"{step_index}\n")
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+
+    def finish(self, directory: str, completed: bool = True) -> None:
+        journal_file = self.open_journals.pop(directory, None)
+        if journal_file is not None:
+            journal_file.close()
+        if completed:
+            os.remove(self.journal_path(directory))
+
+    # ─── Read Journals Left by an Interrupted Run ────────────────────────────
+
+    def read(self, journal_path: str) -> Tuple[str, List[Tuple[str, str]], int]:
+        with open(journal_path, 'r', encoding='utf-8') as journal_file:
+            journal_header = json.loads(journal_file.readline())
+            completed_steps = sum(1 for line in journal_file if line.strip().isdigit())
+        rename_steps = [(old_filename, new_filename) for old_filename, new_filename in journal_header["renames"]]
+        return journal_header["folder"], rename_steps, completed_steps
+
+    def pending_journal_paths(self) -> List[str]:
+        return sorted(
+            os.path.join(self.journal_directory, filename)
+            for filename in os.listdir(self.journal_directory)
+            if filename.endswith(".journal")
+        )
+
+    def step_state(self, directory: str, old_filename: str, new_filename: str) -> str:
+        old_exists = os.path.exists(os.path.join(directory, old_filename))
+        new_exists = os.path.exists(os.path.join(directory, new_filename))
+        if old_exists and not new_exists:
+            return "pending"
+        if new_exists and not old_exists:
+            return "done"
+        return "conflict"
+
+    # ─── Replay or Roll Back ─────────────────────────────────────────────────
+
+    def replay(self, directory: str, rename_steps: List[Tuple[str, str]], completed_steps: int) -> bool:
+        for old_filename, new_filename in rename_steps[completed_steps:]:
+            step_state = self.step_state(directory, old_filename, new_filename)
+            if step_state == "done":
+                continue
+            if step_state == "conflict":
+                self.logger.error("Cannot replay rename %s -> %s in %s", old_filename, new_filename, directory)
+                return False
+            os.rename(os.path.join(directory, old_filename), os.path.join(directory, new_filename))
+            self.logger.info("Replayed rename: %s -> %s in %s", old_filename, new_filename, directory)
+        return True
+
+    def roll_back(self, directory: str, rename_steps: List[Tuple[str, str]], completed_steps: int) -> bool:
+        steps_to_undo = completed_steps
+        if completed_steps < len(rename_steps) and self.step_state(directory, *rename_steps[completed_steps]) == "done":
+            steps_to_undo += 1
+
+        for old_filename, new_filename in reversed(rename_steps[:steps_to_undo]):
+            if self.step_state(directory, old_filename, new_filename) != "done":
+                self.logger.error("Cannot roll back rename %s -> %s in %s", old_filename, new_filename, directory)
+                return False
+            os.rename(os.path.join(directory, new_filename), os.path.join(directory, old_filename))
+            self.logger.info("Rolled back rename: %s -> %s in %s", new_filename, old_filename, directory)
+        return True
+
+    def recover(self, journal_path: str, roll_back: bool = False) -> Optional[str]:
+        try:
+            directory, rename_steps, completed_steps = self.read(journal_path)
+        except (OSError, ValueError, KeyError):
+            self.logger.error("Unreadable rename journal left in place: %s", journal_path, exc_info=True)
+            return None
+
+        self.logger.warning(
+            "Recovering interrupted sequencing in %s: %d of %d rename(s) completed",
+            directory, completed_steps, len(rename_steps)
+        )
+        try:
+            recovered = (self.roll_back if roll_back else self.replay)(directory, rename_steps, completed_steps)
+        except OSError:
+            self.logger.error("Rename recovery failed for %s", directory, exc_info=True)
+            recovered = False
+
+        if not recovered:
+            self.logger.error("Rename journal kept for manual review: %s", journal_path)
+            return None
+
+        os.remove(journal_path)
+        return directory
+
+    def recover_all(self, roll_back: bool = False) -> List[str]:
+        recovered_folders = []
+        for journal_path in self.pending_journal_paths():
+            directory = self.recover(journal_path, roll_back=roll_back)
+            if directory is not None:
+                recovered_folders.append(directory)
+        return recovered_folders
\ No newline at end of file
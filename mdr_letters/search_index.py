@@ -0,0 +1,193 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import re
+import sqlite3
+import logging
+from datetime import date
+from typing import List, Optional, Set, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import SEARCH_INDEX_PATH, SEARCH_RESULT_LIMIT, TEMP_FILE_PREFIX
+from .date_engine import parse_filename_date_ordinal
+
+# ─── Filename Field Parsing ──────────────────────────────────────────────────
+
+RECIPIENT_PATTERN = re.compile(r'Letter to (.+?) \[')
+SEQUENCE_PREFIX_PATTERN = re.compile(rf'^(?:{re.escape(TEMP_FILE_PREFIX)})?(?:\d{{2}}\s+)?')
+
+def parse_filename_recipient(filename: str) -> Optional[str]:
+    recipient_match = RECIPIENT_PATTERN.search(filename)
+    return recipient_match.group(1) if recipient_match else None
+
+def strip_sequence_prefix(filename: str) -> str:
+    return SEQUENCE_PREFIX_PATTERN.sub('', filename, count=1)
+
+# ─── Full-Text Letter Search Index ───────────────────────────────────────────
+
+class SearchIndex:
+
+    # ─── Initialize Search Index ─────────────────────────────────────────────
+
+    def __init__(self, index_path: str = str(SEARCH_INDEX_PATH)):
+        self.logger = logging.getLogger(__name__)
+        self.index_path = index_path
+
+        os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(index_path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (id INTEGER PRIMARY KEY, content_hash TEXT UNIQUE)"
+            )
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS document_text USING fts5(body, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS letters ("
+                "path TEXT PRIMARY KEY, folder TEXT, filename TEXT, document_id INTEGER, "
+                "recipient TEXT, date_ordinal INTEGER)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS letters_by_folder ON letters (folder)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS letters_by_document ON letters (document_id)")
+
+    # ─── Store Document Text Once per Content Hash ───────────────────────────
+
+    def has_document(self, content_hash: str) -> bool:
+        return self.connection.execute(
+            "SELECT 1 FROM documents WHERE content_hash = ?", (content_hash,)
+        ).fetchone() is not None
+
+    def store_document(self, content_hash: str, document_text: str) -> int:
+        stored_document = self.connection.execute(
+            "SELECT id FROM documents WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        if stored_document is not None:
+            return stored_document["id"]
+
+        document_id = self.connection.execute(
+            "INSERT INTO documents (content_hash) VALUES (?)", (content_hash,)
+        ).lastrowid
+        self.connection.execute("INSERT INTO document_text (rowid, body) VALUES (?, ?)", (document_id, document_text))
+        return document_id
+
+    # ─── Record Filed Letters, Copies & Renames ──────────────────────────────
+
+    def upsert_letter(self, file_path: str, document_id: int) -> None:
+        folder_path, filename = os.path.split(file_path)
+        self.connection.execute(
+            "INSERT INTO letters (path, folder, filename, document_id, recipient, date_ordinal) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET document_id = excluded.document_id, "
+            "recipient = excluded.recipient, date_ordinal = excluded.date_ordinal",
+            (
+                file_path, folder_path, filename, document_id,
+                parse_filename_recipient(filename), parse_filename_date_ordinal(filename)
+            )
+        )
+
+    def record_letters(self, file_paths: List[str], content_hash: str, document_text: Optional[str] = None) -> None:
+        with self.connection:
+            if document_text is None:
+                stored_document = self.connection.execute(
+                    "SELECT id FROM documents WHERE content_hash = ?", (content_hash,)
+                ).fetchone()
+                if stored_document is None:
+                    return
+                document_id = stored_document["id"]
+            else:
+                document_id = self.store_document(content_hash, document_text)
+
+            for file_path in file_paths:
+                self.upsert_letter(file_path, document_id)
+
+    def record_rename(self, old_file_path: str, new_file_path: str) -> None:
+        folder_path, filename = os.path.split(new_file_path)
+        with self.connection:
+            self.connection.execute("DELETE FROM letters WHERE path = ?", (new_file_path,))
+            self.connection.execute(
+                "UPDATE letters SET path = ?, folder = ?, filename = ?, recipient = ?, date_ordinal = ? WHERE path = ?",
+                (
+                    new_file_path, folder_path, filename,
+                    parse_filename_recipient(filename), parse_filename_date_ordinal(filename), old_file_path
+                )
+            )
+
+    def forget_letter(self, file_path: str) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM letters WHERE path = ?", (file_path,))
+
+    # ─── Reconcile a Folder Renamed Outside Our Records ──────────────────────
+
+    def relink_folder(self, folder_path: str, filenames: List[str]) -> int:
+        current_filenames = set(filenames)
+        filenames_by_stem = {strip_sequence_prefix(filename): filename for filename in filenames}
+        relinked_letters = 0
+
+        for indexed_letter in self.connection.execute(
+            "SELECT path, filename FROM letters WHERE folder = ?", (folder_path,)
+        ).fetchall():
+            if indexed_letter["filename"] in current_filenames:
+                continue
+
+            current_filename = filenames_by_stem.get(strip_sequence_prefix(indexed_letter["filename"]))
+            if current_filename is None:
+                self.forget_letter(indexed_letter["path"])
+            else:
+                self.record_rename(indexed_letter["path"], os.path.join(folder_path, current_filename))
+                relinked_letters += 1
+        return relinked_letters
+
+    def prune_documents(self) -> int:
+        with self.connection:
+            orphaned_documents = [
+                (row["id"],) for row in self.connection.execute(
+                    "SELECT id FROM documents WHERE id NOT IN (SELECT document_id FROM letters)"
+                )
+            ]
+            self.connection.executemany("DELETE FROM document_text WHERE rowid = ?", orphaned_documents)
+            self.connection.executemany("DELETE FROM documents WHERE id = ?", orphaned_documents)
+        return len(orphaned_documents)
+
+    def indexed_paths(self) -> Set[str]:
+        return {row["path"] for row in self.connection.execute("SELECT path FROM letters")}
+
+    # ─── Query ───────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: str,
+        recipient: Optional[str] = None,
+        year: Optional[int] = None,
+        limit: int = SEARCH_RESULT_LIMIT
+    ) -> List[sqlite3.Row]:
+
+        filters, filter_values = self.build_filters(recipient, year)
+        search_sql = (
+            "SELECT letters.path, letters.recipient, letters.date_ordinal, "
+            "snippet(document_text, 0, '[', ']', '...', 12) AS snippet "
+            "FROM document_text JOIN letters ON letters.document_id = document_text.rowid "
+            f"WHERE document_text MATCH ?{filters} "
+            "ORDER BY rank, letters.date_ordinal LIMIT ?"
+        )
+        try:
+            return self.connection.execute(search_sql, (query, *filter_values, limit)).fetchall()
+        except sqlite3.OperationalError:
+            quoted_query = " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+            return self.connection.execute(search_sql, (quoted_query, *filter_values, limit)).fetchall()
+
+    def build_filters(self, recipient: Optional[str], year: Optional[int]) -> Tuple[str, List[object]]:
+        filters = ""
+        filter_values: List[object] = []
+        if recipient:
+            filters += " AND letters.recipient LIKE ?"
+            filter_values.append(f"%{recipient}%")
+        if year:
+            filters += " AND letters.date_ordinal BETWEEN ? AND ?"
+            filter_values.extend([date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()])
+        return filters, filter_values
+
+    # ─── Close Index ─────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        self.connection.close()
\ No newline at end of file
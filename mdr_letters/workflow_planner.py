@@ -0,0 +1,373 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from .config import OUTPUT_DIRECTORIES, TEMP_FILE_PREFIX
+from .document_processor import DocumentProcessor, IngestionSummary
+from .fingerprint import DuplicateMatch, FingerprintPartition, LetterFingerprint
+from .letter import Letter
+
+# ─── Planned Filesystem Operation ────────────────────────────────────────────
+
+class PlannedOperation:
+
+    def __init__(self, operation: str, source_path: str, target_paths: Optional[List[str]] = None):
+        self.operation = operation
+        self.source_path = source_path
+        self.target_paths = list(target_paths or [])
+
+    def key(self) -> Tuple[str, str, Tuple[str, ...]]:
+        return self.operation, self.source_path, tuple(self.target_paths)
+
+    def describe(self) -> str:
+        if not self.target_paths:
+            return f"{self.operation.upper():<10} {self.source_path}"
+        return f"{self.operation.upper():<10} {self.source_path} -> {', '.join(self.target_paths)}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"operation": self.operation, "source": self.source_path, "targets": self.target_paths}
+
+    @classmethod
+    def from_dict(cls, operation_data: Dict[str, Any]) -> "PlannedOperation":
+        return cls(operation_data["operation"], operation_data["source"], operation_data.get("targets", []))
+
+# ─── Complete Workflow Plan ──────────────────────────────────────────────────
+
+class WorkflowPlan:
+
+    def __init__(
+        self,
+        operations: Optional[List[PlannedOperation]] = None,
+        notes: Optional[List[str]] = None,
+        created_at: Optional[str] = None
+    ):
+        self.operations = operations or []
+        self.notes = notes or []
+        self.created_at = created_at or datetime.now().isoformat(timespec="seconds")
+
+    def add(self, operation: str, source_path: str, target_paths: Optional[List[str]] = None) -> None:
+        self.operations.append(PlannedOperation(operation, source_path, target_paths))
+
+    def operations_of(self, operation: str) -> List[PlannedOperation]:
+        return [planned for planned in self.operations if planned.operation == operation]
+
+    def count_by_operation(self) -> Dict[str, int]:
+        operation_counts: Dict[str, int] = {}
+        for planned in self.operations:
+            operation_counts[planned.operation] = operation_counts.get(planned.operation, 0) + 1
+        return operation_counts
+
+    # ─── Print & Diff Plans ──────────────────────────────────────────────────
+
+    def describe(self) -> List[str]:
+        plan_lines = [planned.describe() for planned in self.operations]
+        plan_lines.extend(f"NOTE       {note}" for note in self.notes)
+        operation_counts = self.count_by_operation()
+        plan_lines.append(
+            "Plan totals - " + (", ".join(f"{name}: {count}" for name, count in sorted(operation_counts.items())) or "no operations")
+        )
+        return plan_lines
+
+    def diff(self, other_plan: "WorkflowPlan") -> Tuple[List[PlannedOperation], List[PlannedOperation]]:
+        own_keys = {planned.key() for planned in self.operations}
+        other_keys = {planned.key() for planned in other_plan.operations}
+        added_operations = [planned for planned in self.operations if planned.key() not in other_keys]
+        removed_operations = [planned for planned in other_plan.operations if planned.key() not in own_keys]
+        return added_operations, removed_operations
+
+    # ─── Save & Load Plans ───────────────────────────────────────────────────
+
+    def save(self, plan_path: str) -> None:
+        with open(plan_path, 'w', encoding='utf-8') as plan_file:
+            json.dump(
+                {
+                    "created_at": self.created_at,
+                    "operations": [planned.to_dict() for planned in self.operations],
+                    "notes": self.notes
+                },
+                plan_file,
+                indent=2,
+                ensure_ascii=False
+            )
+
+    @classmethod
+    def load(cls, plan_path: str) -> "WorkflowPlan":
+        with open(plan_path, 'r', encoding='utf-8') as plan_file:
+            plan_data = json.load(plan_file)
+        return cls(
+            [PlannedOperation.from_dict(operation_data) for operation_data in plan_data.get("operations", [])],
+            plan_data.get("notes", []),
+            plan_data.get("created_at")
+        )
+
+# ─── Workflow Planning Engine ────────────────────────────────────────────────
+
+class WorkflowPlanner:
+
+    # ─── Initialize Workflow Planner ─────────────────────────────────────────
+
+    def __init__(self, document_processor: DocumentProcessor, output_directories: Optional[List[str]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.document_processor = document_processor
+        self.output_directories = output_directories if output_directories is not None else OUTPUT_DIRECTORIES
+
+    # ─── Build Plan from a Single Scan ───────────────────────────────────────
+
+    def build_plan(self) -> WorkflowPlan:
+        plan = WorkflowPlan()
+        directory_index = self.document_processor.directory_index
+
+        with self.document_processor.metrics.stage("index_refresh"):
+            for output_directory in self.output_directories:
+                directory_index.refresh(output_directory)
+
+        with self.document_processor.metrics.stage("planning"):
+            folder_additions = self.plan_distribution(plan)
+            valid_directories = []
+            for output_directory in self.output_directories:
+                if self.document_processor.file_manager.validate_dates_in_filenames(output_directory):
+                    valid_directories.append(output_directory)
+                else:
+                    plan.notes.append(f"Validation failed, no renames or metadata planned for: {output_directory}")
+
+            planned_renames = self.plan_sequencing(plan, valid_directories, folder_additions)
+            self.plan_metadata(plan, valid_directories, planned_renames)
+
+        self.logger.info(
+            "Workflow plan built - %s",
+            ", ".join(f"{name}: {count}" for name, count in sorted(plan.count_by_operation().items())) or "no operations"
+        )
+        return plan
+
+    def plan_distribution(self, plan: WorkflowPlan) -> Dict[str, List[str]]:
+        summary = IngestionSummary()
+        pdf_file_paths = self.document_processor.list_input_pdfs()
+        letter_fingerprints: Dict[str, Optional[LetterFingerprint]] = {}
+        letters, _ = self.document_processor.analyze_input_batch(pdf_file_paths, {}, letter_fingerprints, summary)
+
+        reserved_paths: Set[str] = set()
+        folder_additions: Dict[str, List[str]] = {}
+        planned_fingerprints: Dict[Tuple[str, str], FingerprintPartition] = {}
+        planned_target_paths: Dict[str, List[str]] = {}
+        for pdf_file_path in pdf_file_paths:
+            letter = letters.pop(pdf_file_path, None)
+            if letter is None:
+                continue
+
+            letter_fingerprint = self.document_processor.take_fingerprint(pdf_file_path, letter_fingerprints)
+            duplicate_match = self.document_processor.find_filed_duplicate(letter, letter_fingerprint)
+            if duplicate_match is None:
+                duplicate_match = self.find_planned_duplicate(letter, letter_fingerprint, planned_fingerprints, planned_target_paths)
+            duplicate_policy = self.document_processor.duplicate_policy_for(duplicate_match)
+            if duplicate_policy == "skip":
+                summary.record_duplicate(pdf_file_path, duplicate_match.paths[0])
+                continue
+            if duplicate_policy == "replace":
+                plan.notes.append(
+                    f"Re-sent letter would replace {', '.join(duplicate_match.paths)} on a normal run, "
+                    f"but --execute-plan files it alongside without removing anything: {pdf_file_path}"
+                )
+            elif duplicate_policy == "keep":
+                plan.notes.append(f"Re-sent letter filed alongside {duplicate_match.paths[0]}: {pdf_file_path}")
+
+            new_filename = self.document_processor.build_target_filename(pdf_file_path, letter.recipient_name, letter.formatted_date)
+            target_file_paths = []
+            for destination_root_directory in letter.destination_directories:
+                target_file_path = self.document_processor.file_manager.ensure_unique_filename(
+                    os.path.join(destination_root_directory, letter.year, new_filename), reserved_paths
+                )
+                reserved_paths.add(target_file_path)
+                target_file_paths.append(target_file_path)
+                target_folder, target_filename = os.path.split(target_file_path)
+                folder_additions.setdefault(target_folder, []).append(target_filename)
+
+            plan.add("distribute", pdf_file_path, target_file_paths)
+            if letter_fingerprint is not None:
+                planned_fingerprints.setdefault((letter.recipient_name, letter.year), FingerprintPartition()).add(
+                    letter_fingerprint, letter.date_ordinal
+                )
+                planned_target_paths[letter_fingerprint.text_hash] = target_file_paths
+
+        for pdf_file_path, existing_path in summary.duplicates:
+            plan.notes.append(f"Duplicate left in input directory: {pdf_file_path} (duplicate of {existing_path})")
+        for pdf_file_path, reason in summary.failures:
+            plan.notes.append(f"Cannot be filed: {pdf_file_path} ({reason})")
+        return folder_additions
+
+    def find_planned_duplicate(
+        self,
+        letter: Letter,
+        letter_fingerprint: Optional[LetterFingerprint],
+        planned_fingerprints: Dict[Tuple[str, str], FingerprintPartition],
+        planned_target_paths: Dict[str, List[str]]
+    ) -> Optional[DuplicateMatch]:
+
+        partition = planned_fingerprints.get((letter.recipient_name, letter.year))
+        if letter_fingerprint is None or partition is None:
+            return None
+
+        duplicate_match = self.document_processor.fingerprint_index.find_in_partition(
+            letter_fingerprint, partition, letter.date_ordinal
+        )
+        if duplicate_match is not None:
+            duplicate_match.paths = list(planned_target_paths[duplicate_match.text_hash])
+        return duplicate_match
+
+    def plan_sequencing(
+        self,
+        plan: WorkflowPlan,
+        output_directories: List[str],
+        folder_additions: Dict[str, List[str]]
+    ) -> Dict[str, str]:
+
+        directory_index = self.document_processor.directory_index
+        file_manager = self.document_processor.file_manager
+        planned_renames: Dict[str, str] = {}
+
+        for output_directory in output_directories:
+            folder_paths = set(directory_index.folders_with_files(output_directory))
+            folder_paths.update(
+                folder_path for folder_path in folder_additions if directory_index.is_within(folder_path, output_directory)
+            )
+
+            for folder_path in sorted(folder_paths):
+                added_filenames = folder_additions.get(folder_path, [])
+                if not added_filenames and directory_index.is_folder_sequenced(folder_path):
+                    continue
+
+                filenames = directory_index.filenames_in(folder_path)
+                if any(filename.startswith(TEMP_FILE_PREFIX) for filename in filenames):
+                    plan.notes.append(f"Leftover temp files will be restored to their original names before sequencing: {folder_path}")
+                    filenames = [
+                        filename[len(TEMP_FILE_PREFIX):] if filename.startswith(TEMP_FILE_PREFIX) else filename
+                        for filename in filenames
+                    ]
+
+                rename_plan = file_manager.compute_sequence_plan(folder_path, filenames + added_filenames)
+                for filename, target_filename in sorted(rename_plan.items(), key=lambda rename: rename[1]):
+                    old_file_path = os.path.join(folder_path, filename)
+                    new_file_path = os.path.join(folder_path, target_filename)
+                    plan.add("rename", old_file_path, [new_file_path])
+                    planned_renames[old_file_path] = new_file_path
+
+        return planned_renames
+
+    def plan_metadata(self, plan: WorkflowPlan, output_directories: List[str], planned_renames: Dict[str, str]) -> None:
+        pdf_utils = self.document_processor.pdf_utils
+        directory_index = self.document_processor.directory_index
+
+        for output_directory in output_directories:
+            for pdf_file_path, indexed_as_clean, _ in pdf_utils.iter_pdf_files(output_directory):
+                if not indexed_as_clean and pdf_utils.needs_metadata_update(pdf_file_path):
+                    plan.add("metadata", planned_renames.get(pdf_file_path, pdf_file_path))
+
+        for planned in plan.operations_of("distribute"):
+            if not pdf_utils.needs_metadata_update(planned.source_path):
+                continue
+            for target_file_path in planned.target_paths:
+                if any(directory_index.is_within(target_file_path, output_directory) for output_directory in output_directories):
+                    plan.add("metadata", planned_renames.get(target_file_path, target_file_path))
+
+    # ─── Execute Plan in Batched, Ordered Passes ─────────────────────────────
+
+    def execute_plan(self, plan: WorkflowPlan) -> Dict[str, int]:
+        for note in plan.notes:
+            self.logger.warning("Plan note: %s", note)
+
+        self.document_processor.recover_interrupted_renames()
+        outcome_counts = {"distributed": 0, "renamed": 0, "stale": 0, "failed": 0}
+        disturbed_folders = self.execute_distributions(plan, outcome_counts)
+        self.execute_renames(plan, disturbed_folders, outcome_counts)
+        metadata_counts = self.execute_metadata_updates(plan)
+
+        self.logger.info(
+            "Plan executed - Distributed: %d, Renamed: %d, Metadata rewritten: %d, Stale: %d, Failed: %d",
+            outcome_counts["distributed"], outcome_counts["renamed"], metadata_counts.get("rewritten", 0),
+            outcome_counts["stale"], outcome_counts["failed"]
+        )
+        return outcome_counts
+
+    def execute_distributions(self, plan: WorkflowPlan, outcome_counts: Dict[str, int]) -> Set[str]:
+        extraction_cache = self.document_processor.extraction_cache
+        disturbed_folders: Set[str] = set()
+
+        with self.document_processor.metrics.stage("distribution"):
+            for planned in plan.operations_of("distribute"):
+                target_folders = {os.path.dirname(target_file_path) for target_file_path in planned.target_paths}
+                if not os.path.exists(planned.source_path) or any(os.path.exists(path) for path in planned.target_paths):
+                    self.logger.warning("Plan is stale, distribution skipped: %s", planned.source_path)
+                    outcome_counts["stale"] += 1
+                    disturbed_folders.update(target_folders)
+                    continue
+
+                content_hash = extraction_cache.content_hash_for(planned.source_path) if extraction_cache is not None else None
+                distributed_paths = self.document_processor.distribute_to_targets(planned.source_path, planned.target_paths)
+                if len(distributed_paths) != len(planned.target_paths):
+                    outcome_counts["failed"] += 1
+                    disturbed_folders.update(target_folders)
+                    continue
+
+                outcome_counts["distributed"] += 1
+                if content_hash is not None:
+                    extraction_cache.record_distribution(content_hash, distributed_paths)
+
+        return disturbed_folders
+
+    def execute_renames(self, plan: WorkflowPlan, disturbed_folders: Set[str], outcome_counts: Dict[str, int]) -> None:
+        file_manager = self.document_processor.file_manager
+        directory_index = self.document_processor.directory_index
+        renames_by_folder: Dict[str, Dict[str, str]] = {}
+        for planned in plan.operations_of("rename"):
+            folder_path, filename = os.path.split(planned.source_path)
+            renames_by_folder.setdefault(folder_path, {})[filename] = os.path.basename(planned.target_paths[0])
+
+        with self.document_processor.metrics.stage("sequencing"):
+            for folder_path, rename_plan in renames_by_folder.items():
+                try:
+                    existing_filenames = os.listdir(folder_path)
+                except OSError:
+                    self.logger.error("Planned folder is missing: %s", folder_path, exc_info=True)
+                    outcome_counts["failed"] += len(rename_plan)
+                    continue
+
+                if not file_manager.ensure_all_files_closed(folder_path):
+                    outcome_counts["failed"] += len(rename_plan)
+                    continue
+
+                # ─── Recompute Folders the Plan No Longer Matches ────────────
+
+                if folder_path in disturbed_folders or any(filename not in existing_filenames for filename in rename_plan):
+                    self.logger.warning("Plan is stale for folder, resequencing from disk: %s", folder_path)
+                    outcome_counts["stale"] += len(rename_plan)
+                    completed = file_manager.process_folder_incremental(folder_path, existing_filenames)
+                else:
+                    completed = file_manager.execute_rename_plan(folder_path, rename_plan, existing_filenames)
+                    if completed:
+                        outcome_counts["renamed"] += len(rename_plan)
+
+                if completed:
+                    directory_index.mark_folder_sequenced(folder_path)
+                else:
+                    outcome_counts["failed"] += 1
+                    directory_index.clear_folder_sequenced(folder_path)
+
+    def execute_metadata_updates(self, plan: WorkflowPlan) -> Dict[str, int]:
+        pdf_utils = self.document_processor.pdf_utils
+        metadata_counts = {"skipped": 0, "clean": 0, "rewritten": 0, "locked": 0, "failed": 0}
+
+        with self.document_processor.metrics.stage("metadata"):
+            for planned in plan.operations_of("metadata"):
+                if not os.path.exists(planned.source_path):
+                    self.logger.warning("Planned metadata target is missing: %s", planned.source_path)
+                    metadata_counts["failed"] += 1
+                    continue
+                metadata_counts[pdf_utils.update_file_metadata(planned.source_path)] += 1
+
+        self.document_processor.metrics.add_counts(metadata_counts, prefix="metadata_")
+        return metadata_counts
\ No newline at end of file
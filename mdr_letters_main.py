@@ -1,11 +1,18 @@
 # ─── Python Standard Library ────────────────────────────────────────────────
 
+import argparse
 import logging
+from datetime import date
 
 # ─── Local Application Imports ──────────────────────────────────────────────
 
-from mdr_letters.config import LOG_FORMAT, LOG_DATE_FORMAT
+from mdr_letters.config import LOG_FORMAT, LOG_DATE_FORMAT, INGESTION_WORKERS, METRICS_PROMETHEUS_TEXTFILE
+from mdr_letters.date_engine import format_date
 from mdr_letters.document_processor import DocumentProcessor
+from mdr_letters.metrics import RunMetrics
+from mdr_letters.search_index import SearchIndex
+from mdr_letters.workflow_planner import WorkflowPlan, WorkflowPlanner
+from mdr_letters.backfill import BackfillRunner
 
 # ─── Configure Logging Format and Level ─────────────────────────────────────
 
@@ -15,14 +22,141 @@ logging.basicConfig(
     datefmt=LOG_DATE_FORMAT
 )
 
+# ─── Command Line Arguments ──────────────────────────────────────────────────
+
+def parse_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="MDR Letters Processing System")
+    argument_parser.add_argument(
+        "--workers",
+        type=int,
+        default=INGESTION_WORKERS,
+        help="Number of worker processes for input PDF analysis (1 = sequential)"
+    )
+    argument_parser.add_argument(
+        "--full-resequence",
+        action="store_true",
+        help="Renumber every folder in full instead of only folders changed since the last run"
+    )
+    argument_parser.add_argument(
+        "--rollback-renames",
+        action="store_true",
+        help="Undo, rather than finish, sequencing renames left half-done by an interrupted run"
+    )
+    argument_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and process new PDFs as they land in the input directory"
+    )
+    argument_parser.add_argument(
+        "--backfill",
+        metavar="SOURCE",
+        help="File every PDF in a directory tree or zip archive, resuming an interrupted backfill of the same source"
+    )
+    argument_parser.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        metavar="STAGE",
+        help="Write a cProfile dump for a workflow stage to logs/ (repeatable, 'all' profiles every stage)"
+    )
+    argument_parser.add_argument(
+        "--prometheus-textfile",
+        default=METRICS_PROMETHEUS_TEXTFILE,
+        help="Also write run metrics in Prometheus text format to this file"
+    )
+    argument_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print every move, copy, rename and metadata rewrite the run would make, without changing anything"
+    )
+    argument_parser.add_argument("--save-plan", metavar="PLAN_FILE", help="Save the dry-run plan as JSON")
+    argument_parser.add_argument("--diff-plan", metavar="PLAN_FILE", help="Compare the current plan with a saved plan")
+    argument_parser.add_argument("--execute-plan", metavar="PLAN_FILE", help="Execute a previously saved plan")
+    argument_parser.add_argument(
+        "--search",
+        metavar="QUERY",
+        help="Search the text of filed letters from the local index, without touching the network drive"
+    )
+    argument_parser.add_argument("--search-recipient", metavar="RECIPIENT", help="Only return letters to this recipient")
+    argument_parser.add_argument("--search-year", type=int, metavar="YEAR", help="Only return letters dated in this year")
+    argument_parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Add every filed letter missing from the search and duplicate indexes and drop letters that no longer exist"
+    )
+    return argument_parser.parse_args()
+
+# ─── Dry-Run Planning ───────────────────────────────────────────────────────
+
+def run_planner(document_processor: DocumentProcessor, arguments: argparse.Namespace) -> None:
+    workflow_planner = WorkflowPlanner(document_processor)
+
+    if arguments.execute_plan:
+        workflow_planner.execute_plan(WorkflowPlan.load(arguments.execute_plan))
+        document_processor.write_run_report()
+        return
+
+    plan = workflow_planner.build_plan()
+    if arguments.diff_plan:
+        added_operations, removed_operations = plan.diff(WorkflowPlan.load(arguments.diff_plan))
+        for planned in added_operations:
+            print(f"+ {planned.describe()}")
+        for planned in removed_operations:
+            print(f"- {planned.describe()}")
+        logging.info("Plan diff - Added: %d, Removed: %d", len(added_operations), len(removed_operations))
+    else:
+        print("\n".join(plan.describe()))
+
+    if arguments.save_plan:
+        plan.save(arguments.save_plan)
+        logging.info("Plan saved to %s", arguments.save_plan)
+
+# ─── Full-Text Search ───────────────────────────────────────────────────────
+
+def run_search(arguments: argparse.Namespace) -> None:
+    search_index = SearchIndex()
+    try:
+        search_hits = search_index.search(arguments.search, arguments.search_recipient, arguments.search_year)
+    finally:
+        search_index.close()
+
+    for search_hit in search_hits:
+        letter_date = format_date(date.fromordinal(search_hit["date_ordinal"])) if search_hit["date_ordinal"] else "Unknown Date"
+        print(f"{letter_date} | {search_hit['recipient'] or 'Unknown'} | {search_hit['path']}")
+        print(f"    {' '.join(search_hit['snippet'].split())}")
+    logging.info("Search returned %d letter(s) for %r", len(search_hits), arguments.search)
+
 # ─── Script Entry Point ─────────────────────────────────────────────────────
 
 def main() -> None:
+    arguments = parse_arguments()
     logging.info("Initializing MDR Letters Processing System")
     
+    if arguments.search:
+        run_search(arguments)
+        return
+
     try:
-        document_processor = DocumentProcessor()
-        document_processor.execute_workflow()
+        document_processor = DocumentProcessor(
+            ingestion_workers=arguments.workers,
+            incremental_sequencing=not arguments.full_resequence,
+            metrics=RunMetrics(profiled_stages=arguments.profile),
+            prometheus_textfile=arguments.prometheus_textfile,
+            rollback_interrupted_renames=arguments.rollback_renames
+        )
+
+        if arguments.watch:
+            from mdr_letters.input_watcher import InputWatcher
+            InputWatcher(document_processor).run()
+        elif arguments.backfill:
+            BackfillRunner(document_processor).run(arguments.backfill)
+        elif arguments.reindex:
+            document_processor.index_filed_letters()
+            document_processor.write_run_report()
+        elif arguments.dry_run or arguments.save_plan or arguments.diff_plan or arguments.execute_plan:
+            run_planner(document_processor, arguments)
+        else:
+            document_processor.execute_workflow()
         
     except Exception as application_error:
         logging.error("Application execution failed", exc_info=True)
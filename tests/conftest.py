@@ -0,0 +1,57 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+from typing import Any, Callable, Iterator, List
+
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import pytest
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+import mdr_letters.document_processor
+import mdr_letters.file_manager
+from mdr_letters.config import DEFAULT_RECIPIENT_RULE, OUTPUT_DIRECTORIES, RECIPIENT_ROUTING_RULES
+from mdr_letters.directory_index import DirectoryIndex
+from mdr_letters.document_processor import DocumentProcessor
+from mdr_letters.fingerprint import FingerprintIndex
+from mdr_letters.metrics import RunMetrics
+from mdr_letters.rename_journal import RenameJournal
+from mdr_letters.search_index import SearchIndex
+
+# ─── Output Directories & Local Data Under tmp_path ──────────────────────────
+
+@pytest.fixture
+def output_directories(tmp_path, monkeypatch) -> Iterator[List[str]]:
+    routing_rules = RECIPIENT_ROUTING_RULES + [DEFAULT_RECIPIENT_RULE]
+    original_directories = list(OUTPUT_DIRECTORIES)
+    original_destinations = [list(routing_rule["destinations"]) for routing_rule in routing_rules]
+    redirected_directories = {
+        output_directory: str(tmp_path / f"output_{directory_index}")
+        for directory_index, output_directory in enumerate(original_directories)
+    }
+
+    OUTPUT_DIRECTORIES[:] = [redirected_directories[output_directory] for output_directory in original_directories]
+    for routing_rule, destination_directories in zip(routing_rules, original_destinations):
+        routing_rule["destinations"][:] = [redirected_directories[destination] for destination in destination_directories]
+    monkeypatch.setattr(mdr_letters.document_processor, "EXTRACTION_CACHE_ENABLED", False)
+    monkeypatch.setattr(mdr_letters.file_manager, "RenameJournal", lambda: RenameJournal(str(tmp_path / "rename_journals")))
+
+    try:
+        yield list(OUTPUT_DIRECTORIES)
+    finally:
+        OUTPUT_DIRECTORIES[:] = original_directories
+        for routing_rule, destination_directories in zip(routing_rules, original_destinations):
+            routing_rule["destinations"][:] = destination_directories
+
+@pytest.fixture
+def make_processor(tmp_path, output_directories) -> Callable[..., DocumentProcessor]:
+    def build_processor(indexed: bool = True, **processor_options: Any) -> DocumentProcessor:
+        return DocumentProcessor(
+            ingestion_workers=1,
+            directory_index=DirectoryIndex(str(tmp_path / "directory_index.sqlite3")),
+            search_index=SearchIndex(str(tmp_path / "search_index.sqlite3")) if indexed else None,
+            fingerprint_index=FingerprintIndex(str(tmp_path / "fingerprint_index.sqlite3")) if indexed else None,
+            metrics=RunMetrics(report_directory=str(tmp_path / "logs")),
+            **processor_options
+        )
+    return build_processor
\ No newline at end of file
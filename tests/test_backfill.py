@@ -0,0 +1,85 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+from typing import List
+
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import fitz
+import pytest
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.backfill import BackfillCheckpoint, BackfillRunner
+from mdr_letters.document_processor import DocumentProcessor
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+LETTER_DATES = ["3 March 2024", "9 April 2024", "15 May 2024"]
+
+def make_source_directory(tmp_path) -> str:
+    source_directory = tmp_path / "archive"
+    source_directory.mkdir()
+    for letter_number, letter_date in enumerate(LETTER_DATES):
+        pdf_document = fitz.open()
+        pdf_document.new_page().insert_text(
+            (72, 72), f"London W6 0XE\n{letter_date}\nLetter number {letter_number} about the lease of the property\n"
+        )
+        pdf_document.save(str(source_directory / f"letter_{letter_number}.pdf"))
+        pdf_document.close()
+    return str(source_directory)
+
+def make_runner(tmp_path, document_processor: DocumentProcessor) -> BackfillRunner:
+    return BackfillRunner(
+        document_processor,
+        staging_directory=str(tmp_path / "backfill_staging"),
+        checkpoint_directory=str(tmp_path / "backfill_checkpoints"),
+        batch_size=1
+    )
+
+def filed_letters(output_directories: List[str]) -> List[str]:
+    year_folder = os.path.join(output_directories[1], "2024")
+    return sorted(os.listdir(year_folder)) if os.path.isdir(year_folder) else []
+
+# ─── Resuming an Interrupted Backfill ────────────────────────────────────────
+
+def test_backfill_resumes_after_interrupted_run(tmp_path, make_processor, output_directories, monkeypatch):
+    source_directory = make_source_directory(tmp_path)
+    interrupted_runner = make_runner(tmp_path, make_processor())
+    process_input_pdfs = interrupted_runner.document_processor.process_input_pdfs
+    filed_batches = []
+
+    def process_then_stop(pdf_file_paths):
+        if filed_batches:
+            raise RuntimeError("Backfill killed")
+        filed_batches.append(pdf_file_paths)
+        return process_input_pdfs(pdf_file_paths)
+
+    monkeypatch.setattr(interrupted_runner.document_processor, "process_input_pdfs", process_then_stop)
+    with pytest.raises(RuntimeError):
+        interrupted_runner.run(source_directory)
+    assert len(filed_letters(output_directories)) == 1
+
+    outcome_counts = make_runner(tmp_path, make_processor()).run(source_directory)
+
+    assert outcome_counts == {"filed": 2, "duplicate": 0, "failed": 0}
+    assert len(filed_letters(output_directories)) == 3
+    assert not os.path.exists(BackfillCheckpoint(source_directory, str(tmp_path / "backfill_checkpoints")).checkpoint_path)
+
+def test_backfill_retries_only_failed_entries(tmp_path, make_processor, output_directories):
+    source_directory = make_source_directory(tmp_path)
+    checkpoint = BackfillCheckpoint(source_directory, str(tmp_path / "backfill_checkpoints"))
+    checkpoint.record_batch({"letter_0.pdf": "filed", "letter_1.pdf": "failed"}, [])
+
+    outcome_counts = make_runner(tmp_path, make_processor()).run(source_directory)
+
+    assert outcome_counts == {"filed": 2, "duplicate": 0, "failed": 0}
+    assert len(filed_letters(output_directories)) == 2
+
+def test_backfill_checkpoint_ignores_torn_last_line(tmp_path):
+    checkpoint = BackfillCheckpoint(str(tmp_path / "archive.zip"), str(tmp_path / "backfill_checkpoints"))
+    checkpoint.record_batch({"a.pdf": "filed"}, ["/letters/2024"])
+    with open(checkpoint.checkpoint_path, 'a', encoding='utf-8') as checkpoint_file:
+        checkpoint_file.write('{"entries": {"b.pdf"')
+
+    assert checkpoint.load() == ({"a.pdf": "filed"}, {"/letters/2024"})
\ No newline at end of file
@@ -0,0 +1,56 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+from datetime import date
+
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import pytest
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.date_engine import find_text_date, format_date, parse_filename_date, parse_filename_date_ordinal
+
+# ─── Bracketed Filename Dates ────────────────────────────────────────────────
+
+@pytest.mark.parametrize("filename, expected_date", [
+    ("Mishcon de Reya — Letter to Kambiz Babaee [03 March 2021].pdf", date(2021, 3, 3)),
+    ("01 Mishcon de Reya — Letter to Kambiz Babaee [03 March 2021].pdf", date(2021, 3, 3)),
+    ("Mishcon de Reya — Letter to Kambiz Babaee [03 March 2021] (1).pdf", date(2021, 3, 3)),
+    ("Letter [3 March 2021].pdf", date(2021, 3, 3)),
+    ("Letter [1st June 2025].pdf", date(2025, 6, 1)),
+    ("Letter [22nd Feb 2024].pdf", date(2024, 2, 22)),
+    ("Letter [3 Sept 2024].pdf", date(2024, 9, 3)),
+    ("Letter [02 Jan. 2023].pdf", date(2023, 1, 2)),
+    ("Letter [02 jan 2023].pdf", date(2023, 1, 2)),
+    ("Letter [ 15 August 2022 ].pdf", date(2022, 8, 15)),
+    ("Letter [29 February 2024].pdf", date(2024, 2, 29)),
+])
+def test_parse_filename_date_accepts_variants(filename, expected_date):
+    assert parse_filename_date(filename) == expected_date
+    assert parse_filename_date_ordinal(filename) == expected_date.toordinal()
+
+@pytest.mark.parametrize("filename", [
+    "Mishcon de Reya — Letter to Kambiz Babaee.pdf",
+    "Letter [Unknown Date].pdf",
+    "Letter [03 March 2021.pdf",
+    "Letter 03 March 2021].pdf",
+    "Letter [31 April 2021].pdf",
+    "Letter [29 February 2023].pdf",
+    "Letter [03 Marchember 2021].pdf",
+    "Letter [03 March 2021 copy].pdf",
+])
+def test_parse_filename_date_rejects_missing_or_invalid_dates(filename):
+    assert parse_filename_date(filename) is None
+    assert parse_filename_date_ordinal(filename) is None
+
+def test_parse_filename_date_round_trips_formatted_dates():
+    letter_date = date(2024, 9, 3)
+    assert parse_filename_date(f"Letter [{format_date(letter_date)}].pdf") == letter_date
+
+# ─── Dates in Document Text ──────────────────────────────────────────────────
+
+def test_find_text_date_skips_matches_that_are_not_dates():
+    assert find_text_date("3 copies 2024 enclosed\nDated 5 April 2024") == date(2024, 4, 5)
+
+def test_find_text_date_returns_none_without_a_date():
+    assert find_text_date("No date on this page") is None
\ No newline at end of file
@@ -0,0 +1,121 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+from typing import List
+
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import fitz
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.document_processor import IngestionSummary
+from mdr_letters.extraction_cache import compute_content_hash
+from mdr_letters.fingerprint import LetterFingerprint
+from mdr_letters.letter import Letter
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+LETTER_BODY = (
+    "Dear Mr Babaee\nWe write further to our letter regarding the lease of the property\n"
+    "and enclose the signed counterpart for your records.\nYours sincerely\n"
+)
+
+def write_letter(pdf_file_path: str, letter_date: str, letter_body: str = LETTER_BODY, exhibit_pages: int = 0) -> str:
+    pdf_document = fitz.open()
+    pdf_document.new_page().insert_text((72, 72), f"Mr K Babaee\nLondon W6 0XE\n{letter_date}\n{letter_body}")
+    for exhibit_number in range(exhibit_pages):
+        pdf_document.new_page().insert_text((72, 72), f"Exhibit {exhibit_number + 1}")
+    pdf_document.save(pdf_file_path)
+    pdf_document.close()
+    return pdf_file_path
+
+def make_input_directory(tmp_path) -> str:
+    input_directory = tmp_path / "input"
+    input_directory.mkdir()
+    return str(input_directory)
+
+def filed_letters(output_directories: List[str], year: str) -> List[str]:
+    year_folder = os.path.join(output_directories[1], year)
+    return sorted(os.listdir(year_folder)) if os.path.isdir(year_folder) else []
+
+# ─── Letter Text Dropped After Analysis ──────────────────────────────────────
+
+def test_analyze_input_batch_keeps_compact_records_only(tmp_path, make_processor):
+    document_processor = make_processor()
+    pdf_file_path = write_letter(os.path.join(make_input_directory(tmp_path), "a.pdf"), "3 March 2024")
+    letter_fingerprints = {}
+
+    letters, _ = document_processor.analyze_input_batch([pdf_file_path], {}, letter_fingerprints, IngestionSummary())
+
+    assert isinstance(letters[pdf_file_path], Letter)
+    assert not hasattr(letters[pdf_file_path], "__dict__")
+    assert isinstance(letter_fingerprints[pdf_file_path], LetterFingerprint)
+    assert document_processor.search_index.has_document(compute_content_hash(pdf_file_path))
+
+def test_analyze_input_batch_stops_early_without_indexes(tmp_path, make_processor):
+    document_processor = make_processor(indexed=False)
+    pdf_file_path = write_letter(os.path.join(make_input_directory(tmp_path), "a.pdf"), "3 March 2024", exhibit_pages=10)
+    letter_fingerprints = {}
+
+    letters, _ = document_processor.analyze_input_batch([pdf_file_path], {}, letter_fingerprints, IngestionSummary())
+
+    assert letters[pdf_file_path].pages_read < 11
+    assert not any(letter_fingerprints.values())
+
+# ─── Duplicate Policies ──────────────────────────────────────────────────────
+
+def file_twice(tmp_path, make_processor, second_date: str = "3 March 2024", **duplicate_policies) -> IngestionSummary:
+    input_directory = make_input_directory(tmp_path)
+    make_processor().process_input_pdfs([write_letter(os.path.join(input_directory, "a.pdf"), "3 March 2024")])
+    second_pdf_file_path = write_letter(os.path.join(input_directory, "b.pdf"), second_date, LETTER_BODY.replace(" ", "  "))
+    return make_processor(**duplicate_policies).process_input_pdfs([second_pdf_file_path])
+
+def test_skip_policy_leaves_resent_letter_in_input(tmp_path, make_processor, output_directories):
+    summary = file_twice(tmp_path, make_processor)
+
+    assert len(summary.duplicates) == 1
+    assert summary.processed == []
+    assert compute_content_hash(summary.duplicates[0][0]) != compute_content_hash(summary.duplicates[0][1])
+    assert os.path.exists(summary.duplicates[0][0])
+    assert len(filed_letters(output_directories, "2024")) == 1
+
+def test_replace_policy_swaps_filed_letter(tmp_path, make_processor, output_directories):
+    summary = file_twice(tmp_path, make_processor, exact_duplicate_policy="replace")
+
+    assert len(summary.replaced) == 1
+    assert not os.path.exists(summary.replaced[0][1])
+    assert len(filed_letters(output_directories, "2024")) == 1
+
+def test_keep_policy_files_resent_letter_alongside(tmp_path, make_processor, output_directories):
+    summary = file_twice(tmp_path, make_processor, exact_duplicate_policy="keep")
+
+    assert len(summary.kept_duplicates) == 1
+    assert len(filed_letters(output_directories, "2024")) == 2
+
+def test_same_text_with_new_date_is_not_a_duplicate(tmp_path, make_processor, output_directories):
+    summary = file_twice(tmp_path, make_processor, second_date="3 April 2024")
+
+    assert summary.duplicates == []
+    assert len(summary.processed) == 1
+    assert len(filed_letters(output_directories, "2024")) == 2
+
+# ─── Search Index Follows Renames ────────────────────────────────────────────
+
+def test_search_finds_letters_under_their_sequenced_names(tmp_path, make_processor, output_directories):
+    input_directory = make_input_directory(tmp_path)
+    document_processor = make_processor()
+    document_processor.process_input_pdfs([
+        write_letter(os.path.join(input_directory, "later.pdf"), "9 March 2024", "Regarding the walrus enclosure"),
+        write_letter(os.path.join(input_directory, "earlier.pdf"), "3 March 2024", "Regarding the narwhal enclosure")
+    ])
+
+    year_folder = os.path.join(output_directories[1], "2024")
+    document_processor.organize_folders([year_folder])
+
+    assert filed_letters(output_directories, "2024")[0].startswith("01 ")
+    for search_term in ("walrus", "narwhal"):
+        search_hits = document_processor.search_index.search(search_term)
+        assert len(search_hits) == 1
+        assert os.path.exists(search_hits[0]["path"])
+        assert os.path.dirname(search_hits[0]["path"]) == year_folder
\ No newline at end of file
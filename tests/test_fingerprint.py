@@ -0,0 +1,76 @@
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.config import FINGERPRINT_SHINGLE_WORDS
+from mdr_letters.fingerprint import FingerprintIndex, FingerprintPartition, fingerprint_text
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+LETTER_TEXT = (
+    "Dear Mr Babaee, we write further to our letter regarding the lease of the property "
+    "and enclose the signed counterpart for your records. Please contact us if you have "
+    "any questions about the enclosed documents or the completion timetable. Yours sincerely"
+)
+
+def make_index(tmp_path) -> FingerprintIndex:
+    return FingerprintIndex(str(tmp_path / "fingerprint_index.sqlite3"))
+
+# ─── Fingerprinting Letter Text ──────────────────────────────────────────────
+
+def test_fingerprint_text_skips_letters_without_enough_words():
+    assert fingerprint_text("") is None
+    assert fingerprint_text(" \n\x0c\n") is None
+    assert fingerprint_text(" ".join(["word"] * (FINGERPRINT_SHINGLE_WORDS - 1))) is None
+    assert fingerprint_text(" ".join(["word"] * FINGERPRINT_SHINGLE_WORDS)) is not None
+
+def test_fingerprint_text_ignores_case_and_layout():
+    assert fingerprint_text(LETTER_TEXT).text_hash == fingerprint_text(LETTER_TEXT.upper().replace(" ", "\n")).text_hash
+
+# ─── Exact & Near-Duplicate Lookup ───────────────────────────────────────────
+
+def test_find_duplicate_matches_identical_text_with_same_date(tmp_path):
+    fingerprint_index = make_index(tmp_path)
+    fingerprint_index.add(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000)
+
+    duplicate_match = fingerprint_index.find_duplicate(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000)
+
+    assert duplicate_match is not None
+    assert duplicate_match.exact
+
+def test_find_duplicate_ignores_identical_text_with_different_date(tmp_path):
+    fingerprint_index = make_index(tmp_path)
+    fingerprint_index.add(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000)
+
+    assert fingerprint_index.find_duplicate(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739031) is None
+
+def test_find_duplicate_matches_near_text_with_same_date(tmp_path):
+    fingerprint_index = make_index(tmp_path)
+    fingerprint_index.add(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000)
+
+    duplicate_match = fingerprint_index.find_duplicate(
+        fingerprint_text(LETTER_TEXT + " Enc."), "Kambiz Babaee", "2024", 739000
+    )
+
+    assert duplicate_match is not None
+    assert not duplicate_match.exact
+
+def test_find_duplicate_is_partitioned_by_recipient_and_year(tmp_path):
+    fingerprint_index = make_index(tmp_path)
+    fingerprint_index.add(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000)
+
+    assert fingerprint_index.find_duplicate(fingerprint_text(LETTER_TEXT), "Bhupen Babaee", "2024", 739000) is None
+    assert fingerprint_index.find_duplicate(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2025", 739000) is None
+
+def test_find_duplicate_reads_fingerprints_back_from_disk(tmp_path):
+    fingerprint_index = make_index(tmp_path)
+    fingerprint_index.add(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000)
+    fingerprint_index.close()
+
+    assert make_index(tmp_path).find_duplicate(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000).exact
+
+def test_find_in_partition_matches_letters_not_yet_recorded(tmp_path):
+    fingerprint_index = make_index(tmp_path)
+    planned_partition = FingerprintPartition()
+    planned_partition.add(fingerprint_text(LETTER_TEXT), 739000)
+
+    assert fingerprint_index.find_in_partition(fingerprint_text(LETTER_TEXT), planned_partition, 739000).exact
+    assert fingerprint_index.find_duplicate(fingerprint_text(LETTER_TEXT), "Kambiz Babaee", "2024", 739000) is None
\ No newline at end of file
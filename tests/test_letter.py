@@ -0,0 +1,48 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+from datetime import date
+
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import pytest
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.config import KAMBIZ_DIRECTORY, BHUPEN_DIRECTORY
+from mdr_letters.date_engine import format_date
+from mdr_letters.letter import DEFAULT_RECIPIENT_ID, Letter, destination_ids_for
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+LETTER_DATE = date(2024, 3, 3)
+
+def make_letter(recipient_id: int, date_ordinal=LETTER_DATE.toordinal()) -> Letter:
+    return Letter("in/letter.pdf", 1024, "abc123", date_ordinal, recipient_id, destination_ids_for(recipient_id), pages_read=1)
+
+# ─── Compact Letter Record ───────────────────────────────────────────────────
+
+def test_letter_has_no_instance_dict():
+    letter = make_letter(2)
+
+    assert not hasattr(letter, "__dict__")
+    with pytest.raises(AttributeError):
+        letter.document_text = "Dear Mr Babaee"
+
+def test_letter_resolves_ids_to_names():
+    letter = make_letter(1)
+
+    assert letter.recipient_name == "Kambiz Babaee & Bhupen Varsani"
+    assert letter.destination_directories == [BHUPEN_DIRECTORY, KAMBIZ_DIRECTORY]
+    assert letter.formatted_date == format_date(LETTER_DATE)
+    assert letter.year == "2024"
+
+def test_letter_without_date_files_under_unknown():
+    letter = make_letter(DEFAULT_RECIPIENT_ID, date_ordinal=None)
+
+    assert letter.recipient_name == "Kambiz Babaee"
+    assert letter.destination_directories == [KAMBIZ_DIRECTORY]
+    assert letter.formatted_date == "Unknown Date"
+    assert letter.year == "Unknown"
+
+def test_analysis_fields_hold_ids_only():
+    assert make_letter(2).analysis_fields() == [2, list(destination_ids_for(2)), LETTER_DATE.toordinal()]
\ No newline at end of file
@@ -0,0 +1,64 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import fitz
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.directory_index import DirectoryIndex
+from mdr_letters.pdf_utils import PDFUtils
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+def write_pdf(pdf_file_path: str, title: str) -> None:
+    pdf_document = fitz.open()
+    pdf_document.new_page().insert_text((72, 72), "London W6 0XE\n3 March 2024\n")
+    pdf_document.set_metadata({"title": title, "author": "Scanner"})
+    pdf_document.save(pdf_file_path)
+    pdf_document.close()
+
+def make_output_directory(tmp_path) -> str:
+    folder_path = tmp_path / "Kambiz" / "2024"
+    folder_path.mkdir(parents=True)
+    write_pdf(str(folder_path / "01 Letter [03 March 2024].pdf"), "Draft")
+    return str(tmp_path / "Kambiz")
+
+def nonzero_counts(metadata_counts):
+    return {status: count for status, count in metadata_counts.items() if count}
+
+# ─── Metadata Pass Against the Directory Index ───────────────────────────────
+
+def test_update_pdf_metadata_skips_files_cleaned_on_a_previous_run(tmp_path):
+    output_directory = make_output_directory(tmp_path)
+    directory_index = DirectoryIndex(str(tmp_path / "directory_index.sqlite3"))
+    pdf_utils = PDFUtils(directory_index=directory_index)
+
+    directory_index.refresh(output_directory)
+    assert nonzero_counts(pdf_utils.update_pdf_metadata(output_directory)) == {"rewritten": 1}
+
+    directory_index.refresh(output_directory)
+    assert nonzero_counts(pdf_utils.update_pdf_metadata(output_directory)) == {"skipped": 1}
+
+def test_update_pdf_metadata_rechecks_file_rewritten_in_place(tmp_path):
+    output_directory = make_output_directory(tmp_path)
+    folder_path = os.path.join(output_directory, "2024")
+    pdf_file_path = os.path.join(folder_path, "01 Letter [03 March 2024].pdf")
+    directory_index = DirectoryIndex(str(tmp_path / "directory_index.sqlite3"))
+    pdf_utils = PDFUtils(directory_index=directory_index)
+    directory_index.refresh(output_directory)
+    pdf_utils.update_pdf_metadata(output_directory)
+    directory_index.refresh(output_directory)
+
+    folder_stat = os.stat(folder_path)
+    write_pdf(pdf_file_path, "Rescanned")
+    file_stat = os.stat(pdf_file_path)
+    os.utime(pdf_file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+    os.utime(folder_path, ns=(folder_stat.st_atime_ns, folder_stat.st_mtime_ns))
+    directory_index.refresh(output_directory)
+
+    assert nonzero_counts(pdf_utils.update_pdf_metadata(output_directory)) == {"rewritten": 1}
+    with fitz.open(pdf_file_path) as pdf_document:
+        assert pdf_document.metadata["title"] == ""
\ No newline at end of file
@@ -0,0 +1,83 @@
+# ─── Third-Party Imports ────────────────────────────────────────────────────
+
+import pytest
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.config import ADDRESSEE_PAGES
+from mdr_letters.letter import DEFAULT_RECIPIENT_ID, routing_rule_for
+from mdr_letters.recipient_detector import RecipientDetector
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+EXHIBIT_PAGES = ["Exhibit page with no address\n"] * 20
+
+def recipient_for(recipient_id: int) -> str:
+    return routing_rule_for(recipient_id)["recipient"]
+
+# ─── Routing Rule Matching ───────────────────────────────────────────────────
+
+@pytest.mark.parametrize("document_text, expected_recipient", [
+    ("London W6 0XE", "Kambiz Babaee"),
+    ("Wembley HA0 2NJ", "Bhupen Varsani"),
+    ("London W6 0XE\nWembley HA0 2NJ", "Kambiz Babaee & Bhupen Varsani"),
+    ("W6 0XE HA0 2NJ M20 6RE", "All Defendants"),
+    ("Manchester M20 6RE", "Fortis Insolvency"),
+    ("London EC4A 1NL", "London Circuit Commercial Court"),
+    ("London EC2V 7HN", "Lloyds Banking Group"),
+    ("London ec2v\n7hn", "Lloyds Banking Group"),
+    ("No postcode at all", "Kambiz Babaee"),
+])
+def test_determine_recipient_follows_rule_priority(document_text, expected_recipient):
+    assert recipient_for(RecipientDetector().determine_recipient_id(document_text)) == expected_recipient
+
+def test_match_routing_rule_falls_back_to_default():
+    assert RecipientDetector().match_routing_rule(set()) == DEFAULT_RECIPIENT_ID
+
+def test_postcode_inside_longer_token_is_ignored():
+    assert RecipientDetector().determine_recipient_id("Ref XW6 0XE1") == DEFAULT_RECIPIENT_ID
+
+# ─── Page-by-Page Analysis ───────────────────────────────────────────────────
+
+def test_analyze_pages_stops_after_letterhead_for_single_recipient():
+    detector = RecipientDetector()
+    page_texts = ["Lloyds Banking Group\nLondon EC2V 7HN\n3 March 2024\n"] + EXHIBIT_PAGES
+
+    recipient_id, date_ordinal, document_text, pages_read = detector.analyze_pages(iter(page_texts))
+
+    assert pages_read == 1
+    assert recipient_for(recipient_id) == "Lloyds Banking Group"
+    assert date_ordinal is not None
+    assert document_text == page_texts[0]
+
+def test_analyze_pages_stops_after_addressee_pages_when_joint_rule_is_possible():
+    page_texts = ["London W6 0XE\n3 March 2024\n"] + EXHIBIT_PAGES
+
+    recipient_id, _, _, pages_read = RecipientDetector().analyze_pages(iter(page_texts))
+
+    assert pages_read == ADDRESSEE_PAGES
+    assert recipient_for(recipient_id) == "Kambiz Babaee"
+
+def test_analyze_pages_finds_joint_recipient_on_later_page():
+    page_texts = ["London W6 0XE\n3 March 2024\n", "cc: Wembley HA0 2NJ\n"] + EXHIBIT_PAGES
+
+    recipient_id, _, _, pages_read = RecipientDetector().analyze_pages(iter(page_texts))
+
+    assert recipient_for(recipient_id) == "Kambiz Babaee & Bhupen Varsani"
+    assert pages_read == 2
+
+def test_analyze_pages_reads_on_until_date_is_found():
+    page_texts = ["Lloyds Banking Group\nLondon EC2V 7HN\n", "Dated 5 April 2024\n"] + EXHIBIT_PAGES
+
+    _, date_ordinal, _, pages_read = RecipientDetector().analyze_pages(iter(page_texts))
+
+    assert pages_read == 2
+    assert date_ordinal is not None
+
+def test_analyze_pages_reads_every_page_without_a_postcode():
+    page_texts = ["3 March 2024\n"] + EXHIBIT_PAGES
+
+    recipient_id, _, _, pages_read = RecipientDetector().analyze_pages(iter(page_texts))
+
+    assert pages_read == len(page_texts)
+    assert recipient_id == DEFAULT_RECIPIENT_ID
\ No newline at end of file
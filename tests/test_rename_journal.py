@@ -0,0 +1,161 @@
+# ─── Python Standard Library ────────────────────────────────────────────────
+
+import os
+from typing import Dict, List, Tuple
+
+# ─── Local Application Imports ──────────────────────────────────────────────
+
+from mdr_letters.config import TEMP_FILE_PREFIX
+from mdr_letters.file_manager import FileManager
+from mdr_letters.rename_journal import RenameJournal
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+def write_files(directory: str, file_contents: Dict[str, str]) -> None:
+    for filename, content in file_contents.items():
+        with open(os.path.join(directory, filename), 'w', encoding='utf-8') as test_file:
+            test_file.write(content)
+
+def read_files(directory: str) -> Dict[str, str]:
+    file_contents = {}
+    for filename in os.listdir(directory):
+        with open(os.path.join(directory, filename), 'r', encoding='utf-8') as test_file:
+            file_contents[filename] = test_file.read()
+    return file_contents
+
+def simulate_steps(file_contents: Dict[str, str], rename_steps: List[Tuple[str, str]]) -> Dict[str, str]:
+    renamed_contents = dict(file_contents)
+    for old_filename, new_filename in rename_steps:
+        assert old_filename in renamed_contents
+        assert new_filename not in renamed_contents
+        renamed_contents[new_filename] = renamed_contents.pop(old_filename)
+    return renamed_contents
+
+def make_folder(tmp_path) -> Tuple[str, RenameJournal]:
+    directory = tmp_path / "2024"
+    directory.mkdir()
+    return str(directory), RenameJournal(str(tmp_path / "rename_journals"))
+
+# ─── Rename Ordering & Cycle Breaking ────────────────────────────────────────
+
+def test_order_rename_steps_swaps_two_files(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    file_manager = FileManager(rename_journal=rename_journal)
+
+    rename_steps = file_manager.order_rename_steps(directory, {"a.pdf": "b.pdf", "b.pdf": "a.pdf"})
+
+    assert len(rename_steps) == 3
+    assert rename_steps[0][1].startswith(TEMP_FILE_PREFIX)
+    assert simulate_steps({"a.pdf": "A", "b.pdf": "B"}, rename_steps) == {"a.pdf": "B", "b.pdf": "A"}
+
+def test_order_rename_steps_breaks_three_cycle(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    file_manager = FileManager(rename_journal=rename_journal)
+    rename_plan = {"01 x.pdf": "02 x.pdf", "02 x.pdf": "03 x.pdf", "03 x.pdf": "01 x.pdf"}
+
+    rename_steps = file_manager.order_rename_steps(directory, rename_plan)
+
+    assert len(rename_steps) == 4
+    assert simulate_steps({"01 x.pdf": "1", "02 x.pdf": "2", "03 x.pdf": "3"}, rename_steps) == {
+        "02 x.pdf": "1", "03 x.pdf": "2", "01 x.pdf": "3"
+    }
+
+def test_order_rename_steps_runs_chains_before_breaking_cycles(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    file_manager = FileManager(rename_journal=rename_journal)
+    rename_plan = {"c.pdf": "d.pdf", "b.pdf": "c.pdf", "x.pdf": "y.pdf", "y.pdf": "x.pdf"}
+
+    rename_steps = file_manager.order_rename_steps(directory, rename_plan)
+
+    assert rename_steps[:2] == [("c.pdf", "d.pdf"), ("b.pdf", "c.pdf")]
+    assert simulate_steps({"b.pdf": "B", "c.pdf": "C", "x.pdf": "X", "y.pdf": "Y"}, rename_steps) == {
+        "c.pdf": "B", "d.pdf": "C", "x.pdf": "Y", "y.pdf": "X"
+    }
+
+def test_order_rename_steps_avoids_existing_temporary_name(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    write_files(directory, {"a.pdf": "A", "b.pdf": "B", f"{TEMP_FILE_PREFIX}a.pdf": "stray"})
+    file_manager = FileManager(rename_journal=rename_journal)
+
+    rename_steps = file_manager.order_rename_steps(directory, {"a.pdf": "b.pdf", "b.pdf": "a.pdf"})
+
+    assert rename_steps[0] == ("a.pdf", f"{TEMP_FILE_PREFIX}a (1).pdf")
+
+def test_apply_rename_plan_swaps_files_and_clears_journal(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    write_files(directory, {"a.pdf": "A", "b.pdf": "B"})
+    file_manager = FileManager(rename_journal=rename_journal)
+
+    completed, completed_renames = file_manager.apply_rename_plan(directory, {"a.pdf": "b.pdf", "b.pdf": "a.pdf"})
+
+    assert completed
+    assert len(completed_renames) == 3
+    assert read_files(directory) == {"a.pdf": "B", "b.pdf": "A"}
+    assert not rename_journal.has_pending(directory)
+
+# ─── Recovery from a Partial Journal ─────────────────────────────────────────
+
+SWAP_STEPS = [("a.pdf", f"{TEMP_FILE_PREFIX}a.pdf"), ("b.pdf", "a.pdf"), (f"{TEMP_FILE_PREFIX}a.pdf", "b.pdf")]
+
+def interrupt_after_rename(directory: str, rename_journal: RenameJournal, renamed_steps: int, marked_steps: int) -> str:
+    write_files(directory, {"a.pdf": "A", "b.pdf": "B"})
+    rename_journal.begin(directory, SWAP_STEPS)
+    for step_index, (old_filename, new_filename) in enumerate(SWAP_STEPS[:renamed_steps]):
+        os.rename(os.path.join(directory, old_filename), os.path.join(directory, new_filename))
+        if step_index < marked_steps:
+            rename_journal.mark_done(directory, step_index)
+    rename_journal.finish(directory, completed=False)
+    return rename_journal.journal_path(directory)
+
+def test_read_counts_completed_steps(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    journal_path = interrupt_after_rename(directory, rename_journal, renamed_steps=1, marked_steps=1)
+
+    assert rename_journal.pending_journal_paths() == [journal_path]
+    assert rename_journal.read(journal_path) == (directory, SWAP_STEPS, 1)
+
+def test_replay_finishes_partial_journal(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    journal_path = interrupt_after_rename(directory, rename_journal, renamed_steps=1, marked_steps=1)
+
+    assert RenameJournal(rename_journal.journal_directory).recover(journal_path) == directory
+    assert read_files(directory) == {"a.pdf": "B", "b.pdf": "A"}
+    assert not os.path.exists(journal_path)
+
+def test_replay_skips_step_renamed_but_not_marked(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    journal_path = interrupt_after_rename(directory, rename_journal, renamed_steps=2, marked_steps=1)
+
+    assert rename_journal.recover(journal_path) == directory
+    assert read_files(directory) == {"a.pdf": "B", "b.pdf": "A"}
+
+def test_roll_back_restores_original_names(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    journal_path = interrupt_after_rename(directory, rename_journal, renamed_steps=1, marked_steps=1)
+
+    assert rename_journal.recover(journal_path, roll_back=True) == directory
+    assert read_files(directory) == {"a.pdf": "A", "b.pdf": "B"}
+    assert not os.path.exists(journal_path)
+
+def test_roll_back_undoes_step_renamed_but_not_marked(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    journal_path = interrupt_after_rename(directory, rename_journal, renamed_steps=2, marked_steps=1)
+
+    assert rename_journal.roll_back(directory, SWAP_STEPS, 1)
+    assert read_files(directory) == {"a.pdf": "A", "b.pdf": "B"}
+    assert os.path.exists(journal_path)
+
+def test_recover_keeps_journal_on_conflict(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    journal_path = interrupt_after_rename(directory, rename_journal, renamed_steps=1, marked_steps=1)
+    write_files(directory, {"a.pdf": "unexpected"})
+
+    assert rename_journal.recover(journal_path) is None
+    assert os.path.exists(journal_path)
+
+def test_recover_all_returns_recovered_folders(tmp_path):
+    directory, rename_journal = make_folder(tmp_path)
+    interrupt_after_rename(directory, rename_journal, renamed_steps=1, marked_steps=1)
+
+    assert rename_journal.recover_all() == [directory]
+    assert rename_journal.pending_journal_paths() == []
\ No newline at end of file